@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`backends`
+================================================================================
+
+Output backends that move the packed frame into the PIO state machine.
+
+A backend creates the state machine with :meth:`begin`, sends a packed frame
+with :meth:`transmit` and reports with :meth:`busy` / :meth:`wait` whether the
+previous frame is still going out on the wire. A frame can also be pushed
+word by word with :meth:`put`, ended by :meth:`latch`.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+try:
+    from machine import Pin
+    from time import ticks_us, ticks_diff, ticks_add
+    import rp2
+except ImportError:
+    # Running on a host computer, use the recording stand-ins
+    from simulator import Pin, ticks_us, ticks_diff, ticks_add
+    import simulator as rp2
+
+# Wire time of one bit at 800 kHz, of one FIFO word holding a byte, and the
+# low time that latches a frame
+BIT_NS = 1_250
+WORD_NS = 8 * BIT_NS
+RESET_US = 300
+
+# Two PIO blocks with four state machines each
+STATE_MACHINES = 8
+
+_PIO_BASE = (0x50200000, 0x50300000)
+_TXF_OFFSET = 0x010
+_DREQ_PIO_TX = (0, 8)
+
+_claimed = set()
+
+
+def claim_state_machine(state_machine: int = None) -> int:
+    """
+    Reserve a PIO state machine so two outputs never share one.
+    :param int state_machine: the state machine number (0-7). Default is None,
+     the first free one
+    :return: the state machine number
+    :raises ValueError: if the state machine is already in use
+    :raises RuntimeError: if all the state machines are in use
+    """
+    if state_machine is None:
+        for candidate in range(STATE_MACHINES):
+            if candidate not in _claimed:
+                state_machine = candidate
+                break
+        else:
+            raise RuntimeError("All the PIO state machines are in use")
+    elif state_machine in _claimed:
+        raise ValueError("State machine %d is already in use" % state_machine)
+    _claimed.add(state_machine)
+    return state_machine
+
+
+def release_state_machine(state_machine: int) -> None:
+    """
+    Give back a state machine reserved with :func:`claim_state_machine`.
+    :param int state_machine: the state machine number (0-7)
+    :return: None
+    """
+    _claimed.discard(state_machine)
+
+
+class PIOBackend:
+    """
+    Blocking output, the CPU pushes the frame into the TX FIFO.
+    :param int state_machine: the state machine number (0-7). Default is None,
+     the first free one when :meth:`begin` is called
+    """
+
+    asynchronous = False
+
+    def __init__(self, state_machine: int = None) -> None:
+        self.state_machine = state_machine
+        self.sm = None
+
+    def begin(self, program, freq: int, **pins) -> None:
+        """
+        Create and start the state machine.
+        :param program: the PIO program
+        :param int freq: the state machine frequency
+        :param pins: the pin settings of the state machine, for example
+         ``sideset_base=15``
+        :return: None
+        """
+        self.state_machine = claim_state_machine(self.state_machine)
+        for name in pins:
+            pins[name] = Pin(pins[name])
+        self.sm = rp2.StateMachine(
+            self.state_machine, program, freq=freq, **pins
+        )
+        self.sm.active(1)
+
+    def transmit(self, wire) -> None:
+        """
+        Send a packed frame, one byte per FIFO word.
+        :param bytearray wire: the packed frame
+        :return: None
+        """
+        self.sm.put(wire, 24)
+
+    def put(self, word: int) -> None:
+        """
+        Push one word of a frame sent word by word.
+        :param int word: the word, one byte of the frame
+        :return: None
+        """
+        self.sm.put(word, 24)
+
+    def latch(self) -> None:
+        """
+        End a frame sent word by word. The strip latches it once the line
+        stays low, so there is nothing to do.
+        :return: None
+        """
+        return
+
+    def busy(self) -> bool:
+        """
+        Tell if the previous frame is still being sent.
+        :return: always False, :meth:`transmit` returns once the frame is out
+        """
+        return False
+
+    def wait(self) -> None:
+        """
+        Wait until the previous frame has been sent.
+        :return: None
+        """
+        return
+
+    def close(self) -> None:
+        """
+        Stop the state machine and release it.
+        :return: None
+        """
+        if self.sm is not None:
+            self.sm.active(0)
+            self.sm = None
+            release_state_machine(self.state_machine)
+
+
+class DMABackend(PIOBackend):
+    """
+    Non blocking output, a DMA channel feeds the TX FIFO while the CPU keeps
+    working. :meth:`transmit` returns at once, :meth:`busy` stays True until
+    the frame and the reset latch are over.
+    :param int state_machine: the state machine number (0-7). Default is None,
+     the first free one when :meth:`begin` is called
+    :param int word_ns: wire time of one FIFO word in nanoseconds. Default is
+     the time of one byte
+    """
+
+    asynchronous = True
+
+    def __init__(self, state_machine: int = None, word_ns: int = WORD_NS):
+        super().__init__(state_machine)
+        self.word_ns = word_ns
+        self.dma = None
+        self._ctrl = None
+        self._done_at = ticks_us()
+
+    def begin(self, program, freq: int, **pins) -> None:
+        """
+        Create and start the state machine and claim a DMA channel.
+        :param program: the PIO program
+        :param int freq: the state machine frequency
+        :param pins: the pin settings of the state machine
+        :return: None
+        """
+        super().begin(program, freq, **pins)
+        block = self.state_machine // 4
+        index = self.state_machine % 4
+        self._txf = _PIO_BASE[block] + _TXF_OFFSET + 4 * index
+        self.dma = rp2.DMA()
+        # Byte transfers, the bus copies the byte to every lane of the FIFO
+        # word so the state machine finds it in the top byte.
+        self._ctrl = self.dma.pack_ctrl(
+            size=0,
+            inc_read=True,
+            inc_write=False,
+            treq_sel=_DREQ_PIO_TX[block] + index,
+        )
+
+    def transmit(self, wire) -> None:
+        """
+        Start sending a packed frame and return at once. The buffer must not
+        be modified until :meth:`busy` returns False.
+        :param bytearray wire: the packed frame
+        :return: None
+        """
+        self.wait()
+        self.dma.config(
+            read=wire,
+            write=self._txf,
+            count=len(wire),
+            ctrl=self._ctrl,
+            trigger=True,
+        )
+        wire_us = len(wire) * self.word_ns // 1000
+        self._done_at = ticks_add(ticks_us(), wire_us + RESET_US)
+
+    def latch(self) -> None:
+        """
+        End a frame sent word by word: the last words still in the TX FIFO
+        and the reset latch keep :meth:`busy` True.
+        :return: None
+        """
+        self._done_at = ticks_add(
+            ticks_us(), 4 * self.word_ns // 1000 + RESET_US
+        )
+
+    def busy(self) -> bool:
+        """
+        Tell if the previous frame is still being sent.
+        :return: True until the frame and the reset latch are over
+        """
+        return self.dma.active() or ticks_diff(self._done_at, ticks_us()) > 0
+
+    def wait(self) -> None:
+        """
+        Wait until the previous frame has been sent.
+        :return: None
+        """
+        while self.busy():
+            pass
+
+    def close(self) -> None:
+        """
+        Release the DMA channel and stop the state machine.
+        :return: None
+        """
+        if self.dma is not None:
+            self.wait()
+            self.dma.close()
+            self.dma = None
+        super().close()
@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`clock`
+================================================================================
+
+Deadline based frame clock used to pace the effects.
+
+Instead of sleeping a fixed time after each frame, the clock keeps the time
+the next frame is due. :meth:`FrameClock.tick` only sleeps for what is left of
+the frame period once the frame has been rendered and sent, so the frame rate
+does not change with the length of the strip. When a frame takes longer than
+the period the clock does not sleep, and reports how many frames were dropped
+so the effect can move its animation ahead by the same amount.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+try:
+    from time import ticks_ms, ticks_us, ticks_diff, ticks_add, sleep_us
+except ImportError:
+    # Running on a host computer
+    from simulator import ticks_ms, ticks_us, ticks_diff, ticks_add, sleep_us
+
+
+class FrameClock:
+    """
+    Keep an effect at a steady frame rate for a given time.
+    :param float period: time between two frames in seconds. Default is 0,
+     as fast as possible
+    :param float duration: how long the effect runs in seconds. Default is
+     None, forever
+    :param stats: a :class:`framestats.FrameStats` told about the time
+     slept. Default is None
+    """
+
+    def __init__(
+        self, period: float = 0.0, duration: float = None, stats=None
+    ) -> None:
+        self.period_us = int(period * 1_000_000)
+        self.stats = stats
+        self.duration_ms = None if duration is None else int(duration * 1000)
+        self.frames = 0
+        self.dropped = 0
+        self.last_sleep_us = 0
+        self.start()
+
+    def start(self) -> None:
+        """
+        Start counting the duration and the frame deadlines from now.
+        :return: None
+        """
+        self.frames = 0
+        self.dropped = 0
+        self._start = ticks_ms()
+        self._deadline = ticks_us()
+
+    @property
+    def fps(self) -> float:
+        """
+        Target frame rate, 0 when running as fast as possible.
+        """
+        if self.period_us <= 0:
+            return 0.0
+        return 1_000_000 / self.period_us
+
+    @fps.setter
+    def fps(self, value: float) -> None:
+        self.period_us = int(1_000_000 / value) if value > 0 else 0
+
+    @property
+    def elapsed_ms(self) -> int:
+        """
+        Milliseconds since the clock started.
+        """
+        return ticks_diff(ticks_ms(), self._start)
+
+    @property
+    def remaining_ms(self) -> int:
+        """
+        Milliseconds left before the duration is over, None without duration.
+        """
+        if self.duration_ms is None:
+            return None
+        return max(0, self.duration_ms - self.elapsed_ms)
+
+    def running(self) -> bool:
+        """
+        Tell if the duration is not over yet.
+        :return: True while the effect should keep running
+        """
+        if self.duration_ms is None:
+            return True
+        return self.elapsed_ms < self.duration_ms
+
+    def tick(self, period: float = None) -> int:
+        """
+        Wait until the next frame is due. Call it once the frame has been
+        sent. If the frame is late no time is spent sleeping, and the frames
+        that could not be shown in time are dropped.
+        :param float period: time until the next frame in seconds, for this
+         frame only. Default is None, the clock period
+        :return: the number of frame periods the animation should move ahead,
+         1 unless frames were dropped
+        """
+        steps = self.advance(period)
+        if self.last_sleep_us:
+            sleep_us(self.last_sleep_us)
+        return steps
+
+    def advance(self, period: float = None) -> int:
+        """
+        Move to the next frame deadline without sleeping, for callers that
+        wait in their own way, like an event loop. :attr:`last_sleep_us` is
+        the time left until the deadline.
+        :param float period: time until the next frame in seconds, for this
+         frame only. Default is None, the clock period
+        :return: the number of frame periods the animation should move ahead,
+         1 unless frames were dropped
+        """
+        if period is None:
+            period_us = self.period_us
+        else:
+            period_us = int(period * 1_000_000)
+        self.frames += 1
+        self.last_sleep_us = 0
+        if period_us <= 0:
+            self._deadline = ticks_us()
+            return 1
+
+        self._deadline = ticks_add(self._deadline, period_us)
+        late = ticks_diff(ticks_us(), self._deadline)
+        if late < 0:
+            wait = -late
+            if self.duration_ms is not None:
+                # Do not sleep past the end of the effect
+                wait = min(wait, self.remaining_ms * 1000)
+            self.last_sleep_us = wait
+            if self.stats is not None:
+                self.stats.slept(wait)
+            return 1
+
+        # Behind schedule, skip the frames already due and keep the deadlines
+        # on the same grid so the frame rate catches up
+        skipped = late // period_us
+        self.dropped += skipped
+        self._deadline = ticks_add(self._deadline, skipped * period_us)
+        return 1 + skipped
@@ -0,0 +1,215 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`compositor`
+================================================================================
+
+Stack several effects on one strip.
+
+Every layer is an effect drawing into its own :class:`pixelbuffer.PixelBuffer`.
+The layers are merged into the strip from the bottom one up, each with an
+opacity and a blend mode, with integer math only:
+
+* ``"alpha"``: the layer covers the ones below, by its opacity
+* ``"add"``: the layer light is added to the one below
+* ``"max"``: the brightest channel wins
+* ``"multiply"``: the layer darkens the ones below, white keeps them
+
+Only the pixels changed in some layer since the last frame are merged again,
+and when no layer changed the strip is not touched, so ``show`` skips the
+frame.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+from pixelbuffer import PixelBuffer
+from producers import Effect
+
+MODES = ("alpha", "add", "max", "multiply")
+
+
+class Layer:
+    """
+    An effect drawn above the layers added before it.
+    :param effect: the frame producer
+    :param str mode: the blend mode, one of :data:`MODES`. Default is "alpha"
+    :param int opacity: the opacity (0-255). Default is 255
+    :raises ValueError: if the mode is not one of :data:`MODES`
+    """
+
+    def __init__(self, effect, mode: str = "alpha", opacity: int = 255):
+        self.buffer = None
+        self.effect = effect
+        self.mode = mode
+        self.opacity = opacity
+
+    @property
+    def mode(self) -> str:
+        """
+        The blend mode, one of :data:`MODES`.
+        """
+        return self._mode
+
+    @mode.setter
+    def mode(self, value: str) -> None:
+        if value not in MODES:
+            raise ValueError("Invalid blend mode %s" % value)
+        self._mode = value
+        if self.buffer is not None:
+            # The whole layer has to be merged again
+            self.buffer.mark_dirty()
+
+    @property
+    def opacity(self) -> int:
+        """
+        The opacity of the layer (0-255).
+        """
+        return self._opacity
+
+    @opacity.setter
+    def opacity(self, value: int) -> None:
+        self._opacity = value
+        if self.buffer is not None:
+            # The whole layer has to be merged again
+            self.buffer.mark_dirty()
+
+
+class Compositor(Effect):
+    """
+    A frame producer merging the frames of several layers.
+    :param float period: time between frames. Default is 0.02 seconds
+    """
+
+    def __init__(self, period: float = 0.02) -> None:
+        super().__init__(period)
+        self.layers = []
+
+    def add(self, effect, mode: str = "alpha", opacity: int = 255) -> Layer:
+        """
+        Add a layer above the others.
+        :param effect: the frame producer
+        :param str mode: the blend mode, one of :data:`MODES`. Default is
+         "alpha"
+        :param int opacity: the opacity (0-255). Default is 255
+        :raises ValueError: if the mode is not one of :data:`MODES`
+        :return: the layer
+        """
+        layer = Layer(effect, mode, opacity)
+        self.layers.append(layer)
+        self.reset()
+        # The new layer needs its buffer
+        self._prepared = None
+        return layer
+
+    def allocate(self, buffer) -> None:
+        num_leds = buffer.num_leds
+        bpp = buffer.bpp
+        for layer in self.layers:
+            current = layer.buffer
+            if (
+                current is None
+                or current.num_leds != num_leds
+                or current.bpp != bpp
+            ):
+                layer.buffer = PixelBuffer(num_leds, bpp)
+            layer.effect.prepare(layer.buffer)
+        # The merged frame, so views over a strip can be drawn in one pass
+        self.frame = PixelBuffer(num_leds, bpp)
+
+    def start(self, buffer) -> None:
+        for layer in self.layers:
+            layer.buffer.fill(0)
+            layer.buffer.mark_dirty()
+            layer.effect.reset()
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        now = self._origin + t
+        start = buffer.num_leds
+        end = 0
+        for layer in self.layers:
+            layer.effect.next_frame(layer.buffer, now)
+            first, last = layer.buffer.dirty
+            if first < start:
+                start = first
+            if last > end:
+                end = last
+        if start >= end:
+            # No layer changed, the strip keeps the last frame
+            return
+
+        frame = self.frame.buffer
+        bpp = buffer.bpp
+        low = start * bpp
+        high = end * bpp
+        for index in range(low, high):
+            frame[index] = 0
+        for layer in self.layers:
+            pixels = layer.buffer
+            _blend(frame, pixels.buffer, layer.mode, layer.opacity, low, high)
+            pixels.clean()
+
+        target = getattr(buffer, "buffer", None)
+        if target is not None:
+            target[low:high] = memoryview(frame)[low:high]
+            buffer.mark_dirty(start, end)
+            return
+        # Views over a strip draw pixel by pixel
+        for pixel in range(start, end):
+            offset = pixel * bpp
+            buffer.set_rgb(
+                pixel,
+                frame[offset],
+                frame[offset + 1],
+                frame[offset + 2],
+                frame[offset + 3] if bpp == 4 else 0,
+            )
+
+
+def _blend(
+    frame: bytearray,
+    layer: bytearray,
+    mode: str,
+    opacity: int,
+    low: int,
+    high: int,
+) -> None:
+    """
+    Merge a layer into the frame.
+    :param bytearray frame: the frame merged so far
+    :param bytearray layer: the frame of the layer
+    :param str mode: the blend mode
+    :param int opacity: the opacity of the layer (0-255)
+    :param int low: first byte to merge
+    :param int high: byte after the last one
+    :return: None
+    """
+    if not opacity:
+        return
+    scale = opacity + 1
+    if mode == "alpha":
+        if opacity == 255:
+            frame[low:high] = memoryview(layer)[low:high]
+            return
+        for index in range(low, high):
+            value = frame[index]
+            frame[index] = value + (((layer[index] - value) * scale) >> 8)
+    elif mode == "add":
+        for index in range(low, high):
+            value = frame[index] + ((layer[index] * scale) >> 8)
+            frame[index] = value if value < 256 else 255
+    elif mode == "max":
+        for index in range(low, high):
+            value = frame[index]
+            top = layer[index]
+            if top > value:
+                frame[index] = value + (((top - value) * scale) >> 8)
+    else:
+        for index in range(low, high):
+            value = frame[index]
+            top = (value * (layer[index] + 1)) >> 8
+            frame[index] = value - (((value - top) * scale) >> 8)
@@ -9,13 +9,17 @@
 
 Create and control LED effects.
 
+Every effect is a thin wrapper that plays one of the frame producers of
+:mod:`producers` on the strip. It is paced by a :class:`clock.FrameClock`:
+its speed argument is the time between two frames, whatever the time the
+frame takes to render and send, and the effect stops when its duration is
+over.
+
 * Author: Jose D. Montoya
 
 
 """
 
-import time
-from random import choice
 from colors import (
     BLACK,
     BLUE,
@@ -23,15 +27,41 @@ from colors import (
     PURPLE,
     CYAN,
     ORANGE,
-    ORANGEYELLOW,
-    BLUE,
     GREEN,
     YELLOW,
 )
-from neopixel import NEOPIXEL
-from functions import rgb255, hsv_to_rgb
-import math
-import random
+from segment import split
+from producers import (
+    play,
+    Blink,
+    ChasingColor,
+    BlinkRainbow,
+    FollowRGB,
+    Wipe,
+    Pacman,
+    RainbowCycle,
+    RandomColor,
+    Twinkle,
+    RainbowSine,
+    WhiteWave,
+    WhiteWaveColor,
+    LinearInterpolation,
+    LerpPhase,
+    FadeInFadeOutRandomColor,
+    FadeInFadeOutFragmented,
+    FifoFragmentedPhase,
+    WaveFreqShrinkAndGrow,
+    WaveFreqShrinkAndGrowCentered,
+    WaveBackAndForth,
+    ShrinkAndGrow,
+    ShrinkAndGrowMultiple,
+    ShrinkAndGrowMultipleMoving,
+    Snail,
+    SnailMultiple,
+    Scanner,
+    Segments,
+    SegmentsAnimated,
+)
 
 
 def blink(
@@ -49,14 +79,7 @@ def blink(
     :param int duration: the duration in seconds. Default is 5 seconds
     :return: None
     """
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        led_object.neopixel_list = [color] * led_object.num_leds
-        led_object.ShowNeoPixels(led_object.neopixel_list)
-        time.sleep(dwell)
-        led_object.neopixel_list = [background_color] * led_object.num_leds
-        led_object.ShowNeoPixels(led_object.neopixel_list)
-        time.sleep(dwell)
+    play(led_object, Blink(color, background_color, dwell), duration)
 
 
 def chasing_color(
@@ -72,36 +95,11 @@ def chasing_color(
     :param int duration: duration in seconds: default 10 seconds
     :return: None
     """
-    rgb = 0
-    i = 0
-    led_object.fill_all(color=BLACK)
-    start_time = time.time()
-    if led_object.palette_colors is None:
-        palette = [RED, GREEN, BLUE]
-    else:
-        buf = led_object.palette_colors
-        colors_palette = []
-        for _ in range(3):
-            selection = choice(buf)
-            colors_palette.append(selection)
-            buf.remove(selection)
-        palette = colors_palette
-
-    while time.time() - start_time < duration:
-        if rgb == 0:
-            color = palette[0]
-        elif rgb == 1:
-            color = palette[1]
-        else:
-            color = palette[2]
-        led_object.neopixel_list[i] = color
-        led_object.ShowNeoPixels(led_object.neopixel_list)
-        time.sleep(time_delta / 3)
-        led_object.neopixel_list[i] = BLACK
-        led_object.ShowNeoPixels(led_object.neopixel_list)
-        rgb = (rgb + 1) % 3
-        i = (i + 1) % led_object.num_leds
-        time.sleep(time_delta)
+    play(
+        led_object,
+        ChasingColor(led_object.palette_colors, time_delta),
+        duration,
+    )
 
 
 def blink_rainbow(
@@ -117,23 +115,7 @@ def blink_rainbow(
     :param int duration: the duration in seconds. Default is 5 seconds
     :return: None
     """
-    from rainbow import rainbow_colors
-
-    rainbow_set = rainbow_colors
-
-    seed = choice(range(0, 31))
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        led_object.neopixel_list = [rainbow_set[seed]] * led_object.num_leds
-        led_object.ShowNeoPixels(led_object.neopixel_list)
-        time.sleep(dwell)
-        led_object.neopixel_list = [background_color] * led_object.num_leds
-        led_object.ShowNeoPixels(led_object.neopixel_list)
-        time.sleep(dwell)
-        if seed < 31:
-            seed = seed + 1
-        else:
-            seed = choice(range(0, 31))
+    play(led_object, BlinkRainbow(background_color, dwell), duration)
 
 
 def follow_rgb(
@@ -153,26 +135,11 @@ def follow_rgb(
     :param int duration: duration in seconds. Default is 5 seconds
     :return: None
     """
-    if color_list is None:
-        if led_object.palette_colors is None:
-            color_list = [BLACK, RED, GREEN, BLUE, YELLOW, PURPLE, CYAN, ORANGE]
-        else:
-            if len(led_object.palette_colors) > led_object.num_leds // 2:
-                color_list = led_object.palette_colors[::2][
-                    : led_object.num_leds // 2
-                ]
-
-    reference = len(color_list)
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        for i in range(led_object.num_leds * loops):
-            for value in range(reference):
-                led_object.neopixel_list[(i + value) % led_object.num_leds] = (
-                    color_list[value]
-                )
-            led_object.ShowNeoPixels(led_object.neopixel_list)
-            time.sleep(dwell)
+    play(
+        led_object,
+        FollowRGB(loops, color_list, led_object.palette_colors, dwell),
+        duration,
+    )
 
 
 def wipe(
@@ -194,27 +161,11 @@ def wipe(
     :duration int duration: duration in seconds. Default is 5 seconds
     :return: None
     """
-    led_object.fill_all(color=BLACK)
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        for i in range(led_object.num_leds):
-            if ccw:
-                led_object.neopixel_list[led_object.num_leds - 1 - i] = color1
-            else:
-                led_object.neopixel_list[i] = color1
-            led_object.ShowNeoPixels(led_object.neopixel_list)
-            time.sleep(delta_time)
-        if clear:
-            led_object.fill_all(color=BLACK)
-        for i in range(led_object.num_leds):
-            if ccw:
-                led_object.neopixel_list[led_object.num_leds - 1 - i] = color2
-            else:
-                led_object.neopixel_list[i] = color2
-            led_object.ShowNeoPixels(led_object.neopixel_list)
-            time.sleep(delta_time)
-        if clear:
-            led_object.fill_all(color=BLACK)
+    play(
+        led_object,
+        Wipe(color1, color2, delta_time, ccw, clear),
+        duration,
+    )
 
 
 def pacman(led_object, duration: int = 15):
@@ -227,71 +178,7 @@ def pacman(led_object, duration: int = 15):
     :param int num_leds: number of leds.
     :param int duration: duration in seconds. Default is 15 seconds
     """
-
-    direction = 1
-    black_dir = -1
-    if led_object.num_leds > 150:
-        start_blinking_ghosts = led_object.num_leds // 4
-    else:
-        start_blinking_ghosts = led_object.num_leds // 3
-
-    pacman = [BLUE, 10]
-    ghosts_original = [[RED, 6], [PURPLE, 4], [CYAN, 2], [ORANGE, 0]]
-    ghosts = [[RED, 6], [PURPLE, 4], [CYAN, 2], [ORANGE, 0]]
-    power_pellet = [ORANGEYELLOW, led_object.num_leds - 1]
-    led_object.neopixel_list[power_pellet[1]] = power_pellet[0]
-    NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-    ghost_timer = time.ticks_ms()
-    flag = "beep"
-
-    start_time = time.time()
-
-    while time.time() - start_time < duration:
-
-        delta = time.ticks_ms() - ghost_timer
-        if delta > 250:
-            if power_pellet[0] == ORANGEYELLOW:
-                power_pellet[0] = BLACK
-            else:
-                power_pellet[0] = ORANGEYELLOW
-
-            led_object.neopixel_list[power_pellet[1]] = power_pellet[0]
-
-            ghost_timer = time.ticks_ms()
-
-        if pacman[1] >= led_object.num_leds - 2:
-            direction = direction * -1
-            black_dir = black_dir * -1
-            for ghost in ghosts:
-                ghost[0] = BLUE
-
-        led_object.neopixel_list[pacman[1]] = pacman[0]
-        led_object.neopixel_list[pacman[1] + black_dir] = BLACK
-        pacman[1] += direction
-
-        if ghosts[3][1] <= start_blinking_ghosts and direction == -1:
-            if flag == "beep":
-                for i, ghost in enumerate(ghosts):
-                    ghost[0] = BLACK
-                flag = "bop"
-            else:
-                for i, ghost in enumerate(ghosts):
-                    ghost[0] = ghosts_original[i][0]
-                flag = "beep"
-
-        for i, ghost in enumerate(ghosts):
-            led_object.neopixel_list[ghost[1]] = ghost[0]
-            led_object.neopixel_list[ghost[1] + black_dir] = BLACK
-            ghost[1] += direction
-
-        if ghosts[3][1] <= 0:
-            direction = direction * -1
-            black_dir = black_dir * -1
-            for i, ghost in enumerate(ghosts):
-                ghost[0] = ghosts_original[i][0]
-
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-        time.sleep(0.1)
+    play(led_object, Pacman(), duration)
 
 
 def rainbow_cycle(
@@ -305,18 +192,7 @@ def rainbow_cycle(
     :param int duration: duration in seconds: default 5 seconds
     :return: None
     """
-
-    from rainbow import rainbow_colors
-
-    rainbow_set = rainbow_colors
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        rainbow_set = rainbow_set[-1:] + rainbow_set[:-1]
-        for i in range(led_object.num_leds):
-            led_object.neopixel_list[i] = rainbow_set[i]
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-        time.sleep(time_delta)
+    play(led_object, RainbowCycle(time_delta), duration)
 
 
 def random_color(
@@ -332,27 +208,14 @@ def random_color(
     :param float delta_time: time delay between each color change: default 0.1 seconds
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    limits = range(0, 256)
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-
-        for i in range(start, led_object.num_leds):
-            led_object.neopixel_list[i] = (
-                choice(limits),
-                choice(limits),
-                choice(limits),
-            )
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-        time.sleep(delta_time)
+    play(led_object, RandomColor(start, delta_time), duration)
 
 
 def twinkle(led_object, delta_time: float = 0.1, duration: int = 5):
     """
-    Twinke effect. This function will set random colors to the leds.
+    Twinke effect. Leds light up in random colors of the palette and fade out.
     :param led_object: led object
-    :param float delta_time: time delay between each color change: default 0.1 seconds
+    :param float delta_time: time between frames: default 0.1 seconds
     :param int duration: duration in seconds. Default is 5 seconds
     """
     if led_object.palette_colors is None:
@@ -366,18 +229,13 @@ def twinkle(led_object, delta_time: float = 0.1, duration: int = 5):
             ORANGE,
         ]
 
-    start_time = time.time()
-
-    while time.time() - start_time < duration:
-        neopixel_list = [
-            choice(led_object.palette_colors)
-            for _ in range(led_object.num_leds)
-        ]
-        NEOPIXEL.ShowNeoPixels(led_object, neopixel_list)
-        time.sleep(delta_time)
+    play(led_object, Twinkle(led_object.palette_colors, delta_time), duration)
 
 
 def get_led_segments(led_list, segment_length) -> list:
+    if hasattr(led_list, "num_leds"):
+        # A strip gives views over its framebuffer instead of copies
+        return split(led_list, segment_length)
     segments = []
     for i in range(0, len(led_list), segment_length):
         segments.append(led_list[i : i + segment_length])
@@ -423,18 +281,11 @@ def rainbow_sine(
     :param float value: value. Default is 1.0
     :param int duration: duration in seconds. Default is 5 seconds
     """
-    animation = 0
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        for i in range(led_object.num_leds):
-            hue = math.sin(animation + (i + 1) * shrinkage)
-            hue = (hue + 1) / 2
-            color = rgb255(hsv_to_rgb(hue, saturation, value))
-            led_object.neopixel_list[i] = color
-
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-        animation += animation_speed
-        time.sleep(speed)
+    play(
+        led_object,
+        RainbowSine(shrinkage, animation_speed, speed, saturation, value),
+        duration,
+    )
 
 
 def white_wave(
@@ -459,28 +310,11 @@ def white_wave(
         size of the segments. The bigger the number the smaller the segments will be
     :param int duration: duration in seconds. Default is 5 seconds
     """
-    animation = 0
-    fade_animation = 0
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        # Calculate fade effect using sine wave
-        fade_effect = (math.sin(fade_animation) + 1) / 2
-        # Set global brightness based on fade effect
-        led_object.brightness = fade_effect
-        for i in range(led_object.num_leds):
-            brightness = math.sin(animation + i * shrinkage)
-            brightness = (brightness + 1) / 2
-            color = rgb255(hsv_to_rgb(0.0, 0.0, brightness))
-
-            led_object.neopixel_list[i] = color
-
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-        # Increment animation variables
-        animation += animation_speed
-        fade_animation += fade_animation_speed
-        # Small delay to control the speed of the animation
-        time.sleep(speed)
+    play(
+        led_object,
+        WhiteWave(animation_speed, fade_animation_speed, speed, shrinkage),
+        duration,
+    )
 
 
 def white_wave_color(
@@ -505,46 +339,11 @@ def white_wave_color(
         desired effect
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    animation = 0
-    fade_animation = 0
-    shrinkage = 0
-    freq = 0
-    expand = 0
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-
-        shrinkage = math.sin(freq)
-        shrinkage = (shrinkage + 1) / 2
-
-        expand = math.cos(freq)
-        expand = (expand + 1) / 2
-
-        for i in range(led_object.num_leds):
-            # Calculate brightness for each LED using sine wave
-            saturation = math.sin(animation + i * shrinkage)
-            saturation = (saturation + 1) / 2
-            saturation = int(saturation * 255)
-
-            brightness = math.sin(animation + i * expand)
-            brightness = (brightness + 1) / 2
-            brightness = int(brightness * 255)
-
-            led_object.neopixel_list[i] = (
-                saturation,
-                int(saturation / (brightness + 1)),
-                brightness,
-            )
-
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-        # Increment animation variables
-        animation += animation_speed
-        fade_animation += fade_animation_speed
-        freq += frequency
-
-        # Small delay to control the speed of the animation
-        time.sleep(speed)
+    play(
+        led_object,
+        WhiteWaveColor(animation_speed, fade_animation_speed, frequency, speed),
+        duration,
+    )
 
 
 def linear_interpolation(
@@ -568,37 +367,13 @@ def linear_interpolation(
         desired effect
     :param int duration: duration in seconds. Default is 5 seconds
     """
-    from functions import lerp8by8
-
-    animation = 0
-
-    if led_object.palette_colors is None:
-        color1 = (255, 0, 0)
-        color2 = (0, 0, 255)
-    else:
-        color1 = choice(led_object.palette_colors)
-        color2 = choice(led_object.palette_colors)
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-
-        for i in range(led_object.num_leds):
-
-            interpolation = math.sin(animation + i * shrinkage)
-            interpolation = (interpolation + 1) / 2
-            interpolation *= 255
-
-            r = lerp8by8(color1[0], color2[0], int(interpolation))
-            g = lerp8by8(color1[1], color2[1], int(interpolation))
-            b = lerp8by8(color1[2], color2[2], int(interpolation))
-
-            led_object.neopixel_list[i] = (r, g, b)
-
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-
-        animation += animation_increase
-
-        time.sleep(speed)
+    play(
+        led_object,
+        LinearInterpolation(
+            shrinkage, animation_increase, speed, led_object.palette_colors
+        ),
+        duration,
+    )
 
 
 def lerp_phase(
@@ -626,41 +401,17 @@ def lerp_phase(
         in how the interpolation from one color to the other will change
     :param int duration: duration in seconds. Default is 5 seconds
     """
-    from functions import lerp8by8
-
-    animation = 0
-
-    if led_object.palette_colors is None:
-        color1 = (255, 0, 0)
-        color2 = (0, 0, 255)
-    else:
-        color1 = choice(led_object.palette_colors)
-        color2 = choice(led_object.palette_colors)
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-
-        for i in range(led_object.num_leds):
-
-            interpolation = math.sin(i * shrinkage)
-            interpolation *= 127
-
-            phase = math.sin(animation * phase_increase)
-
-            interpolation *= phase
-            interpolation += 127
-
-            r = lerp8by8(color1[0], color2[0], int(interpolation))
-            g = lerp8by8(color1[1], color2[1], int(interpolation))
-            b = lerp8by8(color1[2], color2[2], int(interpolation))
-
-            led_object.neopixel_list[i] = (r, g, b)
-
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-
-        animation += animation_increase
-
-        time.sleep(speed)
+    play(
+        led_object,
+        LerpPhase(
+            animation_increase,
+            speed,
+            shrinkage,
+            phase_increase,
+            led_object.palette_colors,
+        ),
+        duration,
+    )
 
 
 def fadein_fadeout_random_color(
@@ -676,47 +427,9 @@ def fadein_fadeout_random_color(
     :param float speed: speed of the animation. Default is 0.1 seconds.
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    colorlist = [
-        random.randint(0, 256),
-        random.randint(0, 256),
-        random.randint(0, 256),
-    ]
-    color_index = random.randint(0, len(colorlist) - 1)
-
-    fade = 0
-    start_time = time.time()
-    while time.time() - start_time < duration:
-
-        for i in range(led_object.num_leds):
-
-            brightness = math.sin(fade + math.pi)
-            brightness = (brightness + 1) / 2
-            brightness = int(brightness * 255)
-            colorlist[color_index] = brightness
-
-            led_object.neopixel_list[i] = (
-                colorlist[0],
-                colorlist[1],
-                colorlist[2],
-            )
-
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-
-        if fade >= 2 * math.pi:
-            fade = 0
-            colorlist = [
-                random.randint(0, 256),
-                random.randint(0, 256),
-                random.randint(0, 256),
-            ]
-            color_index = random.randint(0, len(colorlist) - 1)
-
-        # Increment animation variables
-        fade += fade_increment
-
-        # Small delay to control the speed of the animation
-        time.sleep(speed)
+    play(
+        led_object, FadeInFadeOutRandomColor(fade_increment, speed), duration
+    )
 
 
 def fadein_fadeout_fragmented(
@@ -737,54 +450,11 @@ def fadein_fadeout_fragmented(
     :param float speed: speed of the animation. Default is 0.1 seconds.
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    fade = 0
-    fragment_size = led_object.num_leds // fragments
-
-    fragment = 0
-    colorlist = [
-        random.randint(0, 256),
-        random.randint(0, 256),
-        random.randint(0, 256),
-    ]
-    color_index = random.randint(0, len(colorlist) - 1)
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-
-        for i in range(
-            fragment * fragment_size, fragment_size * (fragment + 1)
-        ):
-
-            brightness = math.cos(fade + math.pi)
-            brightness = (brightness + 1) / 2
-            brightness = int(brightness * 255)
-            colorlist[color_index] = brightness
-
-            led_object.neopixel_list[i] = (
-                colorlist[0],
-                colorlist[1],
-                colorlist[2],
-            )
-
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-
-        if fade >= 2 * math.pi:
-            fade = 0
-            colorlist = [
-                random.randint(0, 256),
-                random.randint(0, 256),
-                random.randint(0, 256),
-            ]
-            color_index = random.randint(0, len(colorlist) - 1)
-            fragment = fragment + 1
-            fragment = fragment % fragments
-
-        # Increment animation variables
-        fade += fade_increment
-
-        # Small delay to control the speed of the animation
-        time.sleep(speed)
+    play(
+        led_object,
+        FadeInFadeOutFragmented(fragments, fade_increment, speed),
+        duration,
+    )
 
 
 def fifo_fragmented_phase(
@@ -805,43 +475,11 @@ def fifo_fragmented_phase(
     :param float speed: speed of the animation. Default is 0.1 seconds.
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    fade = 0
-
-    fragment_size = math.floor(led_object.num_leds / fragment_amount)
-
-    # Start time
-    start_time = time.time()
-    while time.time() - start_time < duration:
-
-        for i in range(fragment_amount):
-
-            brightness = math.cos(fade + (math.pi // 2 * i))
-            brightness = (brightness + 1) / 2
-            brightness = int(brightness * 255)
-
-            # Set color for each LED
-            begin = i * fragment_size
-            end = min(fragment_size * (i + 1), led_object.num_leds)
-            for j in range(begin, end):
-                led_object.neopixel_list[j] = 0, 0, brightness
-
-        fade += fade_speed
-
-        if fade >= 20:
-            fade = 0
-            if fragment_amount >= 8:
-                fragment_amount = 1
-            fragment_amount *= 2
-            fragment_size = math.ceil(led_object.num_leds / fragment_amount)
-
-            led_object.fill_all(color=BLACK)
-
-        # Increment animation variables
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-
-        # Small delay to control the speed of the animation
-        time.sleep(speed)
+    play(
+        led_object,
+        FifoFragmentedPhase(fragment_amount, fade_speed, speed),
+        duration,
+    )
 
 
 def wave_freq_shrink_and_grow(
@@ -863,29 +501,11 @@ def wave_freq_shrink_and_grow(
         desired effect
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    move = 0
-    freq = 0
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        shrinkage = math.sin(freq)
-        shrinkage = (shrinkage + 1) / 2
-
-        for i in range(led_object.num_leds):
-            saturation = math.sin(move + i * shrinkage)
-            saturation = (saturation + 1) / 2
-            saturation = int(saturation * 255)
-
-            led_object.neopixel_list[i] = 80, saturation, 80
-
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-
-        move += move_increase
-        freq -= freq_increase
-
-        # Small delay to control the speed of the animation
-        time.sleep(speed)
+    play(
+        led_object,
+        WaveFreqShrinkAndGrow(move_increase, freq_increase, speed),
+        duration,
+    )
 
 
 def wave_freq_shrink_and_grow_centered(
@@ -907,32 +527,11 @@ def wave_freq_shrink_and_grow_centered(
         desired effect
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    move = 0
-    freq = 0
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        shrinkage = math.sin(freq)
-        shrinkage = (shrinkage + 1) / 2
-
-        midpoint = led_object.num_leds // 2
-
-        for i in range(midpoint):
-
-            saturation = math.cos(move + i * shrinkage)
-            saturation = (saturation + 1) / 2
-            saturation = int(saturation * 255)
-
-            led_object.neopixel_list[midpoint + i] = 25, saturation, 80
-            led_object.neopixel_list[midpoint - i] = 80, saturation, 25
-
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-
-        move += move_increase
-        freq += frequency
-
-        time.sleep(speed)
+    play(
+        led_object,
+        WaveFreqShrinkAndGrowCentered(move_increase, frequency, speed),
+        duration,
+    )
 
 
 def wave_back_and_forth(
@@ -951,28 +550,7 @@ def wave_back_and_forth(
         desired effect
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    move = 0
-    hue = 0
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-
-        for i in range(led_object.num_leds):
-            hue = int(hue + math.sin(move) * led_object.num_leds)
-
-            brigthness = i + math.sin(move) * 20
-            brigthness = math.sin(brigthness)
-            brigthness = (brigthness + 1) / 2
-            brigthness = int(brigthness * 255)
-
-            led_object.neopixel_list[i] = hue, 80, brigthness
-
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-
-        move += move_increase
-
-        time.sleep(speed)
+    play(led_object, WaveBackAndForth(move_increase, speed), duration)
 
 
 def shrink_and_grow(led_object, duration: int = 5):
@@ -981,32 +559,7 @@ def shrink_and_grow(led_object, duration: int = 5):
     :param led_object: led object
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    move = 0
-    midpoint = led_object.num_leds // 2
-    spread = midpoint * ((math.sin(move) + 1) / 2)
-    step = math.pi / spread
-
-    # Start time
-    start_time = time.time()
-    while time.time() - start_time < duration:
-
-        for i in range(int(spread)):
-            brigthness = math.cos(i + move * step)
-            brigthness = (brigthness + 1) / 2
-            brigthness = int(brigthness * 255)
-
-            led_object.neopixel_list[midpoint + i] = 60, 60, brigthness
-            led_object.neopixel_list[midpoint - i] = 60, 60, brigthness
-
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-
-        move += 0.05
-
-        # Small delay to control the speed of the animation
-        time.sleep(0.01)
-        if move >= 2 * math.pi:
-            move = 0
+    play(led_object, ShrinkAndGrow(), duration)
 
 
 def shrink_and_grow_multiple(
@@ -1027,40 +580,11 @@ def shrink_and_grow_multiple(
         desired effect
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    move = 0
-
-    fragment_size = led_object.num_leds // fragment_amount
-    fragment_midpoint = fragment_size // 2
-
-    spread = fragment_midpoint * ((math.sin(move) + 1) / 2)
-    step = math.pi / spread
-    led_object.fill_all(color=(BLACK))
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-
-        for fragment in range(fragment_amount):
-            pos = fragment * fragment_size
-            midpoint = pos + fragment_midpoint
-
-            for i in range(int(spread)):
-                brigthness = math.cos(i + move * step * math.pi)
-                brigthness = (brigthness + 1) / 2
-                brigthness = int(brigthness * 255)
-
-                led_object.neopixel_list[midpoint + i] = 25, brigthness, 80
-                led_object.neopixel_list[midpoint - i] = 80, brigthness, 25
-
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-
-        move += move_increase
-
-        # Small delay to control the speed of the animation
-        time.sleep(speed)
-        if move >= 2 * math.pi:
-            move = 0
-            pos = 0
+    play(
+        led_object,
+        ShrinkAndGrowMultiple(fragment_amount, move_increase, speed),
+        duration,
+    )
 
 
 def shrink_and_grow_multiple_moving(
@@ -1084,56 +608,13 @@ def shrink_and_grow_multiple_moving(
         desired effect
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    move = 0
-
-    midpoint = [0] * fragment_amount
-
-    leds = [(0, 0, 0)] * led_object.num_leds
-    fragment_size = led_object.num_leds // fragment_amount
-    fragment_midpoint = fragment_size // 2
-
-    for fragment in range(fragment_amount):
-        pos = fragment * fragment_size
-        midpoint[fragment] = fragment_midpoint + (fragment * fragment_size)
-
-    spread = fragment_midpoint * ((math.sin(move) + 1) / 2)
-    step = math.pi / spread
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-
-        for fragment in range(fragment_amount):
-            midpoint[fragment] += midpoint_increase
-
-            if midpoint[fragment] > led_object.num_leds:
-                midpoint[fragment] = 0
-
-            pos = midpoint[fragment]
-
-            for i in range(int(spread) + 1):
-
-                brightness = math.cos(i + step)
-                brightness = (brightness + 1) / 2
-                brightness = int(brightness * 255)
-
-                leds[int((pos + i) % led_object.num_leds)] = 110, 32, brightness
-
-                if pos - i < 0:
-                    leds[int(pos + led_object.num_leds - i)] = (
-                        80,
-                        80,
-                        brightness,
-                    )
-                else:
-                    leds[int(pos - i)] = 128, 54, brightness
-
-        NEOPIXEL.ShowNeoPixels(led_object, leds)
-
-        move += move_increase
-
-        # Small delay to control the speed of the animation
-        time.sleep(speed)
+    play(
+        led_object,
+        ShrinkAndGrowMultipleMoving(
+            fragment_amount, midpoint_increase, move_increase, speed
+        ),
+        duration,
+    )
 
 
 def snail(
@@ -1152,46 +633,18 @@ def snail(
     :param int fragment_amount: number of fragments. Default is 8
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    fragment_size = led_object.num_leds // fragment_amount
-
-    leds = [BLACK] * led_object.num_leds
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        snail_size = 0
-
-        if snailend >= snailbegin:
-            snail_size = snailend - snailbegin
-        else:
-            snail_size = led_object.num_leds - snailbegin + snailend
-
-        spread = snail_size
-        step = 2 * math.pi / spread
-
-        for i in range(spread):
-            brightness = math.cos(math.pi + (i * step))
-            brightness = (brightness + 1) / 2
-            brightness = int(brightness * 255)
-
-            index = int((snailbegin + i) % led_object.num_leds)
-            leds[index] = 215, 128, brightness
-
-        NEOPIXEL.ShowNeoPixels(led_object, leds)
-        time.sleep(speed)
-
-        if not is_shrinking:
-            snailend += 0.08
-            if snailend >= led_object.num_leds:
-                snailend = 0
-            if snail_size > fragment_size:
-                is_shrinking = True
-        else:
-            snailbegin += 0.08
-            if snailbegin >= led_object.num_leds:
-                snailbegin = 0
-            if snail_size < snail_minimum_size:
-                is_shrinking = False
+    play(
+        led_object,
+        Snail(
+            fragment_amount,
+            snail_minimum_size,
+            is_shrinking,
+            snailbegin,
+            snailend,
+            speed,
+        ),
+        duration,
+    )
 
 
 def segments(
@@ -1209,17 +662,60 @@ def segments(
     :param float speed: speed of the animation. Default is 0.1 seconds
     :param int duration: duration in seconds. Default is 5 seconds
     """
+    play(led_object, Segments(segment_length, values, speed), duration)
 
-    led_list = [BLACK for _ in range(led_object.num_leds)]
 
-    led_segments = get_led_segments(led_list, segment_length)
-    assigned_segments = assign_values_to_segments(led_segments, values)
-    led_object.neopixel_list = flatten_segments(assigned_segments)
+def segment_effect(
+    led_object,
+    neopixel_list,
+    num_leds: int,
+    duration: int,
+    segment_length: int,
+    values: list,
+) -> None:
+    """
+    Give one color to each segment of the strip, used by
+    :meth:`neopixel.NEOPIXEL.segment`.
+    :param led_object: led object
+    :param neopixel_list: list of neopixel colors, not used, the effect
+     draws into the framebuffer
+    :param int num_leds: number of leds
+    :param int duration: duration in seconds
+    :param int segment_length: segment length
+    :param list values: one color per segment, the segments left are black
+    :return: None
+    """
+    play(led_object, Segments(segment_length, values), duration)
+
 
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        NEOPIXEL.ShowNeoPixels(led_object, led_object.neopixel_list)
-        time.sleep(speed)
+def segment_animated_effect(
+    led_object,
+    neopixel_list,
+    num_leds: int,
+    duration: int,
+    segment_length: int,
+    values: list,
+    animation: str = "fade",
+) -> None:
+    """
+    Give one color to each segment of the strip and move the colors one
+    segment ahead every 1.5 seconds: each color stays 1 second and takes 0.5
+    seconds to move. Used by :meth:`neopixel.NEOPIXEL.segment_animated`.
+    :param led_object: led object
+    :param neopixel_list: list of neopixel colors, not used, the effect
+     draws into the framebuffer
+    :param int num_leds: number of leds
+    :param int duration: duration in seconds
+    :param int segment_length: segment length
+    :param list values: one color per segment, the segments left are black
+    :param str animation: the transition, "fade" or "wipe". Default is "fade"
+    :return: None
+    """
+    play(
+        led_object,
+        SegmentsAnimated(segment_length, values, animation),
+        duration,
+    )
 
 
 def snail_multiple(
@@ -1238,48 +734,18 @@ def snail_multiple(
     :param int fragment_amount: number of fragments. Default is 8
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    fragment_size = led_object.num_leds // fragment_amount
-
-    leds = [BLACK] * led_object.num_leds
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        snail_size = 0
-
-        if snailend >= snailbegin:
-            snail_size = snailend - snailbegin
-        else:
-            snail_size = fragment_size - snailbegin + snailend
-
-        spread = snail_size
-        step = 2 * math.pi / spread
-
-        for i in range(spread):
-            brightness = math.cos(math.pi + (i * step))
-            brightness = (brightness + 1) / 2
-            brightness = int(brightness * 255)
-
-            for j in range(fragment_amount):
-                index = int((snailbegin + i) % fragment_size)
-                index += j * fragment_size
-                leds[index] = 215, 128, brightness
-
-        NEOPIXEL.ShowNeoPixels(led_object, leds)
-        time.sleep(speed)
-
-        if not is_shrinking:
-            snailend += 0.1
-            if snailend >= fragment_size:
-                snailend = 0
-            if snail_size > fragment_size - 1:
-                is_shrinking = True
-        else:
-            snailbegin += 0.1
-            if snailbegin >= fragment_size:
-                snailbegin = 0
-            if snail_size < snail_minimum_size:
-                is_shrinking = False
+    play(
+        led_object,
+        SnailMultiple(
+            fragment_amount,
+            snail_minimum_size,
+            is_shrinking,
+            snailbegin,
+            snailend,
+            speed,
+        ),
+        duration,
+    )
 
 
 def scanner(
@@ -1294,29 +760,4 @@ def scanner(
     :param int scanner size: scanner size. Default is 8
     :param int duration: duration in seconds. Default is 5 seconds
     """
-
-    position = 0
-    direction = False
-
-    leds = [BLACK] * led_object.num_leds
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        step = 2 * math.pi / scanner_size
-
-        for i in range(scanner_size):
-            brightness = math.cos(math.pi + (i * step))
-            brightness = (brightness + 1) / 2
-            brightness = int(brightness * 255)
-
-            leds[position + i] = 215, 128, max(brightness, 30)
-
-        NEOPIXEL.ShowNeoPixels(led_object, leds)
-        time.sleep(speed)
-
-        if position == led_object.num_leds - scanner_size or position == 0:
-            direction = not direction
-        if direction:
-            position += 1
-        else:
-            position -= 1
+    play(led_object, Scanner(scanner_size, speed), duration)
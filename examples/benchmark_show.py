@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+# Compare the bulk transmit with the per pixel path. Runs on the Pico, or on a
+# computer where the simulator records the words instead of sending them.
+
+from neopixel import NEOPIXEL
+
+try:
+    from machine import Pin
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from simulator import Pin, ticks_us, ticks_diff
+
+FRAMES = 50
+
+# Create a NeoPixel strip with 600 pixels connected to pin 15
+led_strip = NEOPIXEL(Pin(15), 600)
+led_strip.fill((0, 80, 120))
+
+for bulk in (False, True):
+    led_strip.bulk = bulk
+    start = ticks_us()
+    for _ in range(FRAMES):
+        led_strip.show()
+    elapsed = ticks_diff(ticks_us(), start)
+    print("bulk" if bulk else "per pixel", elapsed // FRAMES, "us per frame")
+
+# Turn off all the pixels
+led_strip.fill_all(color=(0, 0, 0))
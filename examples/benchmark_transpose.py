@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+# Compare the table driven transposer with a bit by bit one, for 8 strips of
+# 150 pixels. Runs on the Pico or on a computer.
+
+from parallel import transpose
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from simulator import ticks_us, ticks_diff
+
+FRAMES = 5
+LANES = 8
+NUM_LEDS = 150
+
+
+def transpose_bit_by_bit(wires, planes):
+    for index in range(len(planes) // 8):
+        for slot in range(8):
+            byte = 0
+            for lane, wire in enumerate(wires):
+                byte |= ((wire[index] >> (7 - slot)) & 1) << lane
+            planes[index * 8 + slot] = byte
+
+
+wires = [
+    bytearray((lane * 37 + i) & 0xFF for i in range(NUM_LEDS * 3))
+    for lane in range(LANES)
+]
+planes = bytearray(NUM_LEDS * 3 * 8)
+expected = bytearray(len(planes))
+transpose_bit_by_bit(wires, expected)
+
+for name, function in (
+    ("bit by bit", transpose_bit_by_bit),
+    ("table", transpose),
+):
+    start = ticks_us()
+    for _ in range(FRAMES):
+        function(wires, planes)
+    elapsed = ticks_diff(ticks_us(), start)
+    assert planes == expected
+    print(name, elapsed // FRAMES, "us per frame")
@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+
+import time
+from neopixel import NEOPIXEL
+from machine import Pin
+from effects import rainbow_sine
+
+# Create a NeoPixel strip with 30 pixels connected to pin 15, with gamma
+# correction and at half brightness
+led_strip = NEOPIXEL(Pin(15), 30, brightness=128, gamma=2.6)
+
+rainbow_sine(led_strip, duration=5)
+
+# Dim the last frame without rendering it again
+for level in range(128, -1, -8):
+    led_strip.brightness = level
+    led_strip.show()
+    time.sleep(0.05)
+
+# Turn off all the pixels
+led_strip.brightness = 255
+led_strip.fill_all(color=(0, 0, 0))
@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+# Three effects stacked on one strip: a rainbow base, twinkles added on top
+# of it and a scanner highlight.
+
+from neopixel import NEOPIXEL
+from machine import Pin
+from compositor import Compositor
+from producers import RainbowSine, Scanner, Twinkle, play
+
+# Create a NeoPixel strip with 60 pixels connected to pin 15
+led_strip = NEOPIXEL(Pin(15), 60)
+
+look = Compositor()
+# The rainbow at half opacity, so the other layers stand out
+base = look.add(RainbowSine(), "alpha", 128)
+look.add(Twinkle(delta_time=0.03), "add")
+look.add(Scanner(), "max", 200)
+
+play(led_strip, look, 10)
+
+# Bring the rainbow up to full opacity
+base.opacity = 255
+play(led_strip, look, 5)
+
+# Turn off all the pixels
+led_strip.fill_all(color=(0, 0, 0))
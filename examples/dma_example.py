@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+
+from neopixel import NEOPIXEL
+from machine import Pin
+from backends import DMABackend
+
+# Create a NeoPixel strip with 300 pixels connected to pin 15. The frames are
+# sent by DMA, show() returns while the previous frame is still on the wire
+led_strip = NEOPIXEL(Pin(15), 300, backend=DMABackend())
+
+for position in range(led_strip.num_leds):
+    # Render the next frame while the previous one is being sent
+    led_strip.fill((0, 0, 0))
+    led_strip.fill((0, 80, 120), position, position + 10)
+    led_strip.show()
+
+# Wait for the last frame, then turn off all the pixels
+led_strip.wait()
+led_strip.fill_all(color=(0, 0, 0))
@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+
+from multistrip import MultiStrip
+from machine import Pin
+from colors import RED, GREEN, BLUE, BLACK
+
+# Create eight strips with 150 pixels each, connected to pins 8 to 15
+strips = MultiStrip([Pin(pin) for pin in range(8, 16)], 150)
+
+colors = [RED, GREEN, BLUE]
+for frame in range(300):
+    for number, strip in enumerate(strips):
+        strip.fill(BLACK)
+        strip[(frame + number * 10) % strip.num_leds] = colors[number % 3]
+    # All the strips are refreshed at the same time
+    strips.show_all()
+
+# Turn off all the pixels
+strips.wait()
+strips.fill_all(BLACK)
+strips.show_all()
@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+
+from parallel import ParallelStrips
+from colors import RED, GREEN, BLUE, BLACK
+
+# Create four strips with 60 pixels each, connected to pins 10 to 13 and
+# driven by a single state machine
+strips = ParallelStrips(10, 4, 60)
+
+colors = [RED, GREEN, BLUE]
+for frame in range(240):
+    for number, strip in enumerate(strips):
+        strip.fill(BLACK)
+        strip[(frame + number * 5) % strip.num_leds] = colors[number % 3]
+    strips.show_all()
+
+# Turn off all the pixels
+for strip in strips:
+    strip.fill(BLACK)
+strips.show_all()
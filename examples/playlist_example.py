@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+# Play a list of effects, with no black frame between them.
+
+from neopixel import NEOPIXEL
+from machine import Pin
+from producers import RainbowSine, Scanner, Twinkle, play
+from sequencer import Sequencer
+
+# Create a NeoPixel strip with 30 pixels connected to pin 15
+led_strip = NEOPIXEL(Pin(15), 30)
+
+playlist = [
+    # 6 seconds of rainbow, cut to the next effect
+    (RainbowSine, None, 6),
+    # 5 seconds of scanner, then blend into the next effect for one second
+    (Scanner, None, 5, "crossfade"),
+    # 8 seconds of twinkles, then wipe to the next effect over 1.5 seconds
+    (Twinkle, {"delta_time": 0.03}, 8, ("wipe", 1.5)),
+]
+
+# Play the list twice, each time in another order
+sequencer = Sequencer(playlist, shuffle=True)
+play(led_strip, sequencer, 2 * sequencer.duration)
+
+# Turn off all the pixels
+led_strip.fill_all(color=(0, 0, 0))
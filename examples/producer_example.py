@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+# Drive two effects frame by frame, without blocking in the effect. The loop
+# is free to do other work between frames.
+
+import time
+from neopixel import NEOPIXEL
+from machine import Pin
+from producers import RainbowSine, Scanner
+
+# Create a NeoPixel strip with 30 pixels connected to pin 15
+led_strip = NEOPIXEL(Pin(15), 30)
+
+start = time.ticks_ms()
+for effect in (RainbowSine(), Scanner()):
+    started = time.ticks_ms()
+    while time.ticks_diff(time.ticks_ms(), started) < 5000:
+        # Render the frame due now and send it
+        effect.next_frame(led_strip, time.ticks_diff(time.ticks_ms(), start))
+        led_strip.show()
+        time.sleep_ms(10)
+
+# Turn off all the pixels
+led_strip.fill_all(color=(0, 0, 0))
@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+
+import time
+from neopixel import NEOPIXEL
+from machine import Pin
+from functions import RGBW32
+
+# Create a SK6812 RGBW strip with 30 pixels connected to pin 15
+led_strip = NEOPIXEL(Pin(15), 30, pixel_order="GRBW")
+
+# Colors can be given as (r, g, b, w) tuples or packed with RGBW32
+led_strip.fill((0, 0, 0, 255))
+led_strip.show()
+time.sleep(1)
+
+for i in range(len(led_strip)):
+    led_strip[i] = RGBW32(i * 8, 0, 255 - i * 8, 32)
+led_strip.show()
+time.sleep(1)
+
+# Turn off all the pixels
+led_strip.fill_all(color=(0, 0, 0, 0))
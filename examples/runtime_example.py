@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+# Three effects on two strips, shown from one event loop while another task
+# keeps polling a button. Runs on the Pico, or on a computer with the
+# simulator backend.
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+from neopixel import NEOPIXEL
+from producers import RainbowSine, Scanner, Twinkle
+from runtime import Runtime
+
+try:
+    from machine import Pin
+
+    backend = None
+    button = Pin(14, Pin.IN, Pin.PULL_UP)
+except ImportError:
+    from simulator import SimulatorBackend
+
+    backend = SimulatorBackend
+    button = None
+
+# Two strips of 60 pixels on pins 15 and 16
+strip1 = NEOPIXEL(15, 60, backend=backend() if backend else None)
+strip2 = NEOPIXEL(16, 60, backend=backend() if backend else None)
+
+DURATION = 10
+
+runtime = Runtime(fps=50)
+# The first strip shows a rainbow on one half and a scanner on the other
+runtime.add(strip1, RainbowSine(), 0, 30)
+runtime.add(strip1, Scanner(), 30, 30)
+runtime.add(strip2, Twinkle())
+
+
+async def poll_button():
+    while True:
+        if button is not None and not button.value():
+            runtime.stop()
+        await asyncio.sleep(0.02)
+
+
+async def main():
+    poller = asyncio.create_task(poll_button())
+    await runtime.run(duration=DURATION)
+    poller.cancel()
+    print("frames sent", strip1.frames_sent, strip2.frames_sent)
+
+
+asyncio.run(main())
@@ -0,0 +1,20 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+from neopixel import NEOPIXEL
+from machine import Pin
+
+# Create a NeoPixel strip with 30 pixels connected to pin 15
+led_strip = NEOPIXEL(Pin(15), 30)
+
+# One color for each zone of 10 pixels
+values = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+
+# Show the zones, then move the colors one zone ahead every second
+led_strip.segment(segment_length=10, values=values, duration=3)
+led_strip.segment_animated(10, values, duration=10, animation="fade")
+led_strip.segment_animated(10, values, duration=10, animation="wipe")
+
+# Turn off all the pixels
+led_strip.fill_all(color=(0, 0, 0))
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+# Split one strip into three zones animated on their own. The zones are views
+# over the strip framebuffer, the effects draw straight into it.
+
+import time
+from neopixel import NEOPIXEL
+from machine import Pin
+from producers import RainbowSine, Scanner, Twinkle
+from segment import Segment
+
+# Create a NeoPixel strip with 60 pixels connected to pin 15
+led_strip = NEOPIXEL(Pin(15), 60)
+
+zones = (
+    # A rainbow on the first 20 pixels, running backwards
+    (Segment(led_strip, 0, 20, reverse=True), RainbowSine()),
+    # A scanner bouncing from both ends of the next 20 pixels
+    (Segment(led_strip, 20, 20, mirror=True), Scanner()),
+    # Twinkling pairs of pixels on the last 20
+    (Segment(led_strip, 40, 20, grouping=2), Twinkle()),
+)
+
+start = time.ticks_ms()
+while time.ticks_diff(time.ticks_ms(), start) < 10000:
+    now = time.ticks_diff(time.ticks_ms(), start)
+    for zone, effect in zones:
+        effect.next_frame(zone, now)
+    led_strip.show()
+    time.sleep_ms(20)
+
+# Turn off all the pixels
+led_strip.fill_all(color=(0, 0, 0))
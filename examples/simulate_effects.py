@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+# Run every effect against the simulator backend on a computer and print the
+# frame rate each one reaches on a 300 pixel strip, and the limit set by the
+# wire time. The effects are driven frame by frame with a virtual time that
+# moves one frame period per frame, so the numbers show how fast the effects
+# can render.
+
+import producers
+from neopixel import NEOPIXEL
+from simulator import SimulatorBackend, ticks_ms, ticks_diff
+
+NUM_LEDS = 300
+DURATION = 1000
+
+EFFECTS = [
+    "Blink",
+    "ChasingColor",
+    "BlinkRainbow",
+    "FollowRGB",
+    "Wipe",
+    "Pacman",
+    "RandomColor",
+    "Twinkle",
+    "RainbowSine",
+    "WhiteWave",
+    "WhiteWaveColor",
+    "LinearInterpolation",
+    "LerpPhase",
+    "FadeInFadeOutRandomColor",
+    "FadeInFadeOutFragmented",
+    "FifoFragmentedPhase",
+    "WaveFreqShrinkAndGrow",
+    "WaveFreqShrinkAndGrowCentered",
+    "WaveBackAndForth",
+    "ShrinkAndGrow",
+    "ShrinkAndGrowMultiple",
+    "ShrinkAndGrowMultipleMoving",
+    "Snail",
+    "SnailMultiple",
+    "Scanner",
+]
+
+for name in EFFECTS:
+    backend = SimulatorBackend()
+    led_strip = NEOPIXEL(15, NUM_LEDS, backend=backend)
+    effect = getattr(producers, name)()
+    period_ms = effect.period * 1000
+    frame = 0
+    start = ticks_ms()
+    while ticks_diff(ticks_ms(), start) < DURATION:
+        effect.next_frame(led_strip, frame * period_ms)
+        led_strip.show()
+        frame += 1
+    report = backend.report()
+    print(
+        "%-30s %6d frames %8.1f fps (wire limit %.1f fps)"
+        % (name, report["frames"], report["fps"], report["max_fps"])
+    )
+    led_strip.deinit()
@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+# Print where the frame time goes for a few effects on a long strip.
+
+from neopixel import NEOPIXEL
+from machine import Pin
+from effects import rainbow_sine, twinkle, scanner
+
+# Create a NeoPixel strip with 300 pixels connected to pin 15, keeping the
+# timings of the last 128 frames
+led_strip = NEOPIXEL(Pin(15), 300, stats_size=128)
+
+for effect in (rainbow_sine, twinkle, scanner):
+    led_strip.frame_stats.reset()
+    effect(led_strip, duration=3)
+    print(effect.__name__)
+    for name, values in led_strip.stats().items():
+        print(
+            "  %-10s min %6d  mean %8.1f  max %6d  p95 %6d"
+            % (
+                name,
+                values["min"],
+                values["mean"],
+                values["max"],
+                values["p95"],
+            )
+        )
+
+# Turn off all the pixels
+led_strip.fill_all(color=(0, 0, 0))
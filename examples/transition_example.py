@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+# Move from one effect to the next with a transition instead of a hard cut.
+
+from neopixel import NEOPIXEL
+from machine import Pin
+from producers import RainbowSine, Scanner, Twinkle, play
+from transition import Transition
+
+# Create a NeoPixel strip with 30 pixels connected to pin 15
+led_strip = NEOPIXEL(Pin(15), 30)
+
+rainbow = RainbowSine()
+scanner = Scanner()
+twinkle = Twinkle(delta_time=0.03)
+
+play(led_strip, rainbow, 5)
+# Blend the rainbow into the scanner over one second
+play(led_strip, Transition(rainbow, scanner, 1.0, "crossfade"), 1.0)
+play(led_strip, scanner, 5)
+# The twinkles replace the scanner from the start of the strip to its end
+play(led_strip, Transition(scanner, twinkle, 1.5, "wipe"), 1.5)
+play(led_strip, twinkle, 5)
+
+# Turn off all the pixels
+led_strip.fill_all(color=(0, 0, 0))
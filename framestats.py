@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`framestats`
+================================================================================
+
+Per frame instrumentation of the NeoPixel output.
+
+For every frame sent :class:`FrameStats` records where the time went: render
+time (from the end of the last frame to :meth:`neopixel.NEOPIXEL.show`, minus
+the time the frame clock slept), pack time, push time (handing the frame to
+the backend) and sleep time, plus the heap allocated over the frame. The
+records are kept in fixed size ring buffers, so measuring does not allocate.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+from array import array
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    # Running on a host computer
+    from simulator import ticks_us, ticks_diff
+
+try:
+    from gc import mem_alloc
+except ImportError:
+    # CPython does not report the heap, the allocation is recorded as 0
+    def mem_alloc() -> int:
+        return 0
+
+
+FIELDS = ("render_us", "pack_us", "push_us", "sleep_us", "alloc")
+
+
+class FrameStats:
+    """
+    Ring buffer with the timings of the last frames sent.
+    :param int size: number of frames kept. Default is 64
+    """
+
+    def __init__(self, size: int = 64) -> None:
+        self.size = size
+        self._rings = [array("l", [0] * size) for _ in FIELDS]
+        self._index = 0
+        self.count = 0
+        self._sleep = 0
+        self._started = 0
+        self._render = 0
+        self._packed = 0
+        self._mark = ticks_us()
+        self._heap = mem_alloc()
+
+    def reset(self) -> None:
+        """
+        Forget the frames recorded.
+        :return: None
+        """
+        self._index = 0
+        self.count = 0
+        self._restart()
+
+    def slept(self, us: int) -> None:
+        """
+        Add time slept by the frame clock to the current frame.
+        :param int us: the time slept in microseconds
+        :return: None
+        """
+        self._sleep += us
+
+    def start(self) -> None:
+        """
+        The frame is rendered, :meth:`neopixel.NEOPIXEL.show` was called.
+        :return: None
+        """
+        self._started = ticks_us()
+        self._render = ticks_diff(self._started, self._mark) - self._sleep
+
+    def packed(self) -> None:
+        """
+        The frame is packed in wire order.
+        :return: None
+        """
+        self._packed = ticks_us()
+
+    def pushed(self) -> None:
+        """
+        The frame was handed to the backend, record it.
+        :return: None
+        """
+        now = ticks_us()
+        heap = mem_alloc()
+        index = self._index
+        rings = self._rings
+        rings[0][index] = max(0, self._render)
+        rings[1][index] = ticks_diff(self._packed, self._started)
+        rings[2][index] = ticks_diff(now, self._packed)
+        rings[3][index] = self._sleep
+        # A garbage collection during the frame makes the difference
+        # negative, the allocation is unknown then
+        rings[4][index] = max(0, heap - self._heap)
+        self._index = (index + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+        self._mark = now
+        self._heap = heap
+        self._sleep = 0
+
+    def skipped(self) -> None:
+        """
+        The frame did not change and was not sent, start the next one.
+        :return: None
+        """
+        self._restart()
+
+    def _restart(self) -> None:
+        self._mark = ticks_us()
+        self._heap = mem_alloc()
+        self._sleep = 0
+
+    def summary(self) -> dict:
+        """
+        Minimum, mean, maximum and 95th percentile of every field over the
+        frames recorded.
+        :return: a dict with one dict per field
+        """
+        result = {}
+        count = self.count
+        for name, ring in zip(FIELDS, self._rings):
+            if not count:
+                result[name] = {"min": 0, "mean": 0, "max": 0, "p95": 0}
+                continue
+            values = sorted(ring[:count])
+            result[name] = {
+                "min": values[0],
+                "mean": sum(values) / count,
+                "max": values[-1],
+                "p95": values[(95 * count + 99) // 100 - 1],
+            }
+        return result
@@ -1,5 +1,10 @@
-import time
 import math
+from array import array
+
+try:
+    from typing import Tuple
+except ImportError:
+    pass
 
 
 def RGBW32(r: int, g: int, b: int, w: int) -> int:
@@ -52,48 +57,150 @@ def white_component(color: int) -> int:
     return (color >> 24) & 0xFF
 
 
-def fade_out(segment, color: int, rate: int) -> int:
-    """Fade out a color by reducing its brightness.
+def buffer_spans(led_object, start: int = 0, end: int = None) -> tuple:
+    """
+    The framebuffer owner and the pixel ranges of it behind a range of a
+    strip or of a segment view.
+    :param led_object: the strip, a :class:`pixelbuffer.PixelBuffer` or a
+     :class:`segment.Segment`
+    :param int start: the first pixel. Default is 0
+    :param int end: the pixel after the last one. Default is num_leds
+    :return: the buffer owner and its (first, end) pixel ranges
+    """
+    if end is None:
+        end = led_object.num_leds
+    spans = ((start, end),)
+    while hasattr(led_object, "ranges"):
+        spans = tuple(
+            span
+            for first, last in spans
+            for span in led_object.ranges(first, last)
+        )
+        led_object = led_object.strip
+    return led_object, spans
+
+
+def nscale8(led_object, scale: int, start: int = 0, end: int = None) -> None:
+    """
+    Scale every channel of a range of pixels. 255 keeps the colors, 128
+    halves them and 0 turns the pixels off.
+    :param led_object: the strip, a :class:`pixelbuffer.PixelBuffer` or a
+     :class:`segment.Segment`
+    :param int scale: the scale (0-255)
+    :param int start: the first pixel. Default is 0
+    :param int end: the pixel after the last one. Default is num_leds
+    :return: None
+    """
+    strip, spans = buffer_spans(led_object, start, end)
+    buffer = strip.buffer
+    bpp = strip.bpp
+    scale += 1
+    for first, last in spans:
+        for offset in range(first * bpp, last * bpp):
+            buffer[offset] = (buffer[offset] * scale) >> 8
+        strip.mark_dirty(first, last)
+
+
+def fade_to_black_by(
+    led_object, amount: int, start: int = 0, end: int = None
+) -> None:
+    """
+    Dim a range of pixels towards black, for the trails of moving effects.
+    :param led_object: the strip, a :class:`pixelbuffer.PixelBuffer` or a
+     :class:`segment.Segment`
+    :param int amount: how much to dim (0-255), 64 takes a quarter off
+    :param int start: the first pixel. Default is 0
+    :param int end: the pixel after the last one. Default is num_leds
+    :return: None
+    """
+    nscale8(led_object, 255 - amount, start, end)
+
+
+def fade_toward_color(
+    led_object, color, amount: int, start: int = 0, end: int = None
+) -> None:
+    """
+    Move a range of pixels towards a color. Every channel covers ``amount``
+    / 256 of its distance to the color, and at least one step, so the color
+    is always reached.
+    :param led_object: the strip, a :class:`pixelbuffer.PixelBuffer` or a
+     :class:`segment.Segment`
+    :param color: the color in (r, g, b) or (r, g, b, w) format, or a packed
+     32-bit color
+    :param int amount: how far to move (0-255)
+    :param int start: the first pixel. Default is 0
+    :param int end: the pixel after the last one. Default is num_leds
+    :return: None
+    """
+    if isinstance(color, int):
+        color = (
+            red_component(color),
+            green_component(color),
+            blue_component(color),
+            white_component(color),
+        )
+    strip, spans = buffer_spans(led_object, start, end)
+    buffer = strip.buffer
+    bpp = strip.bpp
+    target = (tuple(color) + (0, 0, 0, 0))[:bpp]
+    for first, last in spans:
+        for channel in range(bpp):
+            goal = target[channel]
+            for offset in range(first * bpp + channel, last * bpp, bpp):
+                value = buffer[offset]
+                if value < goal:
+                    buffer[offset] = value + (
+                        (((goal - value) * amount) >> 8) or 1
+                    )
+                elif value > goal:
+                    buffer[offset] = value - (
+                        (((value - goal) * amount) >> 8) or 1
+                    )
+        strip.mark_dirty(first, last)
+
+
+def blur1d(led_object, amount: int, start: int = 0, end: int = None) -> None:
+    """
+    Spread every pixel into its two neighbours. Each pixel keeps 255 -
+    ``amount`` of its light and gives half of ``amount`` to each side.
+    :param led_object: the strip, a :class:`pixelbuffer.PixelBuffer` or a
+     :class:`segment.Segment`
+    :param int amount: how much to blur (0-255)
+    :param int start: the first pixel. Default is 0
+    :param int end: the pixel after the last one. Default is num_leds
+    :return: None
+    """
+    keep = 255 - amount
+    seep = amount >> 1
+    strip, spans = buffer_spans(led_object, start, end)
+    buffer = strip.buffer
+    bpp = strip.bpp
+    for first, last in spans:
+        for channel in range(bpp):
+            carry = 0
+            previous = -1
+            for offset in range(first * bpp + channel, last * bpp, bpp):
+                value = buffer[offset]
+                part = (value * seep) >> 8
+                if previous >= 0:
+                    buffer[previous] = min(255, buffer[previous] + part)
+                buffer[offset] = ((value * keep) >> 8) + carry
+                carry = part
+                previous = offset
+        strip.mark_dirty(first, last)
+
+
+def fade_out(segment, color: int, rate: int) -> None:
+    """Fade the pixels of a segment towards a color, one step per call.
+    :param segment: the strip or the :class:`segment.Segment`
     :param int color: 32-bit packed RGBW color
     :param int rate: Fade rate (0-255)
-    :return: Faded color
-    :rtype: int
+    :return: None
     """
     rate = (255 - rate) >> 1
-    mapped_rate = 1.0 / (float(rate) + 1.1)
-
-    w2 = white_component(color)
-    r2 = red_component(color)
-    g2 = green_component(color)
-    b2 = blue_component(color)
-
-    for x in range(segment.length):
-        color_buf = segment.pixel_object[x]
-
-        if color == color_buf:
-            continue  # already at target color
-
-        w1 = white_component(color_buf)
-        r1 = red_component(color_buf)
-        g1 = green_component(color_buf)
-        b1 = blue_component(color_buf)
-
-        w_delta = int((w2 - w1) * mapped_rate)
-        r_delta = int((r2 - r1) * mapped_rate)
-        g_delta = int((g2 - g1) * mapped_rate)
-        b_delta = int((b2 - b1) * mapped_rate)
-
-        # if fade isn't complete, make sure delta is at least 1 (fixes rounding issues)
-        w_delta += 0 if w2 == w1 else 1 if w2 > w1 else -1
-        r_delta += 0 if r2 == r1 else 1 if r2 > r1 else -1
-        g_delta += 0 if g2 == g1 else 1 if g2 > g1 else -1
-        b_delta += 0 if b2 == b1 else 1 if b2 > b1 else -1
-
-        total = RGBW32(r1 + r_delta, g1 + g_delta, b1 + b_delta, w1 + w_delta)
-
-        segment.pixel_object[x] = total
-
-        time.sleep(0.1)
+    # Each step covers 1 / (rate + 1.1) of the distance left, rounded up
+    amount = min(255, -(-2560 // (10 * rate + 11)))
+    fade_toward_color(segment, color, amount)
 
 
 def lerp8by8(a, b, frac):
@@ -164,7 +271,180 @@ def hsv_to_rgb(
         return val, chroma1, chroma2
 
 
-def colorwheel(color_value: int) -> tuple:
+def _rainbow_hue(hue: int) -> tuple:
+    """
+    Fully saturated color of a hue on the rainbow wheel: eight sections of
+    32 hues, red, orange, yellow, green, aqua, blue, purple and pink, so
+    yellow and orange get more room than on the spectrum.
+    :param int hue: the hue (0-255)
+    :return: the color in (r, g, b) format
+    """
+    offset = (hue & 0x1F) << 3
+    third = (offset * 85) >> 8
+    twothirds = (offset * 170) >> 8
+    section = hue >> 5
+    if section == 0:
+        return 255 - third, third, 0
+    if section == 1:
+        return 171, 85 + third, 0
+    if section == 2:
+        return 171 - twothirds, 170 + third, 0
+    if section == 3:
+        return 0, 255 - third, third
+    if section == 4:
+        return 0, 171 - twothirds, 85 + twothirds
+    if section == 5:
+        return third, 0, 255 - third
+    if section == 6:
+        return 85 + third, 0, 171 - third
+    return 170 + third, 0, 85 - third
+
+
+def _spectrum_hue(hue: int) -> tuple:
+    """
+    Fully saturated color of a hue on the spectrum wheel: six sections of
+    the same size, as :func:`hsv_to_rgb` does.
+    :param int hue: the hue (0-255)
+    :return: the color in (r, g, b) format
+    """
+    position = hue * 6
+    section = position >> 8
+    rising = position & 0xFF
+    falling = 255 - rising
+    if section == 0:
+        return 255, rising, 0
+    if section == 1:
+        return falling, 255, 0
+    if section == 2:
+        return 0, 255, rising
+    if section == 3:
+        return 0, falling, 255
+    if section == 4:
+        return rising, 0, 255
+    return 255, 0, falling
+
+
+# Fully saturated colors of the 256 hues, three bytes per hue
+HUE_TABLES = {}
+for _name, _hue_color in (
+    ("rainbow", _rainbow_hue),
+    ("spectrum", _spectrum_hue),
+):
+    _table = bytearray(768)
+    for _hue in range(256):
+        _table[_hue * 3 : _hue * 3 + 3] = bytes(_hue_color(_hue))
+    HUE_TABLES[_name] = bytes(_table)
+
+
+def hsv2rgb(
+    hue: int, sat: int = 255, val: int = 255, variant: str = "rainbow"
+) -> tuple:
+    """
+    Convert an 8-bit HSV color to RGB with integer math.
+    :param int hue: the hue (0-255)
+    :param int sat: the saturation (0-255). Default is 255
+    :param int val: the value (0-255). Default is 255
+    :param str variant: the hue wheel, "rainbow" or "spectrum". Default is
+     "rainbow"
+    :raises ValueError: if the variant is not "rainbow" or "spectrum"
+    :return: the color in (r, g, b) format
+    """
+    if variant not in HUE_TABLES:
+        raise ValueError("Invalid variant %s" % variant)
+    table = HUE_TABLES[variant]
+    index = (hue & 0xFF) * 3
+    red = table[index]
+    green = table[index + 1]
+    blue = table[index + 2]
+    if sat != 255:
+        # Move the channels towards white
+        sat += 1
+        floor = 256 - sat
+        red = ((red * sat) >> 8) + floor
+        green = ((green * sat) >> 8) + floor
+        blue = ((blue * sat) >> 8) + floor
+    if val != 255:
+        val += 1
+        red = (red * val) >> 8
+        green = (green * val) >> 8
+        blue = (blue * val) >> 8
+    return red, green, blue
+
+
+def hue_table(
+    sat: int = 255, val: int = 255, variant: str = "rainbow"
+) -> bytes:
+    """
+    The colors of the 256 hues for a saturation and a value, 3 bytes (r, g,
+    b) per hue. Effects with a fixed saturation and value build it once and
+    give it to :func:`fill_hues`.
+    :param int sat: the saturation (0-255). Default is 255
+    :param int val: the value (0-255). Default is 255
+    :param str variant: the hue wheel, "rainbow" or "spectrum". Default is
+     "rainbow"
+    :raises ValueError: if the variant is not "rainbow" or "spectrum"
+    :return: the table
+    """
+    if variant not in HUE_TABLES:
+        raise ValueError("Invalid variant %s" % variant)
+    if sat == 255 and val == 255:
+        return HUE_TABLES[variant]
+    table = bytearray(768)
+    for hue in range(256):
+        table[hue * 3 : hue * 3 + 3] = bytes(hsv2rgb(hue, sat, val, variant))
+    return bytes(table)
+
+
+def fill_hues(
+    led_object,
+    hues,
+    start: int = 0,
+    sat: int = 255,
+    val: int = 255,
+    variant: str = "rainbow",
+    table: bytes = None,
+) -> None:
+    """
+    Fill a range of a framebuffer with one hue per pixel.
+    :param led_object: the strip, a :class:`pixelbuffer.PixelBuffer` or a
+     :class:`segment.Segment`
+    :param hues: the hues (0-255), a bytearray or any sequence of integers
+    :param int start: the first pixel to fill. Default is 0
+    :param int sat: the saturation of every pixel (0-255). Default is 255
+    :param int val: the value of every pixel (0-255). Default is 255
+    :param str variant: the hue wheel, "rainbow" or "spectrum". Default is
+     "rainbow"
+    :param bytes table: the colors of the hues built by :func:`hue_table`,
+     then ``sat``, ``val`` and ``variant`` are not used. Default is None
+    :raises ValueError: if the variant is not "rainbow" or "spectrum"
+    :return: None
+    """
+    if table is None:
+        table = hue_table(sat, val, variant)
+
+    buffer = getattr(led_object, "buffer", None)
+    if buffer is None:
+        # Views over a framebuffer draw pixel by pixel
+        set_rgb = led_object.set_rgb
+        for index, hue in enumerate(hues):
+            hue *= 3
+            set_rgb(start + index, table[hue], table[hue + 1], table[hue + 2])
+        return
+
+    bpp = led_object.bpp
+    offset = start * bpp
+    for hue in hues:
+        hue *= 3
+        buffer[offset] = table[hue]
+        buffer[offset + 1] = table[hue + 1]
+        buffer[offset + 2] = table[hue + 2]
+        if bpp == 4:
+            buffer[offset + 3] = 0
+        offset += bpp
+    led_object.mark_dirty(start, start + len(hues))
+
+
+def _colorwheel(color_value: int) -> tuple:
     """
     Author(s): Kattni Rembor, Carter Nelson
     A colorwheel. ``0`` and ``255`` are red, ``85`` is green, and ``170`` is blue, with the values
@@ -193,3 +473,81 @@ def colorwheel(color_value: int) -> tuple:
         green = 0
         blue = int(255 - color_value * 3)
     return (red, green, blue)
+
+
+# The colorwheel of the 256 values, packed as 0x00RRGGBB
+COLORWHEEL = array(
+    "L", [RGBW32(*_colorwheel(_value), 0) for _value in range(256)]
+)
+
+
+def colorwheel(color_value: int) -> tuple:
+    """
+    A colorwheel. ``0`` and ``255`` are red, ``85`` is green, and ``170`` is
+    blue, with the values between being the rest of the rainbow. Read from
+    a table built once.
+
+    :param int color_value: 0-255 of color value to return
+    :return: tuple of RGB values
+    """
+    color_value = int(color_value)
+    if color_value < 0 or color_value > 255:
+        return (0, 0, 0)
+    packed = COLORWHEEL[color_value]
+    return ((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
+
+
+def fill_rainbow(
+    led_object,
+    start_hue: int = 0,
+    delta_hue: int = 8,
+    val: int = 255,
+    start: int = 0,
+    end: int = None,
+) -> None:
+    """
+    Fill a range of a framebuffer with the colorwheel, moving ``delta_hue``
+    along the wheel from one pixel to the next. Moving ``start_hue`` from a
+    frame to the next animates the rainbow without copying any color list.
+    :param led_object: the strip, a :class:`pixelbuffer.PixelBuffer` or a
+     :class:`segment.Segment`
+    :param int start_hue: colorwheel value of the first pixel (0-255).
+     Default is 0
+    :param int delta_hue: colorwheel step between two pixels. Default is 8,
+     the whole wheel every 32 pixels
+    :param int val: brightness of the colors (0-255). Default is 255
+    :param int start: the first pixel to fill. Default is 0
+    :param int end: the pixel after the last one. Default is num_leds
+    :return: None
+    """
+    if end is None:
+        end = led_object.num_leds
+    wheel = COLORWHEEL
+    scale = val + 1
+    hue = start_hue
+
+    buffer = getattr(led_object, "buffer", None)
+    if buffer is None:
+        # Views over a framebuffer draw pixel by pixel
+        set_rgb = led_object.set_rgb
+        for index in range(start, end):
+            packed = wheel[hue & 0xFF]
+            set_rgb(
+                index,
+                (((packed >> 16) & 0xFF) * scale) >> 8,
+                (((packed >> 8) & 0xFF) * scale) >> 8,
+                ((packed & 0xFF) * scale) >> 8,
+            )
+            hue += delta_hue
+        return
+
+    bpp = led_object.bpp
+    for offset in range(start * bpp, end * bpp, bpp):
+        packed = wheel[hue & 0xFF]
+        buffer[offset] = (((packed >> 16) & 0xFF) * scale) >> 8
+        buffer[offset + 1] = (((packed >> 8) & 0xFF) * scale) >> 8
+        buffer[offset + 2] = ((packed & 0xFF) * scale) >> 8
+        if bpp == 4:
+            buffer[offset + 3] = 0
+        hue += delta_hue
+    led_object.mark_dirty(start, end)
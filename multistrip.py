@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`multistrip`
+================================================================================
+
+Drive several NeoPixel strips in parallel, one PIO state machine per pin.
+
+Each strip gets its own :class:`neopixel.NEOPIXEL` with its own framebuffer,
+on the first free state machine of either PIO block. With the default DMA
+backend :meth:`MultiStrip.show_all` starts every output back to back, so all
+the strips refresh in the wire time of the longest one.
+
+On a host computer the ``simulator`` stand-ins take the place of the state
+machines and DMA channels.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+from neopixel import NEOPIXEL
+from backends import DMABackend, STATE_MACHINES
+
+
+class MultiStrip:
+    """
+    Manage one NeoPixel output per pin.
+    :param list pins: the pins where the strips are connected
+    :param num_leds: the number of NeoPixels, an int for all the strips or a
+     list with one value per pin
+    :param backend: the backend class used for every output. Default is
+     :class:`backends.DMABackend`
+    :param kwargs: other arguments given to every :class:`neopixel.NEOPIXEL`
+    :raises ValueError: if there are more pins than state machines
+    """
+
+    def __init__(self, pins: list, num_leds, backend=DMABackend, **kwargs):
+        if len(pins) > STATE_MACHINES:
+            raise ValueError(
+                "At most %d strips can be driven" % STATE_MACHINES
+            )
+        if isinstance(num_leds, int):
+            num_leds = [num_leds] * len(pins)
+
+        self.strips = []
+        for pin, length in zip(pins, num_leds):
+            self.strips.append(
+                NEOPIXEL(pin, length, backend=backend(), **kwargs)
+            )
+
+    def __len__(self) -> int:
+        return len(self.strips)
+
+    def __getitem__(self, index: int) -> NEOPIXEL:
+        return self.strips[index]
+
+    def __iter__(self):
+        return iter(self.strips)
+
+    def fill_all(self, color: tuple) -> None:
+        """
+        Fill the framebuffer of every strip with one color.
+        :param tuple color: the color in (r, g, b) format
+        :return: None
+        """
+        for strip in self.strips:
+            strip.fill(color)
+
+    def show_all(self) -> None:
+        """
+        Send the frame of every strip. With an asynchronous backend the
+        transfers are started one after the other and run at the same time.
+        :return: None
+        """
+        for strip in self.strips:
+            strip.show()
+
+    def busy(self) -> bool:
+        """
+        Tell if any strip is still sending its frame.
+        :return: True while a strip is sending
+        """
+        for strip in self.strips:
+            if strip.busy():
+                return True
+        return False
+
+    def wait(self) -> None:
+        """
+        Wait until every strip has sent its frame.
+        :return: None
+        """
+        for strip in self.strips:
+            strip.wait()
+
+    def deinit(self) -> None:
+        """
+        Stop every output and release the state machines.
+        :return: None
+        """
+        for strip in self.strips:
+            strip.deinit()
+        self.strips = []
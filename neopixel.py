@@ -22,11 +22,21 @@ Only tested with a Raspberry Pi Pico and a 16 NeoPixel ring.
 """
 
 
-from machine import Pin
-import rp2
-import time
-from math import log, e, sin
-from colors import BLACK, PURPLE
+try:
+    import rp2
+except ImportError:
+    # Running on a host computer, use the recording stand-ins
+    import simulator as rp2
+from colors import PURPLE
+from backends import PIOBackend
+from clock import FrameClock
+from framestats import FrameStats
+from pixelbuffer import PixelBuffer
+
+try:
+    from binascii import crc32
+except ImportError:
+    crc32 = None
 
 
 try:
@@ -35,42 +45,156 @@ except ImportError:
     pass
 
 
-class NEOPIXEL:
-    def __init__(self, pin: int, num_leds: int) -> None:
+# Channels in the framebuffer, in this order. A pixel order such as "GRB"
+# tells in which order they are sent on the wire
+_CHANNELS = "RGBW"
+
+
+def _pack3(buffer, wire, lut, first: int, last: int, order: tuple) -> None:
+    """
+    Pack a range of 3 byte pixels, without brightness or gamma.
+    :param bytearray buffer: the framebuffer
+    :param bytearray wire: the wire buffer
+    :param bytearray lut: the brightness and gamma table, not used
+    :param int first: first byte to pack
+    :param int last: byte after the last one to pack
+    :param tuple order: framebuffer offset of each byte sent
+    :return: None
+    """
+    a, b, c = order
+    for i in range(first, last, 3):
+        wire[i] = buffer[i + a]
+        wire[i + 1] = buffer[i + b]
+        wire[i + 2] = buffer[i + c]
+
+
+def _pack3_lut(buffer, wire, lut, first: int, last: int, order: tuple) -> None:
+    """
+    Pack a range of 3 byte pixels through the brightness and gamma table.
+    :return: None
+    """
+    a, b, c = order
+    for i in range(first, last, 3):
+        wire[i] = lut[buffer[i + a]]
+        wire[i + 1] = lut[buffer[i + b]]
+        wire[i + 2] = lut[buffer[i + c]]
+
+
+def _pack4(buffer, wire, lut, first: int, last: int, order: tuple) -> None:
+    """
+    Pack a range of 4 byte pixels, without brightness or gamma.
+    :return: None
+    """
+    a, b, c, d = order
+    for i in range(first, last, 4):
+        wire[i] = buffer[i + a]
+        wire[i + 1] = buffer[i + b]
+        wire[i + 2] = buffer[i + c]
+        wire[i + 3] = buffer[i + d]
+
+
+def _pack4_lut(buffer, wire, lut, first: int, last: int, order: tuple) -> None:
+    """
+    Pack a range of 4 byte pixels through the brightness and gamma table.
+    :return: None
+    """
+    a, b, c, d = order
+    for i in range(first, last, 4):
+        wire[i] = lut[buffer[i + a]]
+        wire[i + 1] = lut[buffer[i + b]]
+        wire[i + 2] = lut[buffer[i + c]]
+        wire[i + 3] = lut[buffer[i + d]]
+
+
+# Packer for each (bytes per pixel, identity table) pair
+_PACKERS = {
+    (3, True): _pack3,
+    (3, False): _pack3_lut,
+    (4, True): _pack4,
+    (4, False): _pack4_lut,
+}
+
+
+class NEOPIXEL(PixelBuffer):
+    def __init__(
+        self,
+        pin: int,
+        num_leds: int,
+        bulk: bool = True,
+        backend=None,
+        double_buffer: bool = False,
+        brightness: int = 255,
+        gamma: float = None,
+        pixel_order: str = "GRB",
+        stats_size: int = 64,
+    ) -> None:
         """
         Initialize the NeoPixels.
         :param int pin: the pin number where the NeoPixels are connected
         :param int num_leds: the number of NeoPixels
+        :param bool bulk: pack the frame and send it with a single ``put``.
+         Set to False to push the pixels one by one. Default is True
+        :param backend: the output backend. Default is None, a blocking
+         :class:`backends.PIOBackend` on the first free state machine. Use
+         :class:`backends.DMABackend` to let :meth:`show` return while the
+         frame is sent
+        :param bool double_buffer: keep a front buffer with the last frame
+         shown. Effects render into the back buffer and :meth:`show` swaps
+         them before sending. Default is False
+        :param int brightness: global brightness (0-255). Default is 255
+        :param float gamma: gamma correction exponent, for example 2.6.
+         Default is None, no correction
+        :param str pixel_order: the order the strip expects the colors in,
+         "GRB" for WS2812, "RGB", "BGR" and any other order of the three
+         channels, or one with a W channel such as "GRBW" for SK6812 RGBW
+         strips. Default is "GRB"
+        :param int stats_size: number of frames kept by the instrumentation,
+         see :meth:`stats`. Default is 64, 0 switches it off
+        :raises ValueError: if the pixel order is not valid
         :return: None
 
         """
-        # TODO verify color format
-
+        order = pixel_order.upper()
+        channels = _CHANNELS[: len(order)]
+        if len(order) not in (3, 4) or set(order) != set(channels):
+            raise ValueError("Invalid pixel order %s" % pixel_order)
+
+        # Preallocated framebuffer, 3 bytes (r, g, b) per pixel or 4 bytes
+        # (r, g, b, w) for RGBW strips. Effects write into it in place so no
+        # frame allocates new pixel objects. Pixels changed since the last
+        # frame sent are kept as a dirty range: writes that do not change a
+        # pixel leave it clean, so unchanged frames are skipped by show()
+        super().__init__(num_leds, len(order))
         self.pin = pin
-        self.num_leds = num_leds
         self.palette_colors = None
-
-        self.neopixel_list = []
-        for i in range(num_leds):
-            self.neopixel_list.append(BLACK)
-        self.neopixel_list_brightness = None
-
-        self.brightness_values = [
-            0.1,
-            0.2,
-            0.3,
-            0.4,
-            0.5,
-            0.6,
-            0.7,
-            0.8,
-            0.9,
-            1.0,
-        ]
-        y = list(self.linspace(0, 255, 10))
-        self._brightnes_normalized = [
-            int((e ** (log(255) / 255)) ** _) for _ in y
-        ]
+        self.pixel_order = order
+        # Framebuffer offset of each byte sent on the wire
+        self._order = tuple(_CHANNELS.index(channel) for channel in order)
+        # With double buffering the back buffer is ``buffer`` and the last
+        # frame shown stays in ``front``
+        self.double_buffer = double_buffer
+        self.front = bytearray(num_leds * self.bpp) if double_buffer else None
+        # Frame packed in wire order, one byte per FIFO word
+        self.bulk = bulk
+        self._wire = bytearray(num_leds * self.bpp)
+        if backend is None:
+            backend = PIOBackend()
+        self.backend = backend
+        if backend.asynchronous:
+            # The backend reads one wire buffer while the next one is packed
+            self._wire_spare = bytearray(num_leds * self.bpp)
+
+        self._sent_crc = None
+        self.frames_sent = 0
+        self.frames_skipped = 0
+        # Timings of the last frames sent, None when switched off
+        self.frame_stats = FrameStats(stats_size) if stats_size else None
+        # Brightness and gamma are folded into one lookup table applied
+        # while packing, rebuilt only when one of them changes
+        self._brightness = brightness
+        self._gamma = gamma
+        self._lut = bytearray(256)
+        self._build_lut()
 
         self._initialize()
 
@@ -78,7 +202,7 @@ class NEOPIXEL:
         sideset_init=rp2.PIO.OUT_HIGH,
         out_shiftdir=rp2.PIO.SHIFT_LEFT,
         autopull=True,
-        pull_thresh=24,
+        pull_thresh=8,
     )
     def neo_prog():
         """
@@ -99,48 +223,216 @@ class NEOPIXEL:
 
     def ShowNeoPixels(self, led_list) -> None:
         """
-        each pixel is the tuple (r, g, b)
+        each pixel is the tuple (r, g, b), or (r, g, b, w) for RGBW strips
         adapted from https://toptechboy.com/page/2/ Paul McWhorter
+        The pixels after the end of the list keep the framebuffer colors, and
+        the next :meth:`show` sends the whole framebuffer again.
         :param pixels: list of pixels
         :return: None
         """
-        for color in led_list:
-            grb = color[1] << 16 | color[0] << 8 | color[2]  # Green, Red, Blue
-            self.sm.put(grb, 8)
+        self.backend.wait()
+        wire = self._wire
+        lut = self._lut
+        bpp = self.bpp
+        order = self._order
+        count = min(len(led_list), self.num_leds)
+        for i in range(count):
+            color = led_list[i]
+            if len(color) < bpp:
+                color = (color[0], color[1], color[2], 0)
+            offset = i * bpp
+            for position in range(bpp):
+                wire[offset + position] = lut[color[order[position]]]
+        self._pack(count, self.num_leds)
+        self.backend.transmit(wire)
+        # The strip no longer shows the framebuffer, nor the wire buffer
+        self._sent_crc = None
+        self.mark_dirty()
+
+    def show(self) -> None:
+        """
+        Send the framebuffer to the NeoPixels. With an asynchronous backend
+        this returns as soon as the transfer has started. If the frame did
+        not change since the last one sent nothing is packed nor sent, and
+        ``frames_skipped`` is increased.
+        :return: None
+        """
+        frame_stats = self.frame_stats
+        if frame_stats is not None:
+            frame_stats.start()
+        start = self._dirty_start
+        end = self._dirty_end
+        if self.double_buffer:
+            # The back buffer is compared with the frame sent through its
+            # checksum, the dirty range only covers the back buffer
+            crc = crc32(self.buffer) if crc32 is not None else None
+            if crc is not None and crc == self._sent_crc:
+                self.frames_skipped += 1
+                if frame_stats is not None:
+                    frame_stats.skipped()
+                return
+            self._sent_crc = crc
+            self.swap()
+            start = 0
+            end = self.num_leds
+        elif start >= end:
+            self.frames_skipped += 1
+            if frame_stats is not None:
+                frame_stats.skipped()
+            return
+        self.clean()
+        self.frames_sent += 1
+
+        if not self.bulk:
+            if frame_stats is not None:
+                frame_stats.packed()
+            self.backend.wait()
+            self._show_per_pixel()
+        else:
+            if self.backend.asynchronous:
+                # The spare buffer holds an older frame, pack all of it
+                self._wire, self._wire_spare = self._wire_spare, self._wire
+                start = 0
+                end = self.num_leds
+            self._pack(start, end)
+            if frame_stats is not None:
+                frame_stats.packed()
+            self.backend.transmit(self._wire)
+        if frame_stats is not None:
+            frame_stats.pushed()
+
+    def stats(self) -> dict:
+        """
+        Timings of the last frames sent: render, pack, push and sleep time in
+        microseconds and heap allocated in bytes, each with its minimum, mean,
+        maximum and 95th percentile.
+        :return: a dict with one dict per field, empty if the instrumentation
+         is off
+        """
+        if self.frame_stats is None:
+            return {}
+        return self.frame_stats.summary()
+
+    def swap(self) -> None:
+        """
+        Exchange the front and back buffers, then bring the new back buffer
+        up to date with the frame moved to the front. The two frames only
+        differ by the pixels changed since the last swap, so only those are
+        copied, and effects go on drawing over their last frame.
+        :return: None
+        """
+        self.buffer, self.front = self.front, self.buffer
+        bpp = self.bpp
+        first = self._dirty_start * bpp
+        last = self._dirty_end * bpp
+        if first < last:
+            self.buffer[first:last] = memoryview(self.front)[first:last]
+
+    @property
+    def shown(self) -> bytearray:
+        """
+        The framebuffer holding the frame being shown.
+        """
+        return self.front if self.double_buffer else self.buffer
+
+    def busy(self) -> bool:
+        """
+        Tell if the last frame is still being sent.
+        :return: True while the backend is sending
+        """
+        return self.backend.busy()
+
+    def wait(self) -> None:
+        """
+        Wait until the last frame has been sent.
+        :return: None
+        """
+        self.backend.wait()
+
+    def _pack(self, start: int = 0, end: int = None) -> None:
+        """
+        Copy a range of the framebuffer into the wire buffer in the pixel
+        order of the strip.
+        :param int start: first pixel to pack. Default is 0
+        :param int end: pixel after the last one to pack. Default is num_leds
+        :return: None
+        """
+        if end is None:
+            end = self.num_leds
+        bpp = self.bpp
+        self._packer(
+            self.shown,
+            self._wire,
+            self._lut,
+            start * bpp,
+            end * bpp,
+            self._order,
+        )
+
+    def _show_per_pixel(self) -> None:
+        """
+        Push the framebuffer to the state machine one pixel at a time.
+        Slower than :meth:`show` but it does not need the wire buffer.
+        :return: None
+        """
+        buffer = self.shown
+        lut = self._lut
+        order = self._order
+        put = self.backend.put
+        for i in range(0, len(buffer), self.bpp):
+            for offset in order:
+                put(lut[buffer[i + offset]])
+        self.backend.latch()
+
+    @property
+    def neopixel_list(self) -> list:
+        """
+        Copy of the framebuffer as a list of (r, g, b) tuples, or (r, g, b, w)
+        tuples for RGBW strips.
+        """
+        return [self.get_pixel(i) for i in range(self.num_leds)]
+
+    @neopixel_list.setter
+    def neopixel_list(self, led_list: list) -> None:
+        for i, color in enumerate(led_list):
+            self.set_pixel(i, color)
 
     def _initialize(self) -> None:
         """
         Initialize the NeoPixels state machine.
         :return: None
         """
-        self.sm = rp2.StateMachine(
-            0,
-            self.neo_prog,
-            freq=8_000_000,
-            sideset_base=Pin(self.pin),
-        )
-        self.sm.active(1)
+        self.backend.begin(self.neo_prog, 8_000_000, sideset_base=self.pin)
+        self.sm = self.backend.sm
         self.fill_all(color=PURPLE)
 
+    def deinit(self) -> None:
+        """
+        Stop the output and release its state machine.
+        :return: None
+        """
+        self.backend.close()
+
     def fill_all(
         self,
-        duration: int = 0.1,
+        duration: float = 0.0,
         time_delta: float = 0.0,
         color: tuple = (255, 0, 0),
     ) -> None:
         """
-        Cycle through the rainbow colors.
-        :param int duration: duration in seconds: default 5 seconds
-        :param float time_delta: time delay between each color change: default 0.1 seconds
+        Fill all the NeoPixels with one color. The frame is sent once, and
+        the call returns right away unless a duration is given.
+        :param float duration: time to keep the color in seconds. Default is
+         0, do not wait
+        :param float time_delta: not used, kept for compatibility. The color
+         does not change, so it is not sent again
         :param tuple color: the color to fill. Default is (255, 0, 0) i.e. red
         :return: None
         """
-        start_time = time.time()
-        while time.time() - start_time < duration:
-            # Set all pixels to the same color
-            self.neopixel_list = [color] * self.num_leds
-            self.ShowNeoPixels(self.neopixel_list)
-            time.sleep(time_delta)
+        self.fill(color)
+        self.show()
+        if duration > 0:
+            FrameClock(duration, duration, self.frame_stats).tick()
 
     def sequence(
         self, colors: list, delta_time: int = 0.1, duration: int = 5
@@ -152,12 +444,14 @@ class NEOPIXEL:
         :param int duration: duration in seconds. Default is 5 seconds
         :return: None
         """
-        start_time = time.time()
-        while time.time() - start_time < duration:
+        clock = FrameClock(delta_time, duration, self.frame_stats)
+        while clock.running():
             for color in colors:
-                self.neopixel_list = [color] * self.num_leds
-                self.ShowNeoPixels(self.neopixel_list)
-                time.sleep(delta_time)
+                if not clock.running():
+                    return
+                self.fill(color)
+                self.show()
+                clock.tick()
 
     def fill_custom(
         self, color_list: list, dwell: float = 0.5, duration: int = 5
@@ -168,36 +462,63 @@ class NEOPIXEL:
         :param int duration: duration in seconds. Default is 5 seconds
         :return: None
         """
-        start_time = time.time()
-        while time.time() - start_time < duration:
+        clock = FrameClock(dwell, duration, self.frame_stats)
+        while clock.running():
             for i in range(self.num_leds):
-                self.neopixel_list[i] = color_list[i]
-            self.ShowNeoPixels(self.neopixel_list)
-            time.sleep(dwell)
+                self.set_pixel(i, color_list[i])
+            self.show()
+            clock.tick()
 
-    def brightness(self, brightness: float = 1.0) -> None:
+    @property
+    def brightness(self) -> int:
+        """
+        Global brightness of the NeoPixels (0-255). Applied when the frame
+        is packed, so the framebuffer keeps the full colors.
+        """
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, value: int) -> None:
+        if not 0 <= value <= 255:
+            raise ValueError("Brightness must be between 0 and 255")
+        value = int(value)
+        if value != self._brightness:
+            self._brightness = value
+            self._build_lut()
+
+    @property
+    def gamma(self) -> float:
+        """
+        Gamma correction exponent, None to disable the correction.
         """
-        Set the brightness of the NeoPixels.
-        :param float brightness: the brightness value. Default is 1.0
+        return self._gamma
+
+    @gamma.setter
+    def gamma(self, value: float) -> None:
+        if value != self._gamma:
+            self._gamma = value
+            self._build_lut()
+
+    def _build_lut(self) -> None:
+        """
+        Build the lookup table from the brightness and gamma settings, and
+        flag the whole frame to be sent again.
         :return: None
-        :raises ValueError: if the brightness value is not in the list of valid values
-        """
-        if brightness not in self.brightness_values:
-            raise ValueError(
-                "Brightness must be one of 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0"
-            )
-
-        a = self.brightness_values.index(brightness)
-        normalized_brightness = self._brightnes_normalized[a] / 255.0
-        new_neopixel_list = [
-            (
-                int(r * normalized_brightness),
-                int(g * normalized_brightness),
-                int(b * normalized_brightness),
-            )
-            for (r, g, b) in self.neopixel_list
-        ]
-        self.ShowNeoPixels(new_neopixel_list)
+        """
+        brightness = self._brightness
+        gamma = self._gamma
+        lut = self._lut
+        for value in range(256):
+            if gamma is None:
+                lut[value] = (value * brightness + 127) // 255
+            else:
+                lut[value] = int((value / 255) ** gamma * brightness + 0.5)
+        self._lut_identity = brightness == 255 and gamma is None
+        # The packer is picked here so packing a frame never checks the
+        # pixel format nor the table
+        self._packer = _PACKERS[(self.bpp, self._lut_identity)]
+        self.mark_dirty()
+        self._sent_crc = None
 
     @staticmethod
     def linspace(start: int, stop: int, n: int):
@@ -222,18 +543,22 @@ class NEOPIXEL:
         animation: str = "fade",
     ):
         """
-        Get led segments
+        Give one color to each segment of the strip and move the colors one
+        segment ahead every 1.5 seconds: each color stays 1 second and takes
+        0.5 seconds to move
         :param int segment_length: the segment length
-        :param list values: the values
+        :param list values: one color per segment
         :param int duration: duration in seconds. Default is 5 seconds
-        :return: the segments
+        :param str animation: the transition, "fade" or "wipe". Default is
+         "fade"
+        :return: None
         """
 
         from effects import segment_animated_effect
 
         segment_animated_effect(
             self,
-            self.neopixel_list,
+            None,
             self.num_leds,
             duration,
             segment_length,
@@ -243,18 +568,18 @@ class NEOPIXEL:
 
     def segment(self, segment_length: int, values: list, duration: int = 5):
         """
-        Get led segments
+        Give one color to each segment of the strip
         :param int segment_length: the segment length
-        :param list values: the values
+        :param list values: one color per segment
         :param int duration: duration in seconds. Default is 5 seconds
-        :return: the segments
+        :return: None
         """
 
         from effects import segment_effect
 
         segment_effect(
             self,
-            self.neopixel_list,
+            None,
             self.num_leds,
             duration,
             segment_length,
@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`pixelbuffer`
+================================================================================
+
+Framebuffer with the drawing methods shared by the NeoPixel output and the
+scratch buffers effects render into.
+
+Pixels are stored in a preallocated bytearray, 3 bytes (r, g, b) or 4 bytes
+(r, g, b, w) per pixel. Writes that change a pixel extend a dirty range, so
+the owner can tell which part of the buffer changed since it was last used.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+from functions import (
+    red_component,
+    green_component,
+    blue_component,
+    white_component,
+)
+
+
+class PixelBuffer:
+    """
+    A framebuffer that effects can draw into.
+    :param int num_leds: the number of pixels
+    :param int bpp: bytes per pixel, 3 for RGB or 4 for RGBW. Default is 3
+    """
+
+    def __init__(self, num_leds: int, bpp: int = 3) -> None:
+        self.num_leds = num_leds
+        self.bpp = bpp
+        self.buffer = bytearray(num_leds * bpp)
+        # Pixels changed since the buffer was last used, as [start, end)
+        self._dirty_start = 0
+        self._dirty_end = num_leds
+        self._fill_color = None
+
+    @property
+    def changed(self) -> bool:
+        """
+        True if a pixel changed since :meth:`clean` was called.
+        """
+        return self._dirty_start < self._dirty_end
+
+    @property
+    def dirty(self) -> tuple:
+        """
+        The pixels changed since :meth:`clean` was called, as a (start, end)
+        range, empty when nothing changed.
+        """
+        return self._dirty_start, self._dirty_end
+
+    def clean(self) -> None:
+        """
+        Forget the changes, once the owner has used the buffer.
+        :return: None
+        """
+        self._dirty_start = self.num_leds
+        self._dirty_end = 0
+
+    def mark_dirty(self, start: int = 0, end: int = None) -> None:
+        """
+        Flag a range of pixels as changed, for code writing straight into
+        :attr:`buffer`. On a NeoPixel output the next ``show`` sends them.
+        :param int start: first pixel changed. Default is 0
+        :param int end: pixel after the last one changed. Default is num_leds
+        :return: None
+        """
+        if end is None:
+            end = self.num_leds
+        if start < self._dirty_start:
+            self._dirty_start = start
+        if end > self._dirty_end:
+            self._dirty_end = end
+        self._fill_color = None
+
+    def __len__(self) -> int:
+        return self.num_leds
+
+    def __getitem__(self, index: int) -> tuple:
+        return self.get_pixel(index)
+
+    def __setitem__(self, index: int, color: tuple) -> None:
+        self.set_pixel(index, color)
+
+    def set_pixel(self, index: int, color) -> None:
+        """
+        Set the color of a pixel in the framebuffer.
+        :param int index: the pixel index
+        :param color: the color in (r, g, b) or (r, g, b, w) format, or a
+         32-bit color packed with :func:`functions.RGBW32`. The white value is
+         ignored by RGB strips
+        :return: None
+        """
+        if isinstance(color, int):
+            self.set_rgb(
+                index,
+                red_component(color),
+                green_component(color),
+                blue_component(color),
+                white_component(color),
+            )
+        elif len(color) > 3:
+            self.set_rgb(index, color[0], color[1], color[2], color[3])
+        else:
+            self.set_rgb(index, color[0], color[1], color[2])
+
+    def set_rgb(self, index: int, r: int, g: int, b: int, w: int = 0) -> None:
+        """
+        Set the color of a pixel in the framebuffer without building a tuple.
+        :param int index: the pixel index
+        :param int r: red value (0-255)
+        :param int g: green value (0-255)
+        :param int b: blue value (0-255)
+        :param int w: white value (0-255), only used by RGBW strips.
+         Default is 0
+        :return: None
+        """
+        if index < 0:
+            index += self.num_leds
+        bpp = self.bpp
+        offset = index * bpp
+        buffer = self.buffer
+        if buffer[offset] == r and buffer[offset + 1] == g:
+            if buffer[offset + 2] == b:
+                if bpp == 3 or buffer[offset + 3] == w:
+                    return
+        buffer[offset] = r
+        buffer[offset + 1] = g
+        buffer[offset + 2] = b
+        if bpp == 4:
+            buffer[offset + 3] = w
+        self._fill_color = None
+        if index < self._dirty_start:
+            self._dirty_start = index
+        if index >= self._dirty_end:
+            self._dirty_end = index + 1
+
+    def get_pixel(self, index: int) -> tuple:
+        """
+        Get the color of a pixel in the framebuffer.
+        :param int index: the pixel index
+        :return: the color in (r, g, b) format, or (r, g, b, w) for RGBW
+         strips
+        """
+        offset = index * self.bpp
+        buffer = self.buffer
+        if self.bpp == 4:
+            return tuple(buffer[offset : offset + 4])
+        return buffer[offset], buffer[offset + 1], buffer[offset + 2]
+
+    def fill(self, color: tuple, start: int = 0, end: int = None) -> None:
+        """
+        Fill a range of the framebuffer with one color.
+        :param color: the color in (r, g, b) or (r, g, b, w) format, or a
+         32-bit color packed with :func:`functions.RGBW32`
+        :param int start: first pixel to fill. Default is 0
+        :param int end: pixel after the last one to fill. Default is num_leds
+        :return: None
+        """
+        if end is None:
+            end = self.num_leds
+        if end <= start:
+            return
+        if isinstance(color, int):
+            color = (
+                red_component(color),
+                green_component(color),
+                blue_component(color),
+                white_component(color),
+            )
+        whole = start == 0 and end == self.num_leds
+        if whole and self._fill_color == color:
+            # Already filled with this color and not touched since
+            return
+        bpp = self.bpp
+        first = start * bpp
+        buffer = self.buffer
+        buffer[first] = color[0]
+        buffer[first + 1] = color[1]
+        buffer[first + 2] = color[2]
+        if bpp == 4:
+            buffer[first + 3] = color[3] if len(color) > 3 else 0
+        # Grow the filled region by copying it onto itself, doubling each pass
+        view = memoryview(buffer)
+        total = (end - start) * bpp
+        filled = bpp
+        while filled < total:
+            chunk = min(filled, total - filled)
+            view[first + filled : first + filled + chunk] = view[
+                first : first + chunk
+            ]
+            filled += chunk
+        self.mark_dirty(start, end)
+        if whole:
+            self._fill_color = tuple(color)
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`prng`
+================================================================================
+
+Small seedable random numbers for the effects.
+
+A 16-bit xorshift generator (shifts 7, 9 and 8) with a period of 65535. It
+only needs shifts and xors on a small integer, so it does not allocate, and
+the same seed gives the same frames on the board and on a computer.
+
+The module functions share one generator, seed it with :func:`seed`.
+Effects that need their own sequence can use a :class:`Xorshift16`.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+
+class Xorshift16:
+    """
+    A 16-bit xorshift generator.
+    :param int seed: the seed, 0 is replaced by another value as the state
+     can not be 0. Default is 0xACE1
+    """
+
+    def __init__(self, seed: int = 0xACE1) -> None:
+        self.state = 0xACE1
+        self.seed(seed)
+
+    def seed(self, value: int) -> None:
+        """
+        Start the sequence again from a seed.
+        :param int value: the seed, only the 16 lower bits are used
+        :return: None
+        """
+        self.state = (value & 0xFFFF) or 0xACE1
+
+    def random16(self) -> int:
+        """
+        The next number of the sequence.
+        :return: a number from 0 to 65535
+        """
+        x = self.state
+        x ^= (x << 7) & 0xFFFF
+        x ^= x >> 9
+        x ^= (x << 8) & 0xFFFF
+        self.state = x
+        return x
+
+    def random8(self, limit: int = 256) -> int:
+        """
+        A random byte, or a number below ``limit``.
+        :param int limit: the numbers are from 0 to ``limit - 1`` (1-256).
+         Default is 256
+        :return: the number
+        """
+        return ((self.random16() >> 8) * limit) >> 8
+
+    def choice(self, sequence):
+        """
+        A random item of a sequence.
+        :param sequence: the sequence, it can not be empty
+        :return: the item
+        """
+        return sequence[(self.random16() * len(sequence)) >> 16]
+
+    def fill(self, buffer, start: int = 0, end: int = None) -> None:
+        """
+        Fill a range of a buffer with random bytes, two bytes per number.
+        :param buffer: the bytearray or memoryview
+        :param int start: first byte to fill. Default is 0
+        :param int end: byte after the last one. Default is the buffer length
+        :return: None
+        """
+        if end is None:
+            end = len(buffer)
+        last = end - 1
+        for index in range(start, last, 2):
+            x = self.random16()
+            buffer[index] = x & 0xFF
+            buffer[index + 1] = x >> 8
+        if (end - start) & 1:
+            buffer[last] = self.random16() >> 8
+
+
+_generator = Xorshift16()
+
+seed = _generator.seed
+random8 = _generator.random8
+random16 = _generator.random16
+choice = _generator.choice
+fill_random = _generator.fill
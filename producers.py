@@ -0,0 +1,1545 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`producers`
+================================================================================
+
+The effects as resumable frame producers.
+
+Each effect is a class whose :meth:`Effect.next_frame` renders exactly one
+frame into a caller supplied buffer, a :class:`neopixel.NEOPIXEL` or any
+:class:`pixelbuffer.PixelBuffer`, for a time ``t`` in milliseconds. The effect
+moves its animation ahead by the number of frame periods elapsed since the
+previous call, so it keeps its speed whatever the caller's frame rate.
+
+Effects only redraw what changes, so the same buffer must be given on every
+call. :func:`play` runs an effect on a strip with a
+:class:`clock.FrameClock`, which is what the functions of :mod:`effects` do.
+
+The tables and buffers an effect needs for a strip are allocated by
+:meth:`Effect.prepare`, on the first frame unless the caller did it ahead,
+like :class:`sequencer.Sequencer` does for the next effect of a playlist.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+import math
+from array import array
+from clock import FrameClock
+from colors import (
+    BLACK,
+    BLUE,
+    RED,
+    PURPLE,
+    CYAN,
+    ORANGE,
+    ORANGEYELLOW,
+    GREEN,
+    YELLOW,
+)
+from functions import fill_hues, fill_rainbow, hue_table, lerp8by8
+from prng import choice, fill_random, random8, random16
+from segment import split
+from trig8 import RADIAN, SIN8, cos16, phase16, sin16, wave_table
+
+
+class Effect:
+    """
+    Base class of the frame producers.
+    :param float period: time between two frames in seconds. Default is 0,
+     every call to :meth:`next_frame` is a new frame
+    """
+
+    def __init__(self, period: float = 0.0) -> None:
+        self.period = period
+        self._frame = None
+        self._origin = 0
+        self._last = 0
+        self._prepared = None
+
+    def reset(self) -> None:
+        """
+        Start the effect again from its first frame.
+        :return: None
+        """
+        self._frame = None
+
+    def next_frame(self, buffer, t: int) -> None:
+        """
+        Render the frame due at time ``t`` into the buffer. The first call
+        renders the first frame of the effect, whatever the value of ``t``.
+        If ``t`` goes back, like when the effect is played again with a new
+        clock, the effect goes on from where it stopped.
+        :param buffer: the buffer to draw into, the same one on every call
+        :param int t: the time in milliseconds
+        :return: None
+        """
+        if self._frame is None:
+            self._origin = t
+            self._last = t
+            self._frame = 0
+            self.prepare(buffer)
+            self.start(buffer)
+            self.render(buffer, 0, 0)
+            return
+
+        if t < self._last:
+            # Another clock, move the origin so the time carries on
+            self._origin += t - self._last
+        self._last = t
+        t -= self._origin
+        if self.period > 0:
+            frame = int(t / (self.period * 1000) + 0.5)
+        else:
+            frame = self._frame + 1
+        steps = max(0, frame - self._frame)
+        self._frame += steps
+        self.render(buffer, steps, t)
+
+    def prepare(self, buffer) -> None:
+        """
+        Allocate the tables and buffers of the effect for a buffer, once.
+        The first frame does it if it was not done before, so calling it
+        ahead keeps the allocations out of that frame.
+        :param buffer: the buffer the effect will draw into
+        :return: None
+        """
+        if self._prepared is not buffer:
+            self._prepared = buffer
+            self.allocate(buffer)
+
+    def allocate(self, buffer) -> None:
+        """
+        Allocate the tables and buffers the effect needs for a buffer, called
+        by :meth:`prepare`.
+        :param buffer: the buffer the effect will draw into
+        :return: None
+        """
+        return
+
+    def start(self, buffer) -> None:
+        """
+        Prepare the first frame, called once before :meth:`render`.
+        :param buffer: the buffer to draw into
+        :return: None
+        """
+        return
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        """
+        Move the animation ahead and draw it.
+        :param buffer: the buffer to draw into
+        :param int steps: frame periods elapsed since the previous frame, 0
+         for the first one
+        :param int t: the time in milliseconds since the first frame
+        :return: None
+        """
+        raise NotImplementedError
+
+
+def play(led_object, effect: Effect, duration: float = 5) -> None:
+    """
+    Show an effect on a strip, paced by a :class:`clock.FrameClock`.
+    :param led_object: led object
+    :param Effect effect: the effect to show
+    :param float duration: duration in seconds. Default is 5 seconds
+    :return: None
+    """
+    clock = FrameClock(effect.period, duration, led_object.frame_stats)
+    while clock.running():
+        effect.next_frame(led_object, clock.elapsed_ms)
+        led_object.show()
+        clock.tick()
+
+
+class Blink(Effect):
+    """
+    Blink the NeoPixels.
+    :param tuple color: the color to blink. Default is RED
+    :param tuple background_color: the background color. Default is BLACK
+    :param float dwell: time of each color in seconds. Default is 0.5
+    """
+
+    def __init__(
+        self,
+        color: tuple = RED,
+        background_color: tuple = BLACK,
+        dwell: float = 0.5,
+    ) -> None:
+        super().__init__(dwell)
+        self.color = color
+        self.background_color = background_color
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        if self._frame % 2:
+            buffer.fill(self.background_color)
+        else:
+            buffer.fill(self.color)
+
+
+class ChasingColor(Effect):
+    """
+    Light the pixels one after the other, cycling through three colors.
+    :param list palette: colors to choose three from. Default is None,
+     RED, GREEN and BLUE
+    :param float time_delta: time each pixel stays off in seconds, it stays
+     on a third of it. Default is 0.1
+    """
+
+    def __init__(self, palette: list = None, time_delta: float = 0.1):
+        # Each pixel is on for one frame and off for three
+        super().__init__(time_delta / 3)
+        if palette is None:
+            self.palette = [RED, GREEN, BLUE]
+        else:
+            buf = list(palette)
+            self.palette = []
+            for _ in range(3):
+                selection = choice(buf)
+                self.palette.append(selection)
+                buf.remove(selection)
+        self._lit = None
+
+    def start(self, buffer) -> None:
+        buffer.fill(BLACK)
+        self._lit = None
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        step = self._frame // 4
+        if self._lit is not None:
+            buffer[self._lit] = BLACK
+            self._lit = None
+        if self._frame % 4 == 0:
+            self._lit = step % buffer.num_leds
+            buffer[self._lit] = self.palette[step % 3]
+
+
+class BlinkRainbow(Effect):
+    """
+    Blink the NeoPixels through the rainbow colors.
+    :param tuple background_color: the background color. Default is BLACK
+    :param float dwell: time of each color in seconds. Default is 0.2
+    """
+
+    def __init__(self, background_color=BLACK, dwell: float = 0.2) -> None:
+        super().__init__(dwell)
+        self.background_color = background_color
+        self._cycle = 0
+        self._seed = 0
+
+    def start(self, buffer) -> None:
+        self._cycle = 0
+        self._seed = random8(31)
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        for _ in range(self._frame // 2 - self._cycle):
+            if self._seed < 31:
+                self._seed = self._seed + 1
+            else:
+                self._seed = random8(31)
+        self._cycle = self._frame // 2
+        if self._frame % 2:
+            buffer.fill(self.background_color)
+        else:
+            # One of 32 colors around the wheel, at half brightness
+            fill_rainbow(buffer, self._seed * 8, 0, 127)
+
+
+class FollowRGB(Effect):
+    """
+    Move a group of colors along the strip.
+    :param int loops: number of loops. Default is 3
+    :param list color_list: list of colors. Default is None, the palette or
+     a list of 8 colors
+    :param list palette: colors used when no color list is given. Default is
+     None
+    :param float dwell: time delay between each move. Default is 0.2 seconds
+    """
+
+    def __init__(
+        self,
+        loops: int = 3,
+        color_list: list = None,
+        palette: list = None,
+        dwell: float = 0.2,
+    ) -> None:
+        super().__init__(dwell)
+        self.loops = loops
+        self.color_list = color_list
+        self.palette = palette
+        self._colors = color_list
+
+    def start(self, buffer) -> None:
+        num_leds = buffer.num_leds
+        color_list = self.color_list
+        if color_list is None:
+            if self.palette is None:
+                color_list = [
+                    BLACK,
+                    RED,
+                    GREEN,
+                    BLUE,
+                    YELLOW,
+                    PURPLE,
+                    CYAN,
+                    ORANGE,
+                ]
+            elif len(self.palette) > num_leds // 2:
+                color_list = self.palette[::2][: num_leds // 2]
+            else:
+                color_list = self.palette
+        self._colors = color_list
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        num_leds = buffer.num_leds
+        colors = self._colors
+        # Draw the positions of the frames dropped too, so the tail clears
+        first = self._frame - min(steps, num_leds) + 1 if steps else self._frame
+        for i in range(first, self._frame + 1):
+            for value in range(len(colors)):
+                buffer[(i + value) % num_leds] = colors[value]
+
+
+class Wipe(Effect):
+    """
+    Wipe the NeoPixels with one color then the other.
+    :param tuple color1: the first color. Default is GREEN
+    :param tuple color2: the second color. Default is YELLOW
+    :param float delta_time: time delay between each pixel: default 0.1
+     seconds
+    :param bool ccw: counter-clockwise or clockwise. Default is False
+    :param bool clear: clear the NeoPixels after each color. Default is
+     False
+    """
+
+    def __init__(
+        self,
+        color1: tuple = GREEN,
+        color2: tuple = YELLOW,
+        delta_time: float = 0.1,
+        ccw: bool = False,
+        clear: bool = False,
+    ) -> None:
+        super().__init__(delta_time)
+        self.color1 = color1
+        self.color2 = color2
+        self.ccw = ccw
+        self.clear = clear
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        num_leds = buffer.num_leds
+        wipe_pass = self._frame // num_leds
+        position = self._frame % num_leds + 1
+        if wipe_pass % 2:
+            color, previous = self.color2, self.color1
+        else:
+            color, previous = self.color1, self.color2
+        if self.clear or wipe_pass == 0:
+            previous = BLACK
+        if self.ccw:
+            buffer.fill(previous, 0, num_leds - position)
+            buffer.fill(color, num_leds - position, num_leds)
+        else:
+            buffer.fill(color, 0, position)
+            buffer.fill(previous, position, num_leds)
+
+
+class Pacman(Effect):
+    """
+    PACMAN ANIMATION Adapted from https://github.com/wled-dev/WLED/pull/4536 # by BobLoeffler68
+    MIT LICENSE
+    """
+
+    def __init__(self) -> None:
+        super().__init__(0.1)
+
+    def start(self, buffer) -> None:
+        num_leds = buffer.num_leds
+        self.direction = 1
+        self.black_dir = -1
+        if num_leds > 150:
+            self.start_blinking_ghosts = num_leds // 4
+        else:
+            self.start_blinking_ghosts = num_leds // 3
+
+        self.pacman = [BLUE, 10]
+        self.ghosts_original = [[RED, 6], [PURPLE, 4], [CYAN, 2], [ORANGE, 0]]
+        self.ghosts = [[RED, 6], [PURPLE, 4], [CYAN, 2], [ORANGE, 0]]
+        self.power_pellet = [ORANGEYELLOW, num_leds - 1]
+        self.flag = "beep"
+        self._blink = 0
+        buffer[self.power_pellet[1]] = self.power_pellet[0]
+        self._move(buffer)
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        # The power pellet blinks every 250 ms
+        blink = t // 250
+        if blink != self._blink:
+            self._blink = blink
+            if self.power_pellet[0] == ORANGEYELLOW:
+                self.power_pellet[0] = BLACK
+            else:
+                self.power_pellet[0] = ORANGEYELLOW
+            buffer[self.power_pellet[1]] = self.power_pellet[0]
+        for _ in range(steps):
+            self._move(buffer)
+
+    def _move(self, buffer) -> None:
+        num_leds = buffer.num_leds
+        pacman = self.pacman
+        ghosts = self.ghosts
+        if pacman[1] >= num_leds - 2:
+            self.direction = self.direction * -1
+            self.black_dir = self.black_dir * -1
+            for ghost in ghosts:
+                ghost[0] = BLUE
+
+        buffer[pacman[1]] = pacman[0]
+        buffer[pacman[1] + self.black_dir] = BLACK
+        pacman[1] += self.direction
+
+        if ghosts[3][1] <= self.start_blinking_ghosts and self.direction == -1:
+            if self.flag == "beep":
+                for i, ghost in enumerate(ghosts):
+                    ghost[0] = BLACK
+                self.flag = "bop"
+            else:
+                for i, ghost in enumerate(ghosts):
+                    ghost[0] = self.ghosts_original[i][0]
+                self.flag = "beep"
+
+        for i, ghost in enumerate(ghosts):
+            buffer[ghost[1]] = ghost[0]
+            buffer[ghost[1] + self.black_dir] = BLACK
+            ghost[1] += self.direction
+
+        if ghosts[3][1] <= 0:
+            self.direction = self.direction * -1
+            self.black_dir = self.black_dir * -1
+            for i, ghost in enumerate(ghosts):
+                ghost[0] = self.ghosts_original[i][0]
+
+
+class RainbowCycle(Effect):
+    """
+    Cycle through the rainbow colors.
+    :param float time_delta: time delay between each color change: default
+     0.1 seconds
+    """
+
+    def __init__(self, time_delta: float = 0.1) -> None:
+        super().__init__(time_delta)
+        self.hue = 0
+
+    def start(self, buffer) -> None:
+        self.hue = -8
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        # The rainbow moves one pixel along the strip every step, the whole
+        # wheel every 32 pixels at half brightness. The colors are within one
+        # step per channel of the old 32 color list, not the same
+        self.hue = (self.hue - 8 * steps) & 0xFF
+        fill_rainbow(buffer, self.hue, 8, 127)
+
+
+class RandomColor(Effect):
+    """
+    Set random colors to the leds.
+    :param int start: start index. Default is 0
+    :param float delta_time: time delay between each color change: default
+     0.1 seconds
+    """
+
+    def __init__(self, start: int = 0, delta_time: float = 0.1) -> None:
+        super().__init__(delta_time)
+        self.first = start
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        first = self.first
+        num_leds = buffer.num_leds
+        framebuffer = getattr(buffer, "buffer", None)
+        if framebuffer is not None and buffer.bpp == 3:
+            # The random bytes go straight into the framebuffer
+            fill_random(framebuffer, first * 3, num_leds * 3)
+            buffer.mark_dirty(first, num_leds)
+            return
+        for i in range(first, num_leds):
+            buffer.set_rgb(i, random8(), random8(), random8())
+
+
+class Twinkle(Effect):
+    """
+    Pixels lighting up in random colors from a palette and fading out.
+
+    Every pixel keeps three bytes of state: its phase, its palette index and
+    its speed. Each frame only the twinkling pixels move ahead, and a
+    fraction of the strip may start a new twinkle, so the work follows the
+    number of lit pixels and nothing is allocated.
+    :param list palette: the colors, up to 256. Default is None, seven basic
+     colors
+    :param float delta_time: time between frames. Default is 0.1 seconds
+    :param int fraction: pixels, out of 256, that may start a twinkle each
+     frame. Default is 16
+    :param int speed: phase increase per frame of the slowest twinkles, the
+     fastest ones go twice as fast. A twinkle lasts 256 / speed frames.
+     Default is 32
+    """
+
+    def __init__(
+        self,
+        palette: list = None,
+        delta_time: float = 0.1,
+        fraction: int = 16,
+        speed: int = 32,
+    ) -> None:
+        super().__init__(delta_time)
+        if palette is None:
+            palette = [RED, GREEN, BLUE, YELLOW, PURPLE, CYAN, ORANGE]
+        self.palette = palette
+        self.fraction = fraction
+        self.speed = speed
+
+    def allocate(self, buffer) -> None:
+        num_leds = buffer.num_leds
+        # Phase, palette index and speed of every pixel, phase 0 is off
+        self.state = bytearray(3 * num_leds)
+        # The twinkling pixels, the first ``count`` entries are used
+        self.active = array("H", bytes(2 * num_leds))
+        self.count = 0
+        # The palette as (r, g, b, w) bytes
+        self.colors = bytearray(4 * len(self.palette))
+        for index, color in enumerate(self.palette):
+            self.colors[4 * index : 4 * index + len(color)] = bytes(color)
+
+    def start(self, buffer) -> None:
+        # Turn off the pixels left twinkling by a previous run
+        state = self.state
+        for index in range(self.count):
+            state[3 * self.active[index]] = 0
+        self.count = 0
+        self._spawn = 0
+        buffer.fill(BLACK)
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        state = self.state
+        active = self.active
+        colors = self.colors
+        num_leds = buffer.num_leds
+
+        # Move the twinkling pixels ahead and redraw them
+        index = 0
+        while index < self.count:
+            pixel = active[index]
+            slot = 3 * pixel
+            phase = state[slot] + state[slot + 2] * steps
+            if phase > 255:
+                # Done, the last entry takes its place
+                state[slot] = 0
+                buffer.set_rgb(pixel, 0, 0, 0)
+                self.count -= 1
+                active[index] = active[self.count]
+                continue
+            state[slot] = phase
+            # Up then down, 0-255
+            level = phase << 1 if phase < 128 else (255 - phase) << 1
+            base = 4 * state[slot + 1]
+            buffer.set_rgb(
+                pixel,
+                (colors[base] * level) >> 8,
+                (colors[base + 1] * level) >> 8,
+                (colors[base + 2] * level) >> 8,
+                (colors[base + 3] * level) >> 8,
+            )
+            index += 1
+
+        # Start new twinkles on pixels picked at random
+        self._spawn += num_leds * self.fraction * max(steps, 1)
+        tries = self._spawn >> 8
+        self._spawn &= 0xFF
+        size = len(self.palette)
+        speed = self.speed
+        for _ in range(tries):
+            pixel = (random16() * num_leds) >> 16
+            slot = 3 * pixel
+            if state[slot]:
+                continue
+            state[slot] = 1
+            state[slot + 1] = random8(size)
+            state[slot + 2] = min(255, speed + random8(speed + 1))
+            active[self.count] = pixel
+            self.count += 1
+
+
+class RainbowSine(Effect):
+    """
+    Rainbow sine wave effect.
+    :param float shrinkage: size of the color segments, the bigger the
+     smaller the segments. Default is 0.1
+    :param float animation_speed: phase increase per frame. Default is 0.05
+    :param float speed: time between frames. Default is 0.05 seconds
+    :param float saturation: saturation value. Default is 1.0
+    :param float value: value. Default is 1.0
+    """
+
+    def __init__(
+        self,
+        shrinkage: float = 0.1,
+        animation_speed: float = 0.05,
+        speed: float = 0.05,
+        saturation: float = 1.0,
+        value: float = 1.0,
+    ) -> None:
+        super().__init__(speed)
+        self.shrinkage = shrinkage
+        self.animation_speed = animation_speed
+        self.saturation = saturation
+        self.value = value
+        self.sat8 = int(saturation * 255)
+        self.val8 = int(value * 255)
+        self.increment = phase16(animation_speed)
+        self.spread = phase16(shrinkage)
+        self.animation = 0
+
+    def allocate(self, buffer) -> None:
+        self.hues = bytearray(buffer.num_leds)
+        self.table = hue_table(self.sat8, self.val8, "spectrum")
+
+    def start(self, buffer) -> None:
+        self.animation = 0
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        self.animation = (self.animation + self.increment * steps) & 0xFFFF
+        hues = self.hues
+        sin_table = SIN8
+        spread = self.spread
+        phase = self.animation + spread
+        for i in range(len(hues)):
+            hues[i] = sin_table[(phase >> 8) & 0xFF]
+            phase += spread
+        fill_hues(buffer, hues, 0, table=self.table)
+
+
+class WhiteWave(Effect):
+    """
+    White wave effect, with the whole wave fading in and out.
+    :param float animation_speed: phase increase per frame. Default is 0.08
+    :param float fade_animation_speed: fade phase increase per frame.
+     Default is 0.08
+    :param float speed: time between frames. Default is 0.01 seconds
+    :param float shrinkage: size of the segments, the bigger the smaller the
+     segments. Default is 0.3
+    """
+
+    def __init__(
+        self,
+        animation_speed: float = 0.08,
+        fade_animation_speed: float = 0.08,
+        speed: float = 0.01,
+        shrinkage: float = 0.3,
+    ) -> None:
+        super().__init__(speed)
+        self.animation_speed = animation_speed
+        self.fade_animation_speed = fade_animation_speed
+        self.shrinkage = shrinkage
+        self.increment = phase16(animation_speed)
+        self.fade_increment = phase16(fade_animation_speed)
+        self.spread = phase16(shrinkage)
+        self.animation = 0
+        self.fade_animation = 0
+
+    def start(self, buffer) -> None:
+        self.animation = 0
+        self.fade_animation = 0
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        self.animation = (self.animation + self.increment * steps) & 0xFFFF
+        self.fade_animation = (
+            self.fade_animation + self.fade_increment * steps
+        ) & 0xFFFF
+        # Calculate fade effect using sine wave, it scales the whole frame
+        fade_effect = sin16(self.fade_animation) + 1
+        sin_table = SIN8
+        spread = self.spread
+        phase = self.animation
+        for i in range(buffer.num_leds):
+            level = (sin_table[(phase >> 8) & 0xFF] * fade_effect) >> 8
+            buffer.set_rgb(i, level, level, level)
+            phase += spread
+
+
+class WhiteWaveColor(Effect):
+    """
+    Two color waves changing their frequency.
+    :param float animation_speed: phase increase per frame. Default is 0.08
+    :param float fade_animation_speed: fade phase increase per frame.
+     Default is 0.08
+    :param float frequency: frequency increase per frame. Default is 0.003
+    :param float speed: time between frames. Default is 0.1 seconds
+    """
+
+    def __init__(
+        self,
+        animation_speed: float = 0.08,
+        fade_animation_speed: float = 0.08,
+        frequency: float = 0.003,
+        speed: float = 0.1,
+    ) -> None:
+        super().__init__(speed)
+        self.animation_speed = animation_speed
+        self.fade_animation_speed = fade_animation_speed
+        self.frequency = frequency
+        self.increment = phase16(animation_speed)
+        self.fade_increment = phase16(fade_animation_speed)
+        self.freq_increment = phase16(frequency)
+        self.animation = 0
+        self.fade_animation = 0
+        self.freq = 0
+
+    def start(self, buffer) -> None:
+        self.animation = 0
+        self.fade_animation = 0
+        self.freq = 0
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        self.animation = (self.animation + self.increment * steps) & 0xFFFF
+        self.fade_animation = (
+            self.fade_animation + self.fade_increment * steps
+        ) & 0xFFFF
+        self.freq = (self.freq + self.freq_increment * steps) & 0xFFFF
+
+        # Phase between two pixels of each wave, from 0 to 1 radian
+        shrinkage = sin16(self.freq) * RADIAN // 255
+        expand = cos16(self.freq) * RADIAN // 255
+
+        sin_table = SIN8
+        saturation_phase = self.animation
+        brightness_phase = self.animation
+        for i in range(buffer.num_leds):
+            # Calculate brightness for each LED using sine wave
+            saturation = sin_table[(saturation_phase >> 8) & 0xFF]
+            brightness = sin_table[(brightness_phase >> 8) & 0xFF]
+
+            buffer.set_rgb(
+                i,
+                saturation,
+                saturation // (brightness + 1),
+                brightness,
+            )
+            saturation_phase += shrinkage
+            brightness_phase += expand
+
+
+def _two_colors(palette: list) -> tuple:
+    """
+    Pick two colors from a palette, red and blue without a palette.
+    :param list palette: the palette or None
+    :return: the two colors
+    """
+    if palette is None:
+        return (255, 0, 0), (0, 0, 255)
+    return choice(palette), choice(palette)
+
+
+class LinearInterpolation(Effect):
+    """
+    Linear interpolation between two colors along a sine wave.
+    :param float shrinkage: size of the color segments, the bigger the
+     smaller the segments. Default is 0.5
+    :param float animation_increase: phase increase per frame. Default is 0.1
+    :param float speed: time between frames. Default is 0.01 seconds
+    :param list palette: two random colors are taken from it. Default is
+     None, red and blue
+    """
+
+    def __init__(
+        self,
+        shrinkage: float = 0.5,
+        animation_increase: float = 0.1,
+        speed: float = 0.01,
+        palette: list = None,
+    ) -> None:
+        super().__init__(speed)
+        self.shrinkage = shrinkage
+        self.animation_increase = animation_increase
+        self.increment = phase16(animation_increase)
+        self.spread = phase16(shrinkage)
+        self.color1, self.color2 = _two_colors(palette)
+        self.animation = 0
+
+    def start(self, buffer) -> None:
+        self.animation = 0
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        self.animation = (self.animation + self.increment * steps) & 0xFFFF
+        color1 = self.color1
+        color2 = self.color2
+        sin_table = SIN8
+        spread = self.spread
+        phase = self.animation
+        for i in range(buffer.num_leds):
+            interpolation = sin_table[(phase >> 8) & 0xFF]
+
+            r = lerp8by8(color1[0], color2[0], interpolation)
+            g = lerp8by8(color1[1], color2[1], interpolation)
+            b = lerp8by8(color1[2], color2[2], interpolation)
+
+            buffer.set_rgb(i, r, g, b)
+            phase += spread
+
+
+class LerpPhase(Effect):
+    """
+    Linear interpolation between two colors, with the phase of the
+    interpolation changing over time.
+    :param float animation_increase: phase increase per frame. Default is 0.1
+    :param float speed: time between frames. Default is 0.01 seconds
+    :param float shrinkage: size of the color segments. Default is 0.2
+    :param float phase_increase: speed of the phase. Default is 1.5
+    :param list palette: two random colors are taken from it. Default is
+     None, red and blue
+    """
+
+    def __init__(
+        self,
+        animation_increase: float = 0.1,
+        speed: float = 0.01,
+        shrinkage: float = 0.2,
+        phase_increase: float = 1.5,
+        palette: list = None,
+    ) -> None:
+        super().__init__(speed)
+        self.animation_increase = animation_increase
+        self.shrinkage = shrinkage
+        self.phase_increase = phase_increase
+        self.increment = phase16(animation_increase * phase_increase)
+        self.color1, self.color2 = _two_colors(palette)
+        self.animation = 0
+
+    def allocate(self, buffer) -> None:
+        # The shape of the wave does not move, only its phase changes
+        self.shape = wave_table(buffer.num_leds, 0, phase16(self.shrinkage))
+
+    def start(self, buffer) -> None:
+        self.animation = 0
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        self.animation = (self.animation + self.increment * steps) & 0xFFFF
+        color1 = self.color1
+        color2 = self.color2
+        shape = self.shape
+        # From -128 to 127, scales the wave from -1 to 1
+        phase = sin16(self.animation) - 128
+        for i in range(buffer.num_leds):
+            interpolation = 127 + (((shape[i] - 128) * phase) >> 7)
+
+            r = lerp8by8(color1[0], color2[0], interpolation)
+            g = lerp8by8(color1[1], color2[1], interpolation)
+            b = lerp8by8(color1[2], color2[2], interpolation)
+
+            buffer.set_rgb(i, r, g, b)
+
+
+def _random_colorlist() -> tuple:
+    """
+    A random color and the index of the channel that fades.
+    :return: the color as a list and the channel index
+    """
+    colorlist = [random8(), random8(), random8()]
+    return colorlist, random8(len(colorlist))
+
+
+class FadeInFadeOutRandomColor(Effect):
+    """
+    Fade one channel of a random color in and out, then pick another color.
+    :param float fade_increment: fade increase per frame. Default is 0.03
+    :param float speed: time between frames. Default is 0.1 seconds
+    """
+
+    def __init__(self, fade_increment: float = 0.03, speed: float = 0.1):
+        super().__init__(speed)
+        self.fade_increment = fade_increment
+        self.increment = phase16(fade_increment)
+        self.fade = 0
+
+    def start(self, buffer) -> None:
+        self.fade = 0
+        self.colorlist, self.color_index = _random_colorlist()
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        for _ in range(steps):
+            # A new color once the fade has done a full turn
+            if self.fade > 0xFFFF:
+                self.fade = 0
+                self.colorlist, self.color_index = _random_colorlist()
+            self.fade += self.increment
+
+        colorlist = self.colorlist
+        colorlist[self.color_index] = sin16(self.fade + 0x8000)
+        buffer.fill(colorlist)
+
+
+class FadeInFadeOutFragmented(Effect):
+    """
+    Fade a random color in and out on one fragment of the strip at a time.
+    :param int fragments: number of fragments. Default is 3
+    :param float fade_increment: fade increase per frame. Default is 0.08
+    :param float speed: time between frames. Default is 0.01 seconds
+    """
+
+    def __init__(
+        self,
+        fragments: int = 3,
+        fade_increment: float = 0.08,
+        speed: float = 0.01,
+    ) -> None:
+        super().__init__(speed)
+        self.fragments = fragments
+        self.fade_increment = fade_increment
+        self.increment = phase16(fade_increment)
+        self.fade = 0
+        self.fragment = 0
+
+    def start(self, buffer) -> None:
+        self.fade = 0
+        self.fragment = 0
+        self.colorlist, self.color_index = _random_colorlist()
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        for _ in range(steps):
+            # The next fragment once the fade has done a full turn
+            if self.fade > 0xFFFF:
+                self.fade = 0
+                self.colorlist, self.color_index = _random_colorlist()
+                self.fragment = (self.fragment + 1) % self.fragments
+            self.fade += self.increment
+
+        fragment_size = buffer.num_leds // self.fragments
+        colorlist = self.colorlist
+        colorlist[self.color_index] = cos16(self.fade + 0x8000)
+        begin = self.fragment * fragment_size
+        buffer.fill(colorlist, begin, begin + fragment_size)
+
+
+class FifoFragmentedPhase(Effect):
+    """
+    Blue fragments fading with a phase shift, doubling their number every
+    cycle.
+    :param int fragment_amount: number of fragments. Default is 2
+    :param float fade_speed: fade increase per frame. Default is 0.03
+    :param float speed: time between frames. Default is 0.01 seconds
+    """
+
+    def __init__(
+        self,
+        fragment_amount: int = 2,
+        fade_speed: float = 0.03,
+        speed: float = 0.01,
+    ) -> None:
+        super().__init__(speed)
+        self.initial_fragments = fragment_amount
+        self.fade_speed = fade_speed
+        self.increment = int(fade_speed * RADIAN)
+
+    def start(self, buffer) -> None:
+        self.fade = 0
+        self.fragment_amount = self.initial_fragments
+        self.fragment_size = math.floor(
+            buffer.num_leds / self.fragment_amount
+        )
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        num_leds = buffer.num_leds
+        self.fade += self.increment * steps
+        # The fragments change after 20 radians
+        if self.fade >= 20 * RADIAN:
+            self.fade = 0
+            if self.fragment_amount >= 8:
+                self.fragment_amount = 1
+            self.fragment_amount *= 2
+            self.fragment_size = math.ceil(num_leds / self.fragment_amount)
+            buffer.fill(BLACK)
+
+        fragment_size = self.fragment_size
+        for i in range(self.fragment_amount):
+            # One radian between two fragments
+            brightness = cos16(self.fade + i * RADIAN)
+
+            begin = i * fragment_size
+            end = min(fragment_size * (i + 1), num_leds)
+            buffer.fill((0, 0, brightness), begin, end)
+
+
+class WaveFreqShrinkAndGrow(Effect):
+    """
+    Wave whose frequency shrinks and grows.
+    :param float move_increase: phase increase per frame. Default is 0.2
+    :param float freq_increase: frequency increase per frame. Default is
+     0.003
+    :param float speed: time between frames. Default is 0.01 seconds
+    """
+
+    def __init__(
+        self,
+        move_increase: float = 0.2,
+        freq_increase: float = 0.003,
+        speed: float = 0.01,
+    ) -> None:
+        super().__init__(speed)
+        self.move_increase = move_increase
+        self.freq_increase = freq_increase
+        self.increment = phase16(move_increase)
+        self.freq_increment = phase16(freq_increase)
+        self.move = 0
+        self.freq = 0
+
+    def start(self, buffer) -> None:
+        self.move = 0
+        self.freq = 0
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        self.move = (self.move + self.increment * steps) & 0xFFFF
+        self.freq = (self.freq - self.freq_increment * steps) & 0xFFFF
+        # Phase between two pixels, from 0 to 1 radian
+        shrinkage = sin16(self.freq) * RADIAN // 255
+
+        sin_table = SIN8
+        phase = self.move
+        for i in range(buffer.num_leds):
+            saturation = sin_table[(phase >> 8) & 0xFF]
+
+            buffer.set_rgb(i, 80, saturation, 80)
+            phase += shrinkage
+
+
+class WaveFreqShrinkAndGrowCentered(Effect):
+    """
+    Wave with frequency and shrinkage centered.
+    :param float move_increase: phase increase per frame. Default is 0.2
+    :param float frequency: frequency increase per frame. Default is 0.003
+    :param float speed: time between frames. Default is 0.01 seconds
+    """
+
+    def __init__(
+        self,
+        move_increase: float = 0.2,
+        frequency: float = 0.003,
+        speed: float = 0.01,
+    ) -> None:
+        super().__init__(speed)
+        self.move_increase = move_increase
+        self.frequency = frequency
+        self.increment = phase16(move_increase)
+        self.freq_increment = phase16(frequency)
+        self.move = 0
+        self.freq = 0
+
+    def start(self, buffer) -> None:
+        self.move = 0
+        self.freq = 0
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        self.move = (self.move + self.increment * steps) & 0xFFFF
+        self.freq = (self.freq + self.freq_increment * steps) & 0xFFFF
+        # Phase between two pixels, from 0 to 1 radian
+        shrinkage = sin16(self.freq) * RADIAN // 255
+
+        midpoint = buffer.num_leds // 2
+
+        sin_table = SIN8
+        # A quarter turn ahead, the cosine of the move
+        phase = self.move + 0x4000
+        for i in range(midpoint):
+            saturation = sin_table[(phase >> 8) & 0xFF]
+
+            buffer.set_rgb(midpoint + i, 25, saturation, 80)
+            buffer.set_rgb(midpoint - i, 80, saturation, 25)
+            phase += shrinkage
+
+
+class WaveBackAndForth(Effect):
+    """
+    Wave moving back and forth.
+    :param float move_increase: phase increase per frame. Default is 0.06
+    :param float speed: time between frames. Default is 0.01 seconds
+    """
+
+    def __init__(self, move_increase: float = 0.06, speed: float = 0.01):
+        super().__init__(speed)
+        self.move_increase = move_increase
+        self.increment = phase16(move_increase)
+        self.move = 0
+        self.hue = 0
+
+    def start(self, buffer) -> None:
+        self.move = 0
+        self.hue = 0
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        self.move = (self.move + self.increment * steps) & 0xFFFF
+        num_leds = buffer.num_leds
+        # From -128 to 127 for a wave from -1 to 1
+        wave = sin16(self.move) - 128
+        hue_step = (wave * num_leds) >> 7
+        hue = self.hue
+
+        sin_table = SIN8
+        # The wave moves the brightness by up to 20 radians
+        phase = (wave * 20 * RADIAN) >> 7
+        for i in range(num_leds):
+            hue += hue_step
+            brigthness = sin_table[(phase >> 8) & 0xFF]
+
+            buffer.set_rgb(i, hue & 0xFF, 80, brigthness)
+            phase += RADIAN
+        self.hue = hue & 0xFF
+
+
+class ShrinkAndGrow(Effect):
+    """
+    A wave growing and shrinking from the middle of the strip.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(0.01)
+        self.increment = phase16(0.05)
+        self.move = 0
+
+    def start(self, buffer) -> None:
+        self.move = 0
+        self.midpoint = buffer.num_leds // 2
+        # The wave covers half of each side of the strip
+        self.spread = self.midpoint / 2
+        self.step = math.pi / self.spread
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        self.move = (self.move + self.increment * steps) & 0xFFFF
+        midpoint = self.midpoint
+        sin_table = SIN8
+        # A quarter turn ahead for the cosine
+        phase = int(self.move * self.step) + 0x4000
+        for i in range(int(self.spread)):
+            brigthness = sin_table[(phase >> 8) & 0xFF]
+
+            buffer.set_rgb(midpoint + i, 60, 60, brigthness)
+            buffer.set_rgb(midpoint - i, 60, 60, brigthness)
+            phase += RADIAN
+
+
+class ShrinkAndGrowMultiple(Effect):
+    """
+    Several waves growing and shrinking, one per fragment.
+    :param int fragment_amount: number of fragments. Default is 4
+    :param float move_increase: phase increase per frame. Default is 0.08
+    :param float speed: time between frames. Default is 0.01 seconds
+    """
+
+    def __init__(
+        self,
+        fragment_amount: int = 4,
+        move_increase: float = 0.08,
+        speed: float = 0.01,
+    ) -> None:
+        super().__init__(speed)
+        self.fragment_amount = fragment_amount
+        self.move_increase = move_increase
+        self.increment = phase16(move_increase)
+        self.move = 0
+
+    def allocate(self, buffer) -> None:
+        self.fragment_size = buffer.num_leds // self.fragment_amount
+        self.fragment_midpoint = self.fragment_size // 2
+        # The wave covers half of each side of the fragment
+        self.spread = self.fragment_midpoint / 2
+        self.step = math.pi * math.pi / self.spread
+        # The wave of the frame, the same in every fragment
+        self.levels = bytearray(int(self.spread))
+
+    def start(self, buffer) -> None:
+        self.move = 0
+        buffer.fill(BLACK)
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        self.move = (self.move + self.increment * steps) & 0xFFFF
+        levels = self.levels
+        spread = len(levels)
+        sin_table = SIN8
+        # A quarter turn ahead for the cosine
+        phase = int(self.move * self.step) + 0x4000
+        for i in range(spread):
+            levels[i] = sin_table[(phase >> 8) & 0xFF]
+            phase += RADIAN
+        for fragment in range(self.fragment_amount):
+            pos = fragment * self.fragment_size
+            midpoint = pos + self.fragment_midpoint
+
+            for i in range(spread):
+                brigthness = levels[i]
+
+                buffer.set_rgb(midpoint + i, 25, brigthness, 80)
+                buffer.set_rgb(midpoint - i, 80, brigthness, 25)
+
+
+class ShrinkAndGrowMultipleMoving(Effect):
+    """
+    Several waves moving along the strip.
+    :param int fragment_amount: number of fragments. Default is 4
+    :param float midpoint_increase: move of the waves per frame. Default is
+     0.05
+    :param float move_increase: phase increase per frame. Default is 0.05
+    :param float speed: time between frames. Default is 0.01 seconds
+    """
+
+    def __init__(
+        self,
+        fragment_amount: int = 4,
+        midpoint_increase: float = 0.05,
+        move_increase: float = 0.05,
+        speed: float = 0.01,
+    ) -> None:
+        super().__init__(speed)
+        self.fragment_amount = fragment_amount
+        self.midpoint_increase = midpoint_increase
+        self.move_increase = move_increase
+        self.move = 0
+
+    def allocate(self, buffer) -> None:
+        fragment_size = buffer.num_leds // self.fragment_amount
+        self.fragment_size = fragment_size
+        fragment_midpoint = fragment_size // 2
+        self.midpoint = [0] * self.fragment_amount
+        # The wave covers half of each side of the fragment and does not
+        # change, a quarter turn ahead for the cosine
+        self.spread = fragment_midpoint / 2
+        self.levels = wave_table(
+            int(self.spread) + 1,
+            phase16(math.pi / self.spread) + 0x4000,
+            RADIAN,
+        )
+
+    def start(self, buffer) -> None:
+        self.move = 0
+        fragment_size = self.fragment_size
+        for fragment in range(self.fragment_amount):
+            self.midpoint[fragment] = (fragment_size // 2) + (
+                fragment * fragment_size
+            )
+        buffer.fill(BLACK)
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        num_leds = buffer.num_leds
+        self.move += self.move_increase * steps
+        midpoints = self.midpoint
+        levels = self.levels
+        for fragment in range(self.fragment_amount):
+            midpoints[fragment] += self.midpoint_increase * steps
+
+            if midpoints[fragment] > num_leds:
+                midpoints[fragment] = 0
+
+            pos = midpoints[fragment]
+
+            for i in range(int(self.spread) + 1):
+                brightness = levels[i]
+
+                index = int((pos + i) % num_leds)
+                buffer.set_rgb(index, 110, 32, brightness)
+
+                if pos - i < 0:
+                    index = int(pos + num_leds - i)
+                    index %= num_leds
+                    buffer.set_rgb(index, 80, 80, brightness)
+                else:
+                    index = int(pos - i) % num_leds
+                    buffer.set_rgb(index, 128, 54, brightness)
+
+
+class Snail(Effect):
+    """
+    A snail growing and shrinking around the strip.
+    :param int fragment_amount: the snail grows up to the strip length
+     divided by it. Default is 8
+    :param int snail_minimum_size: the snail shrinks down to it. Default is 6
+    :param bool is_shrinking: start shrinking. Default is False
+    :param int snailbegin: start of the snail. Default is 0
+    :param int snailend: end of the snail. Default is 2
+    :param float speed: time between frames. Default is 0.01 seconds
+    :param float increase: move of the snail ends per frame. Default is 0.08
+    """
+
+    def __init__(
+        self,
+        fragment_amount: int = 8,
+        snail_minimum_size: int = 6,
+        is_shrinking: bool = False,
+        snailbegin: int = 0,
+        snailend: int = 2,
+        speed: float = 0.01,
+        increase: float = 0.08,
+    ) -> None:
+        super().__init__(speed)
+        self.fragment_amount = fragment_amount
+        self.snail_minimum_size = snail_minimum_size
+        self.initial = (is_shrinking, snailbegin, snailend)
+        self.increase = increase
+
+    def start(self, buffer) -> None:
+        self.is_shrinking, self.snailbegin, self.snailend = self.initial
+        self.fragment_size = buffer.num_leds // self.fragment_amount
+        self.length = buffer.num_leds
+        buffer.fill(BLACK)
+
+    def size(self) -> float:
+        """
+        Length of the snail.
+        :return: the length in pixels
+        """
+        if self.snailend >= self.snailbegin:
+            return self.snailend - self.snailbegin
+        return self.length - self.snailbegin + self.snailend
+
+    def crawl(self) -> None:
+        """
+        Move one end of the snail by one frame.
+        :return: None
+        """
+        snail_size = self.size()
+        if not self.is_shrinking:
+            self.snailend += self.increase
+            if self.snailend >= self.length:
+                self.snailend = 0
+            if snail_size > self.fragment_size:
+                self.is_shrinking = True
+        else:
+            self.snailbegin += self.increase
+            if self.snailbegin >= self.length:
+                self.snailbegin = 0
+            if snail_size < self.snail_minimum_size:
+                self.is_shrinking = False
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        for _ in range(steps):
+            self.crawl()
+
+        spread = int(self.size())
+        if not spread:
+            return
+        step = 0x10000 // spread
+
+        sin_table = SIN8
+        # One turn along the snail, starting from the cosine of pi
+        phase = 0xC000
+        for i in range(spread):
+            brightness = sin_table[(phase >> 8) & 0xFF]
+
+            self.draw(buffer, int(self.snailbegin + i), brightness)
+            phase += step
+
+    def draw(self, buffer, position: int, brightness: int) -> None:
+        """
+        Draw one pixel of the snail.
+        :param buffer: the buffer to draw into
+        :param int position: the position along the snail path
+        :param int brightness: the blue value
+        :return: None
+        """
+        buffer.set_rgb(position % self.length, 215, 128, brightness)
+
+
+class SnailMultiple(Snail):
+    """
+    One snail per fragment of the strip.
+    :param int fragment_amount: number of fragments. Default is 8
+    :param int snail_minimum_size: the snail shrinks down to it. Default is 6
+    :param bool is_shrinking: start shrinking. Default is False
+    :param int snailbegin: start of the snail. Default is 0
+    :param int snailend: end of the snail. Default is 2
+    :param float speed: time between frames. Default is 0.01 seconds
+    """
+
+    def __init__(
+        self,
+        fragment_amount: int = 8,
+        snail_minimum_size: int = 6,
+        is_shrinking: bool = False,
+        snailbegin: int = 0,
+        snailend: int = 2,
+        speed: float = 0.01,
+    ) -> None:
+        super().__init__(
+            fragment_amount,
+            snail_minimum_size,
+            is_shrinking,
+            snailbegin,
+            snailend,
+            speed,
+            0.1,
+        )
+
+    def start(self, buffer) -> None:
+        super().start(buffer)
+        # Every snail crawls inside its own fragment
+        self.length = self.fragment_size
+
+    def crawl(self) -> None:
+        snail_size = self.size()
+        if not self.is_shrinking:
+            self.snailend += self.increase
+            if self.snailend >= self.fragment_size:
+                self.snailend = 0
+            if snail_size > self.fragment_size - 1:
+                self.is_shrinking = True
+        else:
+            self.snailbegin += self.increase
+            if self.snailbegin >= self.fragment_size:
+                self.snailbegin = 0
+            if snail_size < self.snail_minimum_size:
+                self.is_shrinking = False
+
+    def draw(self, buffer, position: int, brightness: int) -> None:
+        index = position % self.fragment_size
+        for j in range(self.fragment_amount):
+            buffer.set_rgb(index + j * self.fragment_size, 215, 128, brightness)
+
+
+class Scanner(Effect):
+    """
+    A light scanning the strip back and forth.
+    :param int scanner_size: scanner size. Default is 10
+    :param float speed: time between frames. Default is 0.01 seconds
+    """
+
+    def __init__(self, scanner_size: int = 10, speed: float = 0.01):
+        super().__init__(speed)
+        self.scanner_size = scanner_size
+
+    def allocate(self, buffer) -> None:
+        # One turn along the scanner, starting from the cosine of pi
+        self.levels = bytearray(
+            max(level, 30)
+            for level in wave_table(
+                self.scanner_size, 0xC000, 0x10000 // self.scanner_size
+            )
+        )
+
+    def start(self, buffer) -> None:
+        self.position = 0
+        self.direction = False
+        buffer.fill(BLACK)
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        scanner_size = self.scanner_size
+        last = buffer.num_leds - scanner_size
+        for _ in range(steps):
+            if self.position == last or self.position == 0:
+                self.direction = not self.direction
+            if self.direction:
+                self.position += 1
+            else:
+                self.position -= 1
+
+        levels = self.levels
+        for i in range(scanner_size):
+            buffer.set_rgb(self.position + i, 215, 128, levels[i])
+
+
+class Segments(Effect):
+    """
+    Give one color to each segment of the strip.
+    :param int segment_length: segment length. Default is 3
+    :param list values: one color per segment, the segments left are black.
+     Default is None, all black
+    :param float speed: time between frames. Default is 0.1 seconds
+    """
+
+    def __init__(
+        self, segment_length: int = 3, values: list = None, speed: float = 0.1
+    ) -> None:
+        super().__init__(speed)
+        self.segment_length = segment_length
+        self.values = values or []
+
+    def allocate(self, buffer) -> None:
+        # The segments and their colors are worked out once
+        self.segments = split(buffer, self.segment_length)
+        values = self.values
+        self.colors = [
+            values[index] if index < len(values) else BLACK
+            for index in range(len(self.segments))
+        ]
+
+    def start(self, buffer) -> None:
+        for segment, color in zip(self.segments, self.colors):
+            segment.fill(color)
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        return
+
+
+class SegmentsAnimated(Segments):
+    """
+    Give one color to each segment of the strip, and move the colors one
+    segment ahead on every cycle with a transition.
+    :param int segment_length: segment length. Default is 3
+    :param list values: one color per segment, the segments left are black.
+     Default is None, all black
+    :param str animation: the transition, "fade" or "wipe". Default is "fade"
+    :param float dwell: time the colors stay still. Default is 1 second
+    :param float transition: time of the transition. Default is 0.5 seconds
+    :param float speed: time between frames. Default is 0.02 seconds
+    :raises ValueError: if the animation is not "fade" or "wipe"
+    """
+
+    def __init__(
+        self,
+        segment_length: int = 3,
+        values: list = None,
+        animation: str = "fade",
+        dwell: float = 1.0,
+        transition: float = 0.5,
+        speed: float = 0.02,
+    ) -> None:
+        if animation not in ("fade", "wipe"):
+            raise ValueError("Invalid animation %s" % animation)
+        super().__init__(segment_length, values, speed)
+        self.animation = animation
+        self.dwell_ms = int(dwell * 1000)
+        self.transition_ms = max(1, int(transition * 1000))
+        self._cycle = 0
+        self._settled = True
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        cycle_ms = self.dwell_ms + self.transition_ms
+        cycle = t // cycle_ms
+        elapsed = t - cycle * cycle_ms - self.dwell_ms
+        segments = self.segments
+        colors = self.colors
+        count = len(segments)
+
+        if elapsed < 0:
+            # Between transitions, only draw when the cycle changed
+            if self._settled and cycle == self._cycle:
+                return
+            for index, segment in enumerate(segments):
+                segment.fill(colors[(index - cycle) % count])
+            self._cycle = cycle
+            self._settled = True
+            return
+
+        self._settled = False
+        frac = (elapsed << 8) // self.transition_ms
+        for index, segment in enumerate(segments):
+            old = colors[(index - cycle) % count]
+            new = colors[(index - cycle - 1) % count]
+            if self.animation == "fade":
+                segment.fill(
+                    tuple(lerp8by8(a, b, frac) for a, b in zip(old, new))
+                )
+            else:
+                cut = (segment.num_leds * frac) >> 8
+                segment.fill(new, 0, cut)
+                segment.fill(old, cut)
@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`runtime`
+================================================================================
+
+Run effects from an asyncio event loop.
+
+The frame producers of :mod:`producers` render one frame per call, so several
+of them can share a strip, each one on its own :class:`segment.Segment`, and
+several strips can share one event loop. Every strip gets a frame loop task:
+it renders the effects bound to it, shows the frame and awaits the next frame
+deadline, so the other tasks (buttons, sensors, network) run between frames.
+
+Works with ``asyncio`` on MicroPython and CPython, where the ``simulator``
+backend takes the place of the strips, and with ``uasyncio`` on older
+MicroPython versions.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+from clock import FrameClock
+from segment import Segment
+
+
+async def play(led_object, effect, duration: float = 5) -> None:
+    """
+    Show an effect on a strip without blocking the event loop.
+    :param led_object: led object
+    :param effect: the frame producer
+    :param float duration: duration in seconds. Default is 5 seconds, None
+     runs until the task is cancelled
+    :return: None
+    """
+    clock = FrameClock(effect.period, duration, led_object.frame_stats)
+    while clock.running():
+        effect.next_frame(led_object, clock.elapsed_ms)
+        led_object.show()
+        clock.advance()
+        # Always give the other tasks a chance, even when behind schedule
+        await asyncio.sleep(clock.last_sleep_us / 1_000_000)
+
+
+class Runtime:
+    """
+    Effects bound to strips or segments of strips, all shown from one event
+    loop.
+    :param float fps: frame rate of every strip. Default is 50
+    """
+
+    def __init__(self, fps: float = 50) -> None:
+        self.fps = fps
+        self._strips = []
+        self._bindings = {}
+        self._running = False
+
+    def add(
+        self,
+        strip,
+        effect,
+        start: int = 0,
+        length: int = None,
+        reverse: bool = False,
+        mirror: bool = False,
+        grouping: int = 1,
+    ):
+        """
+        Bind an effect to a strip, or to a segment of it.
+        :param strip: the strip
+        :param effect: the frame producer
+        :param int start: the first pixel of the segment. Default is 0
+        :param int length: the number of pixels of the segment. Default is
+         None, up to the end of the strip
+        :param bool reverse: draw the effect backwards. Default is False
+        :param bool mirror: draw the effect from both ends of the segment.
+         Default is False
+        :param int grouping: strip pixels lit by each effect pixel. Default
+         is 1
+        :raises ValueError: if the segment does not fit in the strip
+        :return: the buffer the effect draws into
+        """
+        target = Segment(strip, start, length, reverse, mirror, grouping)
+        plain = not (reverse or mirror) and grouping == 1
+        if plain and target.num_leds == strip.num_leds:
+            target = strip
+        if strip not in self._bindings:
+            self._strips.append(strip)
+            self._bindings[strip] = []
+        self._bindings[strip].append((effect, target))
+        return target
+
+    def remove(self, effect) -> None:
+        """
+        Stop showing an effect, its pixels keep the last frame drawn.
+        :param effect: the frame producer
+        :return: None
+        """
+        for strip in self._strips:
+            bindings = self._bindings[strip]
+            bindings[:] = [
+                binding for binding in bindings if binding[0] is not effect
+            ]
+
+    def stop(self) -> None:
+        """
+        Ask the frame loops to finish after their current frame.
+        :return: None
+        """
+        self._running = False
+
+    async def run(self, duration: float = None) -> None:
+        """
+        Run the frame loop of every strip until the duration is over or
+        :meth:`stop` is called.
+        :param float duration: duration in seconds. Default is None, until
+         :meth:`stop` is called
+        :return: None
+        """
+        self._running = True
+        tasks = [
+            asyncio.create_task(self._frame_loop(strip, duration))
+            for strip in self._strips
+        ]
+        for task in tasks:
+            await task
+        self._running = False
+
+    async def _frame_loop(self, strip, duration: float) -> None:
+        """
+        Render the effects of a strip and show it, once per frame.
+        :param strip: the strip
+        :param float duration: duration in seconds, None to run until stopped
+        :return: None
+        """
+        bindings = self._bindings[strip]
+        clock = FrameClock(1 / self.fps, duration, strip.frame_stats)
+        while self._running and clock.running():
+            now = clock.elapsed_ms
+            for effect, target in bindings:
+                effect.next_frame(target, now)
+            strip.show()
+            clock.advance()
+            await asyncio.sleep(clock.last_sleep_us / 1_000_000)
@@ -0,0 +1,246 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`segment`
+================================================================================
+
+Zero copy views over part of a NeoPixel framebuffer.
+
+A :class:`Segment` has the drawing methods of the strip (``set_rgb``,
+``fill``, indexing) with its own indexes, and writes straight into the strip
+framebuffer: effects render into a segment as they would into the whole
+strip, so one strip can be split into zones animated on their own without
+extra buffers.
+
+A segment can run backwards, be mirrored around its middle and group several
+pixels into one. Plain segments only add their start to the index, the other
+ones look the pixels up in an index map built once.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+from array import array
+
+
+class Segment:
+    """
+    A run of pixels of a strip.
+    :param strip: the strip, or any buffer with the same drawing methods
+    :param int start: first pixel of the segment. Default is 0
+    :param int length: number of pixels of the strip covered. Default is None,
+     up to the end of the strip
+    :param bool reverse: index 0 is the last pixel. Default is False
+    :param bool mirror: the second half repeats the first one backwards, so
+     the segment has half the pixels. Default is False
+    :param int grouping: strip pixels lit by each segment pixel. Default is 1
+    :raises ValueError: if the segment does not fit in the strip
+    """
+
+    def __init__(
+        self,
+        strip,
+        start: int = 0,
+        length: int = None,
+        reverse: bool = False,
+        mirror: bool = False,
+        grouping: int = 1,
+    ) -> None:
+        if length is None:
+            length = strip.num_leds - start
+        if start < 0 or length <= 0 or start + length > strip.num_leds:
+            raise ValueError("The segment does not fit in the strip")
+        if grouping < 1:
+            raise ValueError("Grouping must be at least 1")
+        self.strip = strip
+        self.start = start
+        self.physical_length = length
+        self.reverse = reverse
+        self.mirror = mirror
+        self.grouping = grouping
+        self.bpp = strip.bpp
+
+        # Positions along the segment, a mirrored segment has one position
+        # for each pair of pixels
+        self._positions = (length + 1) // 2 if mirror else length
+        self.num_leds = (self._positions + grouping - 1) // grouping
+        self._map = None
+        self._span = 1
+        if reverse or mirror or grouping > 1:
+            self._build_map()
+
+    def _build_map(self) -> None:
+        """
+        Build the index map: ``span`` strip pixels for every segment pixel,
+        repeating the last one when a group is cut short.
+        :return: None
+        """
+        span = self.grouping * (2 if self.mirror else 1)
+        self._span = span
+        self._map = array("H", [0] * (self.num_leds * span))
+        for index in range(self.num_leds):
+            first, last = self._offsets(index, index + 1)
+            slot = index * span
+            for k in range(span):
+                if self.mirror:
+                    offset = min(first + k // 2, last - 1)
+                    if k % 2:
+                        offset = self.physical_length - 1 - offset
+                else:
+                    offset = min(first + k, last - 1)
+                self._map[slot + k] = self.start + offset
+
+    def _offsets(self, start: int, end: int) -> tuple:
+        """
+        Offsets from the segment start of the pixels covered by a range of
+        segment pixels. Mirrored segments cover these offsets and the ones
+        mirrored from the end.
+        :param int start: first segment pixel
+        :param int end: segment pixel after the last one
+        :return: the first offset and the one after the last
+        """
+        positions = self._positions
+        first = start * self.grouping
+        last = min(end * self.grouping, positions)
+        if self.reverse:
+            first, last = positions - last, positions - first
+        return first, last
+
+    @property
+    def length(self) -> int:
+        """
+        Number of pixels of the segment.
+        """
+        return self.num_leds
+
+    @property
+    def pixel_object(self):
+        """
+        The pixels of the segment, indexed from 0.
+        """
+        return self
+
+    def __len__(self) -> int:
+        return self.num_leds
+
+    def __getitem__(self, index: int) -> tuple:
+        return self.get_pixel(index)
+
+    def __setitem__(self, index: int, color) -> None:
+        self.set_pixel(index, color)
+
+    def set_pixel(self, index: int, color) -> None:
+        """
+        Set the color of a pixel of the segment.
+        :param int index: the pixel index in the segment
+        :param color: the color in (r, g, b) or (r, g, b, w) format, or a
+         packed 32-bit color
+        :return: None
+        """
+        if index < 0:
+            index += self.num_leds
+        if self._map is None:
+            self.strip.set_pixel(self.start + index, color)
+            return
+        slot = index * self._span
+        for k in range(slot, slot + self._span):
+            self.strip.set_pixel(self._map[k], color)
+
+    def set_rgb(self, index: int, r: int, g: int, b: int, w: int = 0) -> None:
+        """
+        Set the color of a pixel of the segment without building a tuple.
+        :param int index: the pixel index in the segment
+        :param int r: red value (0-255)
+        :param int g: green value (0-255)
+        :param int b: blue value (0-255)
+        :param int w: white value (0-255), only used by RGBW strips.
+         Default is 0
+        :return: None
+        """
+        if index < 0:
+            index += self.num_leds
+        if self._map is None:
+            self.strip.set_rgb(self.start + index, r, g, b, w)
+            return
+        set_rgb = self.strip.set_rgb
+        index_map = self._map
+        slot = index * self._span
+        for k in range(slot, slot + self._span):
+            set_rgb(index_map[k], r, g, b, w)
+
+    def get_pixel(self, index: int) -> tuple:
+        """
+        Get the color of a pixel of the segment.
+        :param int index: the pixel index in the segment
+        :return: the color in (r, g, b) format, or (r, g, b, w) for RGBW
+         strips
+        """
+        if index < 0:
+            index += self.num_leds
+        if self._map is None:
+            return self.strip.get_pixel(self.start + index)
+        return self.strip.get_pixel(self._map[index * self._span])
+
+    def ranges(self, start: int = 0, end: int = None) -> tuple:
+        """
+        The runs of strip pixels covered by a range of the segment: one run,
+        or two for mirrored segments.
+        :param int start: first pixel of the segment. Default is 0
+        :param int end: pixel after the last one. Default is num_leds
+        :return: the (first, end) pixel ranges of the strip
+        """
+        if end is None:
+            end = self.num_leds
+        if end <= start:
+            return ()
+        first, last = self._offsets(start, end)
+        base = self.start
+        if not self.mirror:
+            return ((base + first, base + last),)
+        length = self.physical_length
+        return (
+            (base + first, base + last),
+            (base + length - last, base + length - first),
+        )
+
+    def fill(self, color, start: int = 0, end: int = None) -> None:
+        """
+        Fill a range of the segment with one color. The pixels covered are
+        one run of the strip, or two for mirrored segments, so they are
+        filled in bulk.
+        :param color: the color in (r, g, b) or (r, g, b, w) format, or a
+         packed 32-bit color
+        :param int start: first pixel to fill. Default is 0
+        :param int end: pixel after the last one to fill. Default is num_leds
+        :return: None
+        """
+        for first, last in self.ranges(start, end):
+            self.strip.fill(color, first, last)
+
+    def mark_dirty(self, start: int = 0, end: int = None) -> None:
+        """
+        Flag a range of the segment as changed.
+        :param int start: first pixel changed. Default is 0
+        :param int end: pixel after the last one changed. Default is num_leds
+        :return: None
+        """
+        for first, last in self.ranges(start, end):
+            self.strip.mark_dirty(first, last)
+
+
+def split(strip, segment_length: int) -> list:
+    """
+    Cut a strip into segments of the same length, the last one may be
+    shorter.
+    :param strip: the strip
+    :param int segment_length: number of pixels of each segment
+    :return: the list of segments
+    """
+    return [
+        Segment(strip, start, min(segment_length, strip.num_leds - start))
+        for start in range(0, strip.num_leds, segment_length)
+    ]
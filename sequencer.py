@@ -0,0 +1,212 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`sequencer`
+================================================================================
+
+Play a list of effects one after the other, as a single frame producer.
+
+Each entry of the playlist is ``(effect, params, duration, transition)``:
+
+* ``effect``: a producer class of :mod:`producers`, built with ``params``,
+  or a producer already built, then ``params`` is not used
+* ``params``: the keyword arguments of the class, or None
+* ``duration``: time the effect is shown in seconds, before the next entry
+  starts
+* ``transition``: how the effect gives way to the next entry. None for a
+  cut, the name of a transition of :mod:`transition` for a one second
+  transition, or a ``(name, seconds)`` tuple. The transition runs on the
+  time of the next entry
+
+The last items can be left out: ``(RainbowSine,)`` shows the rainbow for 5
+seconds and cuts to the next entry.
+
+While an entry plays the next one is built and prepared, its tables and
+buffers allocated for the strip with :meth:`producers.Effect.prepare`, on
+the frame after the switch to the current one. The switch happens inside a
+frame: the frame due at the end of an entry is already the first frame of
+the next one, with no black or repeated frame between them. One
+:class:`transition.Transition`, prepared with the first frame, is reused by
+all the transitions.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+from prng import random16
+from producers import Effect
+from transition import MODES, Transition
+
+
+def _entry(item) -> tuple:
+    """
+    Fill in the items left out of a playlist entry.
+    :param item: the entry, a tuple of 1 to 4 items, or a producer
+    :raises ValueError: if the entry has more than 4 items or an unknown
+     transition
+    :return: the effect, params, duration in milliseconds and transition as
+     a (name, seconds) tuple or None
+    """
+    if not isinstance(item, tuple):
+        item = (item,)
+    if not 1 <= len(item) <= 4:
+        raise ValueError("Invalid playlist entry %r" % (item,))
+    effect, params, duration, transition = item + (None, 5, None)[
+        len(item) - 1 :
+    ]
+    if isinstance(transition, str):
+        transition = (transition, 1.0)
+    if transition is not None and transition[0] not in MODES:
+        raise ValueError("Invalid transition %s" % transition[0])
+    return effect, params, int(duration * 1000), transition
+
+
+def _shuffle(order: list) -> None:
+    """
+    Shuffle a list in place.
+    :param list order: the list
+    :return: None
+    """
+    for index in range(len(order) - 1, 0, -1):
+        other = (random16() * (index + 1)) >> 16
+        order[index], order[other] = order[other], order[index]
+
+
+class Sequencer(Effect):
+    """
+    A playlist of effects.
+    :param list playlist: the entries
+    :param bool loop: start again after the last entry. Default is True
+    :param bool shuffle: play the entries in a random order, a new one on
+     every loop. Default is False
+    :param float period: time between frames. Default is 0.02 seconds
+    :raises ValueError: if the playlist is empty or an entry is not valid
+    """
+
+    def __init__(
+        self,
+        playlist: list,
+        loop: bool = True,
+        shuffle: bool = False,
+        period: float = 0.02,
+    ) -> None:
+        super().__init__(period)
+        self.entries = [_entry(item) for item in playlist]
+        if not self.entries:
+            raise ValueError("The playlist is empty")
+        self.loop = loop
+        self.shuffle = shuffle
+        self.done = False
+        self.current = None
+        self._transition = None
+
+    @property
+    def duration(self) -> float:
+        """
+        Time of one pass through the playlist in seconds.
+        """
+        return sum(entry[2] for entry in self.entries) / 1000
+
+    def _build(self, index: int):
+        """
+        Build the producer of an entry.
+        :param int index: the entry index
+        :return: the producer
+        """
+        effect, params, _, _ = self.entries[index]
+        if isinstance(effect, Effect):
+            return effect
+        return effect(**(params or {}))
+
+    def _prepare(self, buffer) -> None:
+        """
+        Pick the entry after the current one, build its producer and prepare
+        it for the buffer ahead of time. Shuffle again when the playlist
+        starts over.
+        :param buffer: the buffer the sequencer draws into
+        :return: None
+        """
+        position = self._position + 1
+        if position == len(self._order):
+            if not self.loop:
+                self._next = None
+                return
+            position = 0
+            if self.shuffle:
+                _shuffle(self._order)
+        index = self._order[position]
+        incoming = self._build(index)
+        incoming.prepare(buffer)
+        self._next = (position, index, incoming)
+        self._pending = False
+
+    def allocate(self, buffer) -> None:
+        for entry in self.entries:
+            transition = entry[3]
+            if transition is not None:
+                # The scratch buffers are shared by all the transitions
+                if self._transition is None:
+                    name, seconds = transition
+                    self._transition = Transition(None, None, seconds, name)
+                self._transition.prepare(buffer)
+                return
+
+    def start(self, buffer) -> None:
+        self._order = list(range(len(self.entries)))
+        if self.shuffle:
+            _shuffle(self._order)
+        self._position = 0
+        index = self._order[0]
+        self.current = self._build(index)
+        self.current.reset()
+        self._active = self.current
+        self._switch_at = self.entries[index][2]
+        self.done = False
+        # The next entry is prepared on the frame after this one
+        self._pending = True
+
+    def _advance(self, buffer) -> None:
+        """
+        Switch to the prepared entry, with the transition of the entry
+        shown so far.
+        :param buffer: the buffer the sequencer draws into
+        :return: None
+        """
+        if self._pending:
+            # The entry was shorter than a frame
+            self._prepare(buffer)
+        if self._next is None:
+            # The last entry goes on until the playlist is stopped
+            self.done = True
+            return
+        transition = self.entries[self._order[self._position]][3]
+        self._position, index, incoming = self._next
+        duration = self.entries[index][2]
+        outgoing = self.current
+        incoming.reset()
+        self.current = incoming
+        self._switch_at += duration
+        if transition is None:
+            self._active = incoming
+        else:
+            name, seconds = transition
+            self._transition.begin(outgoing, incoming, seconds, name)
+            self._active = self._transition
+        self._pending = True
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        if t >= self._switch_at:
+            while not self.done and t >= self._switch_at:
+                self._advance(buffer)
+        elif self._pending:
+            # Not on a switch frame, the next entry can be prepared
+            self._prepare(buffer)
+        active = self._active
+        if active is self._transition and active.done:
+            # The strip holds the frame of the new effect, it goes on alone
+            active = self._active = self.current
+        active.next_frame(buffer, self._origin + t)
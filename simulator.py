@@ -0,0 +1,413 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`simulator`
+================================================================================
+
+Host stand-ins for the ``machine``, ``rp2`` and ``micropython`` modules, so
+the library can be imported and measured with CPython on a regular computer.
+
+The :class:`StateMachine` does not drive any pin, it records every word pushed
+to its TX FIFO. :class:`DMA` copies the frame into the state machine that owns
+the TX FIFO address it writes to.
+
+:class:`SimulatorBackend` is an output backend for :class:`neopixel.NEOPIXEL`
+that decodes the pushed words back into frames and models the WS2812 wire
+time, to measure the frame rate an effect can reach without hardware.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+import time
+
+# Wire time of one bit at 800 kHz and the low time that latches a frame
+BIT_NS = 1_250
+RESET_US = 300
+
+_state_machines = {}
+_PIO_BASE = (0x50200000, 0x50300000)
+_TXF_OFFSET = 0x010
+
+
+class Pin:
+    """
+    Stand-in for ``machine.Pin``.
+    :param id: the pin number, or another Pin
+    """
+
+    OUT = 1
+    IN = 0
+
+    def __init__(self, id, mode: int = -1, *args, **kwargs) -> None:
+        if isinstance(id, Pin):
+            id = id.id
+        self.id = id
+        self.mode = mode
+
+
+class PIO:
+    """
+    Constants of ``rp2.PIO`` used by the PIO programs.
+    """
+
+    IN_LOW = 0
+    IN_HIGH = 1
+    OUT_LOW = 2
+    OUT_HIGH = 3
+    SHIFT_LEFT = 0
+    SHIFT_RIGHT = 1
+
+
+def asm_pio(**settings):
+    """
+    Stand-in for the ``rp2.asm_pio`` decorator. The program is not assembled,
+    the settings are kept so the state machine knows how the words are pulled.
+    :param settings: the PIO program settings
+    :return: the decorator
+    """
+
+    def decorator(program):
+        program.settings = settings
+        return program
+
+    return decorator
+
+
+class StateMachine:
+    """
+    Stand-in for ``rp2.StateMachine`` that records the pushed words.
+    :param int id: the state machine number (0-7)
+    :param program: the PIO program
+    :param int freq: the state machine frequency
+    """
+
+    def __init__(
+        self, id: int, program=None, freq: int = 125_000_000, **kwargs
+    ) -> None:
+        self.id = id
+        self.program = program
+        self.freq = freq
+        self.settings = kwargs
+        self.running = False
+        self.words = []
+        self.puts = 0
+        # A program with side-set pins sends the bits of each word one after
+        # the other, a program with out pins sends one bit per lane at once
+        settings = getattr(program, "settings", {})
+        if "sideset_init" in settings:
+            self.word_ns = settings.get("pull_thresh", 32) * BIT_NS
+        else:
+            self.word_ns = BIT_NS
+        _state_machines[id] = self
+
+    def active(self, value: int = None) -> bool:
+        """
+        Start or stop the state machine.
+        :param int value: 1 to start, 0 to stop. Default is None, only query
+        :return: True when running
+        """
+        if value is not None:
+            self.running = bool(value)
+        return self.running
+
+    def put(self, value, shift: int = 0) -> None:
+        """
+        Record the words pushed to the TX FIFO.
+        :param value: an integer or a buffer of integers
+        :param int shift: number of bits each value is shifted left
+        :return: None
+        """
+        self.puts += 1
+        if isinstance(value, int):
+            self.words.append((value << shift) & 0xFFFFFFFF)
+        else:
+            self.words.extend((word << shift) & 0xFFFFFFFF for word in value)
+
+    def clear(self) -> None:
+        """
+        Forget the recorded words and put calls.
+        :return: None
+        """
+        self.words = []
+        self.puts = 0
+
+
+def native(function):
+    """Stand-in for the ``micropython.native`` decorator."""
+    return function
+
+
+def ticks_ms() -> int:
+    """Stand-in for ``time.ticks_ms``."""
+    return time.monotonic_ns() // 1_000_000
+
+
+def ticks_us() -> int:
+    """Stand-in for ``time.ticks_us``."""
+    return time.monotonic_ns() // 1_000
+
+
+def ticks_diff(end: int, start: int) -> int:
+    """Stand-in for ``time.ticks_diff``."""
+    return end - start
+
+
+def ticks_add(ticks: int, delta: int) -> int:
+    """Stand-in for ``time.ticks_add``."""
+    return ticks + delta
+
+
+def sleep_us(us: int) -> None:
+    """Stand-in for ``time.sleep_us``."""
+    time.sleep(us / 1_000_000)
+
+
+class DMA:
+    """
+    Stand-in for ``rp2.DMA``. A transfer to a TX FIFO is recorded by the state
+    machine at once, :meth:`active` stays True for the wire time of the frame.
+    """
+
+    def __init__(self) -> None:
+        self._busy_until = 0
+        self.transfers = 0
+
+    def pack_ctrl(self, **settings) -> dict:
+        """
+        Keep the control settings.
+        :param settings: the DMA control settings
+        :return: the settings
+        """
+        return settings
+
+    def config(
+        self,
+        read=None,
+        write=None,
+        count: int = None,
+        ctrl: dict = None,
+        trigger: bool = False,
+    ) -> None:
+        """
+        Copy ``count`` items from ``read`` to the state machine at ``write``.
+        :param read: the source buffer
+        :param int write: the TX FIFO address
+        :param int count: the number of transfers
+        :param dict ctrl: the control settings from :meth:`pack_ctrl`
+        :param bool trigger: start the transfer. Default is False
+        :return: None
+        """
+        if not trigger:
+            return
+        block = _PIO_BASE.index(write & ~0xFFFFF)
+        index = ((write & 0xFFFFF) - _TXF_OFFSET) // 4
+        sm = _state_machines[block * 4 + index]
+        size = (ctrl or {}).get("size", 2)
+        data = memoryview(read)[:count]
+        if size == 0:
+            # Byte writes are replicated on every lane of the bus
+            sm.put([byte * 0x01010101 for byte in data])
+        else:
+            sm.put(data)
+        self.transfers += 1
+        self._busy_until = ticks_add(ticks_us(), count * sm.word_ns // 1000)
+
+    def active(self) -> bool:
+        """
+        Tell if the transfer is still going.
+        :return: True during the wire time of the last transfer
+        """
+        return ticks_diff(self._busy_until, ticks_us()) > 0
+
+    def close(self) -> None:
+        """
+        Release the channel.
+        :return: None
+        """
+        self._busy_until = 0
+
+
+def decode(words: list, bits: int) -> bytearray:
+    """
+    Turn the words pushed to a state machine back into the bytes sent on the
+    wire. Every word gives its ``bits`` most significant bits.
+    :param list words: the pushed words
+    :param int bits: the state machine pull threshold
+    :return: the bytes sent
+    """
+    if bits == 8:
+        return bytearray(word >> 24 for word in words)
+    stream = bytearray()
+    value = 0
+    count = 0
+    for word in words:
+        value = (value << bits) | (word >> (32 - bits))
+        count += bits
+        while count >= 8:
+            count -= 8
+            stream.append((value >> count) & 0xFF)
+        value &= (1 << count) - 1
+    return stream
+
+
+class SimulatorBackend:
+    """
+    Output backend that replaces the state machine with a simulator. Each
+    frame is decoded back from the pushed words, and timed as it would be on
+    a WS2812 strip: 1.25 us per bit plus the reset latch.
+
+    The time the program takes between two frames is measured, so
+    :attr:`fps` is the frame rate reached with the wire time added, while
+    :attr:`max_fps` is the limit set by the wire alone.
+    :param bool asynchronous: model an output that returns at once, like the
+     DMA backend. Default is False, the CPU waits while the frame is sent
+    :param str order: the color order of the strip. Default is "GRB"
+    """
+
+    def __init__(self, asynchronous: bool = False, order: str = "GRB"):
+        self.asynchronous = asynchronous
+        self.order = order
+        self.sm = None
+        self.frame = bytearray()
+        self.frames = 0
+        self.frame_us = 0
+        self._clock = 0
+        self._wire_free = 0
+        self._returned_at = None
+        self._opened_at = None
+
+    def begin(self, program, freq: int, **pins) -> None:
+        """
+        Create the simulated state machine.
+        :param program: the PIO program
+        :param int freq: the state machine frequency
+        :param pins: the pin settings of the state machine
+        :return: None
+        """
+        self.sm = StateMachine(-1, program, freq=freq, **pins)
+        self.sm.active(1)
+
+    def transmit(self, wire) -> None:
+        """
+        Push a packed frame, decode it and advance the simulated clock.
+        :param bytearray wire: the packed frame
+        :return: None
+        """
+        self._open()
+        self.sm.put(wire, 24)
+        self.latch()
+
+    def put(self, word: int) -> None:
+        """
+        Push one word of a frame sent word by word, the frame is decoded by
+        :meth:`latch`.
+        :param int word: the word
+        :return: None
+        """
+        if self._opened_at is None:
+            self._open()
+        self.sm.put(word, 24)
+
+    def latch(self) -> None:
+        """
+        End the frame pushed so far, decode it and advance the simulated
+        clock. The time spent pushing it is program time.
+        :return: None
+        """
+        if self._opened_at is None:
+            return
+        self._clock += ticks_diff(ticks_us(), self._opened_at)
+        self._opened_at = None
+        bits = self.sm.program.settings.get("pull_thresh", 32)
+        self.frame = decode(self.sm.words, bits)
+        self.frames += 1
+        self.frame_us = len(self.frame) * 8 * BIT_NS // 1000
+
+        start = max(self._clock, self._wire_free)
+        self._wire_free = start + self.frame_us + RESET_US
+        if self.asynchronous:
+            self._clock = start
+        else:
+            self._clock = start + self.frame_us
+        self._returned_at = ticks_us()
+
+    def _open(self) -> None:
+        """
+        Start a frame: the time since the last one returned is program time.
+        :return: None
+        """
+        now = ticks_us()
+        if self._returned_at is not None:
+            self._clock += ticks_diff(now, self._returned_at)
+        self._opened_at = now
+        self.sm.clear()
+
+    def busy(self) -> bool:
+        """
+        The frame is decoded at once.
+        :return: False
+        """
+        return False
+
+    def wait(self) -> None:
+        """
+        The frame is decoded at once.
+        :return: None
+        """
+        return
+
+    def close(self) -> None:
+        """
+        Stop the simulated state machine.
+        :return: None
+        """
+        if self.sm is not None:
+            self.sm.active(0)
+
+    def pixels(self) -> list:
+        """
+        The last frame sent, as a list of colors in (r, g, b) order.
+        :return: the colors
+        """
+        bpp = len(self.order)
+        order = self.order
+        channels = [order.index(name) for name in "RGBW" if name in order]
+        return [
+            tuple(self.frame[i + channel] for channel in channels)
+            for i in range(0, len(self.frame) - bpp + 1, bpp)
+        ]
+
+    @property
+    def max_fps(self) -> float:
+        """
+        Frame rate allowed by the wire time of the last frame.
+        """
+        if not self.frames:
+            return 0.0
+        return 1_000_000 / (self.frame_us + RESET_US)
+
+    @property
+    def fps(self) -> float:
+        """
+        Frame rate reached, with the program time and the wire time.
+        """
+        if not self._wire_free:
+            return 0.0
+        return self.frames * 1_000_000 / self._wire_free
+
+    def report(self) -> dict:
+        """
+        Summary of the simulation.
+        :return: frames sent, wire time of the last frame, fps and max fps
+        """
+        return {
+            "frames": self.frames,
+            "frame_us": self.frame_us,
+            "fps": self.fps,
+            "max_fps": self.max_fps,
+        }
@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`transition`
+================================================================================
+
+Transitions between two frame producers, instead of a hard cut.
+
+Both effects keep drawing into the strip, but each one finds its own last
+frame there: before an effect renders, its frame is copied back from a
+scratch buffer, and after it renders the result is kept in that buffer. The
+two frames are then blended into the strip. When the transition ends the
+strip holds the frame of the incoming effect, which simply goes on drawing
+into it.
+
+The two scratch buffers are allocated by :meth:`Transition.prepare`, on the
+first frame unless it was called ahead, and reused on every frame and by the
+next transition when the object is reused with :meth:`Transition.begin`.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+from functions import buffer_spans, lerp8by8
+from prng import random8
+from producers import Effect
+
+MODES = ("crossfade", "wipe", "dissolve")
+
+
+class Transition(Effect):
+    """
+    Move from one effect to another.
+    :param outgoing: the frame producer shown so far
+    :param incoming: the frame producer to show next
+    :param float duration: time of the transition in seconds. Default is 1
+    :param str mode: "crossfade" blends the two frames, "wipe" shows the
+     incoming frame from the first pixel to the last one, "dissolve" shows
+     it pixel by pixel in a random order. Default is "crossfade"
+    :param float period: time between frames. Default is 0.02 seconds
+    :raises ValueError: if the mode is not one of :data:`MODES`
+    """
+
+    def __init__(
+        self,
+        outgoing,
+        incoming,
+        duration: float = 1.0,
+        mode: str = "crossfade",
+        period: float = 0.02,
+    ) -> None:
+        if mode not in MODES:
+            raise ValueError("Invalid transition %s" % mode)
+        super().__init__(period)
+        self.duration_ms = max(1, int(duration * 1000))
+        self.mode = mode
+        self.outgoing = outgoing
+        self.incoming = incoming
+        self.done = False
+        self._size = -1
+        self._pairs = []
+
+    def begin(
+        self, outgoing, incoming, duration: float = None, mode: str = None
+    ) -> None:
+        """
+        Start another transition, reusing the scratch buffers.
+        :param outgoing: the frame producer shown so far
+        :param incoming: the frame producer to show next
+        :param float duration: time of the transition in seconds. Default is
+         None, the same as the last one
+        :param str mode: the transition, one of :data:`MODES`. Default is
+         None, the same as the last one
+        :raises ValueError: if the mode is not one of :data:`MODES`
+        :return: None
+        """
+        if mode is not None:
+            if mode not in MODES:
+                raise ValueError("Invalid transition %s" % mode)
+            self.mode = mode
+        if duration is not None:
+            self.duration_ms = max(1, int(duration * 1000))
+        self.outgoing = outgoing
+        self.incoming = incoming
+        self.done = False
+        self.reset()
+
+    def allocate(self, buffer) -> None:
+        strip, spans = buffer_spans(buffer)
+        bpp = strip.bpp
+        pixels = sum(last - first for first, last in spans)
+        if pixels * bpp != self._size:
+            self._size = pixels * bpp
+            self.outgoing_frame = bytearray(self._size)
+            self.incoming_frame = bytearray(self._size)
+            # The random order of the dissolve, one threshold per pixel
+            self.order = bytearray(pixels)
+        self.strip = strip
+        self._spans = spans
+        self._pairs = []
+        # The runs of both framebuffers of a double buffered strip
+        self._pair(strip.buffer)
+        if getattr(strip, "front", None) is not None:
+            self._pair(strip.front)
+
+    def start(self, buffer) -> None:
+        for index in range(len(self.order)):
+            self.order[index] = random8()
+        self.done = False
+
+        # Both effects start from what the strip shows now
+        for target, old, new, first, last in self._pair(self.strip.buffer):
+            old[:] = target
+            new[:] = target
+
+    def _pair(self, framebuffer: bytearray) -> list:
+        """
+        Pair every run of the strip with the same bytes of the scratch
+        buffers, once for each framebuffer of the strip, so copies do not
+        slice on every frame.
+        :param bytearray framebuffer: the framebuffer of the strip
+        :return: (strip run, outgoing run, incoming run, first, end) tuples
+        """
+        for known, views in self._pairs:
+            if known is framebuffer:
+                return views
+        bpp = self.strip.bpp
+        target = memoryview(framebuffer)
+        outgoing = memoryview(self.outgoing_frame)
+        incoming = memoryview(self.incoming_frame)
+        views = []
+        offset = 0
+        for first, last in self._spans:
+            size = (last - first) * bpp
+            views.append(
+                (
+                    target[first * bpp : last * bpp],
+                    outgoing[offset : offset + size],
+                    incoming[offset : offset + size],
+                    first,
+                    last,
+                )
+            )
+            offset += size
+        # A double buffered strip swaps between two framebuffers
+        self._pairs.append((framebuffer, views))
+        return views
+
+    def _render_into(self, effect, frame: int, buffer, t: int) -> None:
+        """
+        Let an effect draw its next frame over its previous one.
+        :param effect: the frame producer
+        :param int frame: 1 for the outgoing scratch buffer, 2 for the
+         incoming one
+        :param buffer: the buffer the transition draws into
+        :param int t: the time in milliseconds
+        :return: None
+        """
+        strip = self.strip
+        for views in self._pair(strip.buffer):
+            views[0][:] = views[frame]
+            strip.mark_dirty(views[3], views[4])
+        effect.next_frame(buffer, t)
+        for views in self._pair(strip.buffer):
+            views[frame][:] = views[0]
+
+    def render(self, buffer, steps: int, t: int) -> None:
+        now = self._origin + t
+        self._render_into(self.outgoing, 1, buffer, now)
+        self._render_into(self.incoming, 2, buffer, now)
+
+        frac = (t << 8) // self.duration_ms
+        strip = self.strip
+        bpp = strip.bpp
+        if frac > 255:
+            # The strip keeps the incoming frame
+            self.done = True
+            frac = 256
+        position = 0
+        for target, old, new, first, last in self._pair(strip.buffer):
+            size = len(target)
+            if frac == 256:
+                target[:] = new
+            elif self.mode == "crossfade":
+                for index in range(size):
+                    target[index] = lerp8by8(old[index], new[index], frac)
+            elif self.mode == "wipe":
+                cut = ((self._size // bpp * frac) >> 8) * bpp - position
+                cut = min(max(cut, 0), size)
+                target[:cut] = new[:cut]
+                target[cut:] = old[cut:]
+            else:
+                order = self.order
+                pixel = position // bpp
+                for offset in range(0, size, bpp):
+                    source = new if order[pixel] < frac else old
+                    for index in range(offset, offset + bpp):
+                        target[index] = source[index]
+                    pixel += 1
+            strip.mark_dirty(first, last)
+            position += size
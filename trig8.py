@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Jose D. Montoya
+#
+# SPDX-License-Identifier: MIT
+
+"""
+
+`trig8`
+================================================================================
+
+Fixed point trigonometry for the wave effects.
+
+Angles are 16-bit phases: 65536 is a full turn, so a phase accumulator wraps
+by itself with ``& 0xFFFF``. The waves are read from a 256 entry table with
+the top 8 bits of the phase, and come out as 0-255 levels, 128 being the
+middle of the wave. This takes the place of ``(math.sin(x) + 1) / 2 * 255``
+for every pixel of every frame.
+
+The effects keep their parameters in radians, :func:`phase16` turns them into
+phase increments once.
+
+* Author: Jose D. Montoya
+
+
+"""
+
+import math
+
+# Phase units in one radian
+RADIAN = 10430
+
+# The sine wave scaled to 0-255, one entry per 1/256 of a turn
+SIN8 = bytes(
+    int((math.sin(2 * math.pi * angle / 256) + 1) * 127.5 + 0.5)
+    for angle in range(256)
+)
+
+
+def phase16(radians: float) -> int:
+    """
+    Turn an angle in radians into a 16-bit phase.
+    :param float radians: the angle
+    :return: the phase (0-65535)
+    """
+    return int(radians * 65536 / (2 * math.pi)) & 0xFFFF
+
+
+def sin8(theta: int) -> int:
+    """
+    Sine of an 8-bit angle, 256 being a full turn.
+    :param int theta: the angle, only the 8 lower bits are used
+    :return: the sine scaled to 0-255
+    """
+    return SIN8[theta & 0xFF]
+
+
+def cos8(theta: int) -> int:
+    """
+    Cosine of an 8-bit angle, 256 being a full turn.
+    :param int theta: the angle, only the 8 lower bits are used
+    :return: the cosine scaled to 0-255
+    """
+    return SIN8[(theta + 64) & 0xFF]
+
+
+def sin16(phase: int) -> int:
+    """
+    Sine of a 16-bit phase.
+    :param int phase: the phase, only the 16 lower bits are used
+    :return: the sine scaled to 0-255
+    """
+    return SIN8[(phase >> 8) & 0xFF]
+
+
+def cos16(phase: int) -> int:
+    """
+    Cosine of a 16-bit phase.
+    :param int phase: the phase, only the 16 lower bits are used
+    :return: the cosine scaled to 0-255
+    """
+    return SIN8[((phase >> 8) + 64) & 0xFF]
+
+
+def wave_table(size: int, phase: int, increment: int) -> bytearray:
+    """
+    Sample a sine wave once, for effects whose wave shape does not change
+    between frames.
+    :param int size: number of samples
+    :param int phase: phase of the first sample
+    :param int increment: phase between two samples
+    :return: the samples scaled to 0-255
+    """
+    table = bytearray(size)
+    for index in range(size):
+        table[index] = SIN8[((phase + index * increment) >> 8) & 0xFF]
+    return table